@@ -0,0 +1,30 @@
+"""add users (created_at, id) index
+
+Revision ID: 7b1f3c9d2a41
+Revises: e44aeb873c6b
+Create Date: 2026-10-18 03:20:00.000000+00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '7b1f3c9d2a41'
+down_revision: Union[str, None] = 'e44aeb873c6b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 운영 중인 테이블을 잠그지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행)
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tb_users_created_at_id', 'tb_users', ['created_at', 'id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tb_users_created_at_id', table_name='tb_users', postgresql_concurrently=True, if_exists=True)
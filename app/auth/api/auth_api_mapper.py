@@ -1,7 +1,7 @@
-from app.auth.api.requests import RegisterRequest
-from app.auth.api.responses import RegisterResponse
-from app.auth.core.application.inputs import RegisterInput
-from app.auth.core.application.outputs import RegisterOutput
+from app.auth.api.requests import LoginRequest, RegisterRequest
+from app.auth.api.responses import LoginResponse, RegisterResponse
+from app.auth.core.application.inputs import LoginInput, RegisterInput
+from app.auth.core.application.outputs import LoginOutput, RegisterOutput
 from app.users.api.user_api_mapper import UserApiMapper
 
 
@@ -17,7 +17,19 @@ class AuthAPIMapper:
 
     @staticmethod
     def register_output_to_response(register_output: RegisterOutput) -> RegisterResponse:
-        return RegisterResponse(
+        # 내부에서 검증된 값이므로 pydantic 검증 생략
+        return RegisterResponse.model_construct(
             access_token=register_output.access_token,
             user=UserApiMapper.create_output_to_response(register_output.user_create_output)
         )
+
+    @staticmethod
+    def login_request_to_input(login_request: LoginRequest) -> LoginInput:
+        return LoginInput(email=login_request.email, password=login_request.password)
+
+    @staticmethod
+    def login_output_to_response(login_output: LoginOutput) -> LoginResponse:
+        return LoginResponse.model_construct(
+            access_token=login_output.access_token,
+            user=UserApiMapper.output_to_response(login_output.user_output)
+        )
@@ -6,3 +6,8 @@ from app.users.api.responses import UserResponse
 class RegisterResponse(BaseModel):
     access_token: str = Field(..., description="JWT 액세스 토큰")
     user: UserResponse = Field(..., description="생성된 사용자 정보")
+
+
+class LoginResponse(BaseModel):
+    access_token: str = Field(..., description="JWT 액세스 토큰")
+    user: UserResponse = Field(..., description="로그인한 사용자 정보")
@@ -2,11 +2,13 @@ from fastapi import APIRouter, Response, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.api.auth_api_mapper import AuthAPIMapper
-from app.auth.api.requests import RegisterRequest
-from app.auth.api.responses import RegisterResponse
+from app.auth.api.requests import LoginRequest, RegisterRequest
+from app.auth.api.responses import LoginResponse, RegisterResponse
 from app.auth.core.application.auth_service import AuthService
-from app.auth.dependencies import get_auth_service
+from app.auth.core.domain.services.token_service import TokenService
+from app.auth.dependencies import get_auth_service, get_token_service
 from app.shared.api.cookie_manager import CookieManager
+from app.shared.api.exceptions import APIException
 from app.shared.api.responses import APIResponse, success_response, APIResponseCode
 from app.shared.infrastructure.transaction import get_transaction_db
 
@@ -35,3 +37,38 @@ async def register(
         APIResponseCode.CREATED,
         AuthAPIMapper.register_output_to_response(register_output)
     )
+
+
+@auth_router.post("/login", response_model=APIResponse[LoginResponse])
+async def login(
+        request: LoginRequest,
+        response: Response,
+        auth_service: AuthService = Depends(get_auth_service),
+        db: AsyncSession = Depends(get_transaction_db)
+):
+    login_output = await auth_service.login(db=db, login_data=AuthAPIMapper.login_request_to_input(request))
+    # 사용자 없음/비밀번호 불일치를 구분하지 않는다 (가입 여부 노출 방지)
+    if login_output is None:
+        raise APIException(APIResponseCode.AUTH_LOGIN_FAILED)
+
+    CookieManager.set_auth_cookies(
+        response,
+        login_output.access_token,
+        login_output.refresh_token,
+        "access_token",
+        "refresh_token"
+    )
+
+    return success_response(APIResponseCode.OK, AuthAPIMapper.login_output_to_response(login_output))
+
+
+@auth_router.get("/.well-known/jwks.json")
+async def jwks(
+        response: Response,
+        token_service: TokenService = Depends(get_token_service)
+):
+    """
+    다른 서비스가 토큰을 로컬에서 검증할 수 있도록 공개키(JWKS)를 표준 형식 그대로 반환
+    """
+    response.headers["Cache-Control"] = "public, max-age=300"
+    return token_service.get_jwks()
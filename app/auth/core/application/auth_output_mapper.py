@@ -1,14 +1,14 @@
-from app.auth.core.application.outputs import RegisterOutput
+from app.auth.core.application.outputs import LoginOutput, RegisterOutput
 from app.auth.core.domain.token import Token
-from app.users.core.application.outputs import UserCreateOutput
+from app.users.core.application.outputs import UserCreateOutput, UserOutput
 
 
 class AuthOutputMapper:
 
     @staticmethod
-    def domain_to_register_output(token: Token, user_create_output: UserCreateOutput):
-        return RegisterOutput(
-            access_token=token.access_token,
-            refresh_token=token.refresh_token,
-            user_create_output=user_create_output
-        )
+    def domain_to_register_output(token: Token, user_create_output: UserCreateOutput) -> RegisterOutput:
+        return RegisterOutput(token.access_token, token.refresh_token, user_create_output)
+
+    @staticmethod
+    def domain_to_login_output(token: Token, user_output: UserOutput) -> LoginOutput:
+        return LoginOutput(token.access_token, token.refresh_token, user_output)
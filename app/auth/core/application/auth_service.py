@@ -1,8 +1,10 @@
+from typing import Optional
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.core.application.auth_output_mapper import AuthOutputMapper
-from app.auth.core.application.inputs import RegisterInput
-from app.auth.core.application.outputs import RegisterOutput
+from app.auth.core.application.inputs import LoginInput, RegisterInput
+from app.auth.core.application.outputs import LoginOutput, RegisterOutput
 from app.auth.core.domain.services.token_service import TokenService
 from app.users.core.application.inputs import UserCreateInput
 from app.users.core.application.user_service import UserService
@@ -15,13 +17,22 @@ class AuthService:
         self.user_service = user_service
 
     async def register(self, db: AsyncSession, register_data: RegisterInput) -> RegisterOutput:
-        user_create_data = UserCreateInput(
-            email=register_data.email,
-            password=register_data.password,
-            name=register_data.name
-        )
+        user_create_data = UserCreateInput(register_data.email, register_data.password, register_data.name)
         created_user = await self.user_service.create(db, user_create_data)
         token_set = await self.token_service.create_token_set(created_user.id, created_user.email)
         await self.token_service.store_refresh_token(created_user.id, token_set.refresh_token)
 
         return AuthOutputMapper.domain_to_register_output(token_set, created_user)
+
+    async def login(self, db: AsyncSession, login_data: LoginInput) -> Optional[LoginOutput]:
+        """
+        이메일/비밀번호 확인 후 토큰 발급 (사용자가 없거나 비밀번호가 틀리면 None)
+        """
+        user_output = await self.user_service.authenticate(db, login_data.email, login_data.password)
+        if user_output is None:
+            return None
+
+        token_set = await self.token_service.create_token_set(user_output.id, user_output.email)
+        await self.token_service.store_refresh_token(user_output.id, token_set.refresh_token)
+
+        return AuthOutputMapper.domain_to_login_output(token_set, user_output)
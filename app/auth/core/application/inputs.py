@@ -1,7 +1,16 @@
-from pydantic import BaseModel, Field, EmailStr
+from dataclasses import dataclass
+from typing import Optional
 
 
-class RegisterInput(BaseModel):
-    email: EmailStr = Field(..., description="사용자 이메일")
-    password: str = Field(..., description="비밀번호")
-    name: str | None = Field(None, description="사용자 이름")
+# 형식 검증은 API 계층의 요청 모델에서 끝나므로, 내부 입력은 검증 없는 slots 데이터클래스로 전달
+@dataclass(slots=True, frozen=True)
+class RegisterInput:
+    email: str
+    password: str
+    name: Optional[str] = None
+
+
+@dataclass(slots=True, frozen=True)
+class LoginInput:
+    email: str
+    password: str
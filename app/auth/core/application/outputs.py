@@ -1,9 +1,17 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
-from app.users.core.application.outputs import UserCreateOutput
+from app.users.core.application.outputs import UserCreateOutput, UserOutput
 
 
-class RegisterOutput(BaseModel):
-    access_token: str = Field(..., description="Access Token")
-    refresh_token: str = Field(..., description="Refresh Token")
-    user_create_output: UserCreateOutput = Field(..., description="회원가입 한 유저 정보")
+@dataclass(slots=True, frozen=True)
+class RegisterOutput:
+    access_token: str
+    refresh_token: str
+    user_create_output: UserCreateOutput  # 회원가입 한 유저 정보
+
+
+@dataclass(slots=True, frozen=True)
+class LoginOutput:
+    access_token: str
+    refresh_token: str
+    user_output: UserOutput  # 로그인 한 유저 정보
@@ -1,3 +1,5 @@
+from typing import Any, Dict, Sequence
+
 from app.auth.core.domain.token import Token
 from app.auth.core.interface.token_repository_port import TokenRepositoryPort
 from app.config.settings import REFRESH_TOKEN_EXPIRE_DAYS
@@ -28,3 +30,12 @@ class TokenService:
             refresh_token=refresh_token,
             ttl_seconds=ttl_seconds
         )
+
+    async def revoke_user_sessions(self, user_ids: Sequence[int]) -> int:
+        """
+        강제 로그아웃 - Refresh Token을 일괄 삭제해 재발급을 막는다 (Access Token은 짧은 만료로 자연 소멸)
+        """
+        return await self.token_repository.revoke_refresh_tokens_for_users(list(user_ids))
+
+    def get_jwks(self) -> Dict[str, Any]:
+        return self.jwt_manager.jwks()
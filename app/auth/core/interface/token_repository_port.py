@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Sequence
 
 
 class TokenRepositoryPort(ABC):
@@ -12,6 +12,20 @@ class TokenRepositoryPort(ABC):
     async def is_blacklisted(self, token: str) -> bool:
         pass
 
+    @abstractmethod
+    async def blacklist_many(self, tokens: Sequence[str], user_id: int = None) -> int:
+        """
+        여러 토큰을 한 번에 블랙리스트에 추가하고 추가된 개수를 돌려준다.
+        """
+        pass
+
+    @abstractmethod
+    async def is_blacklisted_many(self, tokens: Sequence[str]) -> List[bool]:
+        """
+        입력 순서대로 블랙리스트 여부를 돌려준다.
+        """
+        pass
+
     @abstractmethod
     async def cleanup_expired_tokens(self) -> int:
         pass
@@ -21,13 +35,23 @@ class TokenRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_user_refresh_token(self, user_id: int) -> Optional[str]:
+    async def is_user_refresh_token(self, user_id: int, refresh_token: str) -> bool:
+        """
+        Refresh Token은 digest로만 저장되므로 원문을 돌려주지 않고 일치 여부만 확인한다.
+        """
         pass
 
     @abstractmethod
     async def revoke_user_refresh_token(self, user_id: int) -> bool:
         pass
 
+    @abstractmethod
+    async def revoke_refresh_tokens_for_users(self, user_ids: Sequence[int]) -> int:
+        """
+        여러 사용자의 Refresh Token을 한 번에 삭제하고 삭제된 개수를 돌려준다.
+        """
+        pass
+
     @abstractmethod
     async def cleanup_expired_refresh_tokens(self) -> int:
         pass
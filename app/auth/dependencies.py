@@ -1,30 +1,25 @@
-from fastapi import Depends
+from typing import Any, Dict
+
+from fastapi import Depends, Request
 
 from app.auth.core.application.auth_service import AuthService
 from app.auth.core.domain.services.token_service import TokenService
 from app.auth.core.interface.token_repository_port import TokenRepositoryPort
-from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
-from app.auth.infrastructure.repository.redis_token_repository import RedisTokenRepository
-from app.config.settings import TOKEN_STORAGE
-from app.shared.infrastructure.transaction import logger
+from app.shared.api.cookie_manager import CookieManager
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+from app.shared.core.container import container
 from app.users.core.application.user_service import UserService
 from app.users.dependencies import get_user_service
 
 
 def get_token_repository() -> TokenRepositoryPort:
-    storage_type = TOKEN_STORAGE
-    if storage_type == "memory":
-        return MemoryTokenRepository()
-    if storage_type == "redis":
-        return RedisTokenRepository()
-    logger.warning(f"지원하지 않는 토큰 저장소 타입")
-    return MemoryTokenRepository()
+    return container.resolve(TokenRepositoryPort)
 
 
-def get_token_service(
-        token_repository: TokenRepositoryPort = Depends(get_token_repository),
-) -> TokenService:
-    return TokenService(token_repository)
+def get_token_service() -> TokenService:
+    # JWTManager(비밀키 디코딩, 키링 로드)를 포함하므로 프로세스당 한 번만 생성
+    return container.resolve(TokenService)
 
 
 def get_auth_service(
@@ -32,3 +27,34 @@ def get_auth_service(
         user_service: UserService = Depends(get_user_service),
 ) -> AuthService:
     return AuthService(token_service, user_service)
+
+
+async def get_token_payload(
+        request: Request,
+        token_service: TokenService = Depends(get_token_service),
+) -> Dict[str, Any]:
+    """
+    요청당 한 번만 Access Token을 검증/디코딩하는 의존성
+
+    검증된 payload를 request.state에 보관하므로, 같은 요청 안에서는
+    user_id/email/roles를 각각 꺼내도 토큰을 다시 검증하지 않는다.
+    """
+    cached_payload = getattr(request.state, "token_payload", None)
+    if cached_payload is not None:
+        return cached_payload
+
+    token = request.cookies.get(CookieManager.ACCESS_TOKEN_KEY) or request.headers.get("Authorization")
+    if not token:
+        raise APIException(APIResponseCode.AUTH_UNAUTHORIZED)
+
+    jwt_manager = token_service.jwt_manager
+    payload = jwt_manager.verify_token(token)
+    # Refresh Token(만료 기간이 긴 토큰)을 Access Token 자리에 쓰는 것을 막는다
+    if payload.get("token_type") != "access":
+        raise APIException(APIResponseCode.AUTH_TOKEN_INVALID)
+    if await jwt_manager.is_token_blacklisted(token):
+        raise APIException(APIResponseCode.AUTH_TOKEN_INVALID)
+
+    request.state.token_payload = payload
+    return payload
+
@@ -0,0 +1,150 @@
+"""
+Redis 블랙리스트 앞단의 로컬 Bloom Filter
+
+- 시작 시 Redis의 블랙리스트 키를 SCAN해서 필터를 구성
+- 블랙리스트 등록은 Pub/Sub 채널로 전파되어 모든 프로세스의 필터에 반영
+- 필터에 없으면 "확실히 블랙리스트 아님"으로 판단해 Redis 조회를 생략하고, 있을 수도 있을 때만 Redis 확인
+- Bloom Filter는 삭제가 불가능하므로 주기적으로 재구성해 만료된 토큰을 털어낸다
+- 동기화가 끊긴 동안에는 ready=False가 되어 모든 조회가 Redis로 간다
+"""
+import asyncio
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.config.logger import logger
+from app.config.settings import TOKEN_BLACKLIST_FILTER_CAPACITY, TOKEN_BLACKLIST_FILTER_ERROR_RATE, \
+    TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS
+from app.shared.infrastructure.bloom_filter import BloomFilter
+
+BLACKLIST_KEY_PREFIX = "blacklist:jti:"
+BLACKLIST_CHANNEL = "blacklist:events"
+
+_RETRY_DELAY_SECONDS = 5
+
+
+class BlacklistFilter:
+
+    def __init__(
+            self,
+            capacity: int = TOKEN_BLACKLIST_FILTER_CAPACITY,
+            error_rate: float = TOKEN_BLACKLIST_FILTER_ERROR_RATE,
+            rebuild_seconds: int = TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS,
+            key_prefix: str = BLACKLIST_KEY_PREFIX,
+            channel: str = BLACKLIST_CHANNEL
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_seconds = rebuild_seconds
+        self.key_prefix = key_prefix
+        self.channel = channel
+
+        self._filter = BloomFilter(capacity, error_rate)
+        self._building: Optional[BloomFilter] = None
+        self._task: Optional[asyncio.Task] = None
+        self.ready = False
+
+        # 통계
+        self.local_negatives = 0
+        self.possible_hits = 0
+        self.false_positives = 0
+
+    def add(self, token_key: str) -> None:
+        self._filter.add(token_key)
+        # 재구성 중이면 새 필터에도 반영해 교체 직후 누락되지 않도록 한다
+        if self._building is not None:
+            self._building.add(token_key)
+
+    def might_contain(self, token_key: str) -> bool:
+        if not self.ready:
+            return True
+
+        if self._filter.might_contain(token_key):
+            self.possible_hits += 1
+            return True
+
+        self.local_negatives += 1
+        return False
+
+    def record_false_positive(self) -> None:
+        self.false_positives += 1
+
+    async def rebuild(self, redis_client: redis.Redis) -> int:
+        # 현재 항목 수의 2배 여유를 두고 새 필터를 만든 뒤 한 번에 교체
+        capacity = max(self.capacity, self._filter.count * 2)
+        building = BloomFilter(capacity, self.error_rate)
+        self._building = building
+        try:
+            async for key in redis_client.scan_iter(match=f"{self.key_prefix}*", count=1000):
+                building.add(key[len(self.key_prefix):])
+            self._filter = building
+        finally:
+            self._building = None
+
+        logger.info(f"블랙리스트 Bloom Filter 재구성 완료: {building.count}개")
+        return building.count
+
+    async def start(self, redis_client: redis.Redis) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(redis_client))
+
+    async def stop(self) -> None:
+        self.ready = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self, redis_client: redis.Redis) -> None:
+        # 구독 연결도 공유 커넥션 풀에서 하나를 빌려 쓴다
+        loop = asyncio.get_running_loop()
+
+        try:
+            while True:
+                pubsub = redis_client.pubsub()
+                try:
+                    # 구독을 먼저 시작해야 SCAN 도중 추가된 토큰도 놓치지 않는다
+                    await pubsub.subscribe(self.channel)
+                    await self.rebuild(redis_client)
+                    self.ready = True
+                    next_rebuild_at = loop.time() + self.rebuild_seconds
+
+                    while True:
+                        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                        if message is not None:
+                            self.add(message["data"])
+
+                        if loop.time() >= next_rebuild_at or self._filter.is_saturated:
+                            await self.rebuild(redis_client)
+                            next_rebuild_at = loop.time() + self.rebuild_seconds
+
+                except asyncio.CancelledError:
+                    raise
+
+                except Exception as e:
+                    self.ready = False
+                    logger.warning(f"블랙리스트 Bloom Filter 동기화 중단, Redis 직접 조회로 전환: {e}")
+                    await asyncio.sleep(_RETRY_DELAY_SECONDS)
+
+                finally:
+                    await pubsub.aclose()
+
+        finally:
+            self.ready = False
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "entries": self._filter.count,
+            "capacity": self._filter.capacity,
+            "local_negatives": self.local_negatives,
+            "possible_hits": self.possible_hits,
+            "false_positives": self.false_positives,
+        }
+
+
+# 프로세스 전역 필터 (요청마다 생성되는 저장소 인스턴스가 공유)
+blacklist_filter = BlacklistFilter()
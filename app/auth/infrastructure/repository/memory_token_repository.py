@@ -1,23 +1,49 @@
-from datetime import datetime, timedelta
-from typing import Set, Dict, Optional
+import hmac
+import time
+from typing import List, Sequence
 
 from app.auth.core.interface.token_repository_port import TokenRepositoryPort
 from app.config.logger import logger
+from app.config.settings import JWT_EXPIRE_HOURS, TOKEN_MEMORY_MAX_ENTRIES
+from app.shared.infrastructure.expiring_store import ExpiringStore
+from app.shared.infrastructure.token_codec import token_revocation_id, token_digest, strip_bearer, \
+    token_remaining_seconds
 
 
 class MemoryTokenRepository(TokenRepositoryPort):
-
-    def __init__(self):
-        self._blacklisted_tokens: Set[str] = set()
-        self._refresh_tokens: Dict[int, tuple[str, datetime]] = {}
+    """
+    Redis 저장소와 같은 TTL 의미를 갖는 인메모리 저장소
+    (만료 시각 min-heap으로 만료 항목을 점진적으로 제거)
+
+    최대 항목 수에 도달하면
+    - 블랙리스트: 만료 전 항목을 지우면 폐기된 토큰이 다시 유효해지므로, 새 폐기 요청을 거부(False)하고 에러 로그를 남긴다
+    - Refresh Token: 가장 먼저 만료될 항목부터 제거 (해당 사용자는 다시 로그인)
+    """
+
+    def __init__(self, max_entries: int = TOKEN_MEMORY_MAX_ENTRIES):
+        # 토큰 jti (없으면 digest)
+        self._blacklisted_tokens: ExpiringStore[str] = ExpiringStore(max_entries, evict_live=False)
+        self._refresh_tokens: ExpiringStore[int] = ExpiringStore(max_entries)  # user_id -> 토큰 digest
         logger.info("메모리 기반 토큰 저장소 초기화")
 
     async def blacklist_token(self, token: str, user_id: int = None, expires_at=None) -> bool:
         try:
-            clean_token = token.replace("Bearer ", "") if token.startswith("Bearer ") else token
-            self._blacklisted_tokens.add(clean_token)
-
-            logger.info(f"토큰 블랙리스트 추가 (메모리): {clean_token[:20]}...")
+            revocation_id = token_revocation_id(token)
+
+            # 토큰 자체 만료 시각까지만 보관 (exp가 없으면 기본 만료시간)
+            ttl = token_remaining_seconds(token, expires_at, JWT_EXPIRE_HOURS * 3600)
+            if ttl <= 0:
+                logger.info(f"이미 만료된 토큰은 블랙리스트에 추가하지 않음: {revocation_id}")
+                return True
+
+            if not self._blacklisted_tokens.set(revocation_id, user_id, time.time() + ttl):
+                logger.error(
+                    f"블랙리스트 최대 항목 수({self._blacklisted_tokens.max_entries}) 초과로 토큰 폐기 거부 (메모리): "
+                    f"{revocation_id}"
+                )
+                return False
+
+            logger.info(f"토큰 블랙리스트 추가 (메모리): {revocation_id}, TTL: {ttl}s")
             return True
 
         except Exception as e:
@@ -26,11 +52,11 @@ class MemoryTokenRepository(TokenRepositoryPort):
 
     async def is_blacklisted(self, token: str) -> bool:
         try:
-            clean_token = token.replace("Bearer ", "") if token.startswith("Bearer ") else token
-            is_blacklisted = clean_token in self._blacklisted_tokens
+            revocation_id = token_revocation_id(token)
+            is_blacklisted = self._blacklisted_tokens.contains(revocation_id)
 
             if is_blacklisted:
-                logger.warning(f"블랙리스트된 토큰 접근 시도 (메모리): {clean_token[:20]}...")
+                logger.warning(f"블랙리스트된 토큰 접근 시도 (메모리): {revocation_id}")
 
             return is_blacklisted
 
@@ -38,10 +64,46 @@ class MemoryTokenRepository(TokenRepositoryPort):
             logger.error(f"토큰 블랙리스트 확인 실패 (메모리): {e}")
             return False
 
+    async def blacklist_many(self, tokens: Sequence[str], user_id: int = None) -> int:
+        try:
+            now = time.time()
+            default_ttl = JWT_EXPIRE_HOURS * 3600
+            blacklisted_count = 0
+            rejected_count = 0
+
+            for token in tokens:
+                ttl = token_remaining_seconds(token, None, default_ttl)
+                if ttl <= 0:
+                    continue
+                if self._blacklisted_tokens.set(token_revocation_id(token), user_id, now + ttl):
+                    blacklisted_count += 1
+                else:
+                    rejected_count += 1
+
+            if rejected_count:
+                logger.error(
+                    f"블랙리스트 최대 항목 수({self._blacklisted_tokens.max_entries}) 초과로 토큰 폐기 거부 (메모리): "
+                    f"{rejected_count}개"
+                )
+            logger.info(f"토큰 일괄 블랙리스트 추가 (메모리): {blacklisted_count}/{len(tokens)}개")
+            return blacklisted_count
+
+        except Exception as e:
+            logger.error(f"토큰 일괄 블랙리스트 추가 실패 (메모리): {e}")
+            return 0
+
+    async def is_blacklisted_many(self, tokens: Sequence[str]) -> List[bool]:
+        try:
+            now = time.time()
+            return [self._blacklisted_tokens.contains(token_revocation_id(token), now) for token in tokens]
+
+        except Exception as e:
+            logger.error(f"토큰 일괄 블랙리스트 확인 실패 (메모리): {e}")
+            return [False] * len(tokens)
+
     async def cleanup_expired_tokens(self) -> int:
         try:
-            cleaned_count = len(self._blacklisted_tokens)
-            self._blacklisted_tokens.clear()
+            cleaned_count = self._blacklisted_tokens.evict_expired()
 
             logger.info(f"메모리 토큰 저장소 정리 완료: {cleaned_count}개 토큰")
             return cleaned_count
@@ -52,39 +114,31 @@ class MemoryTokenRepository(TokenRepositoryPort):
 
     async def store_user_refresh_token(self, user_id: int, refresh_token: str, ttl_seconds: int = None) -> bool:
         try:
-            expires_at = datetime.utcnow() + timedelta(
-                seconds=ttl_seconds) if ttl_seconds else datetime.utcnow() + timedelta(days=7)
-            self._refresh_tokens[user_id] = (refresh_token, expires_at)
+            ttl = ttl_seconds if ttl_seconds else 7 * 24 * 3600  # 기본 7일
+            self._refresh_tokens.set(user_id, token_digest(strip_bearer(refresh_token)), time.time() + ttl)
 
-            logger.info(f"Refresh Token 저장 (메모리): user_id={user_id}")
+            logger.info(f"Refresh Token 저장 (메모리): user_id={user_id}, TTL={ttl}s")
             return True
 
         except Exception as e:
             logger.error(f"Refresh Token 저장 실패 (메모리): {e}")
             return False
 
-    async def get_user_refresh_token(self, user_id: int) -> Optional[str]:
+    async def is_user_refresh_token(self, user_id: int, refresh_token: str) -> bool:
         try:
-            if user_id not in self._refresh_tokens:
-                return None
+            stored_digest = self._refresh_tokens.get(user_id)
+            if stored_digest is None:
+                return False
 
-            refresh_token, expires_at = self._refresh_tokens[user_id]
-
-            if datetime.utcnow() > expires_at:
-                del self._refresh_tokens[user_id]
-                logger.info(f"만료된 Refresh Token 삭제 (메모리): user_id={user_id}")
-                return None
-
-            return refresh_token
+            return hmac.compare_digest(stored_digest, token_digest(strip_bearer(refresh_token)))
 
         except Exception as e:
             logger.error(f"Refresh Token 조회 실패 (메모리): {e}")
-            return None
+            return False
 
     async def revoke_user_refresh_token(self, user_id: int) -> bool:
         try:
-            if user_id in self._refresh_tokens:
-                del self._refresh_tokens[user_id]
+            if self._refresh_tokens.delete(user_id):
                 logger.info(f"Refresh Token 삭제 (메모리): user_id={user_id}")
             return True
 
@@ -92,21 +146,30 @@ class MemoryTokenRepository(TokenRepositoryPort):
             logger.error(f"Refresh Token 삭제 실패 (메모리): {e}")
             return False
 
-    async def cleanup_expired_refresh_tokens(self) -> int:
+    async def revoke_refresh_tokens_for_users(self, user_ids: Sequence[int]) -> int:
         try:
-            current_time = datetime.utcnow()
-            expired_users = []
+            revoked_count = sum(1 for user_id in user_ids if self._refresh_tokens.delete(user_id))
 
-            for user_id, (token, expires_at) in self._refresh_tokens.items():
-                if current_time > expires_at:
-                    expired_users.append(user_id)
+            logger.info(f"Refresh Token 일괄 삭제 (메모리): {revoked_count}/{len(user_ids)}명")
+            return revoked_count
 
-            for user_id in expired_users:
-                del self._refresh_tokens[user_id]
+        except Exception as e:
+            logger.error(f"Refresh Token 일괄 삭제 실패 (메모리): {e}")
+            return 0
 
-            logger.info(f"만료된 Refresh Token 정리 (메모리): {len(expired_users)}개")
-            return len(expired_users)
+    async def cleanup_expired_refresh_tokens(self) -> int:
+        try:
+            cleaned_count = self._refresh_tokens.evict_expired()
+
+            logger.info(f"만료된 Refresh Token 정리 (메모리): {cleaned_count}개")
+            return cleaned_count
 
         except Exception as e:
             logger.error(f"Refresh Token 정리 실패 (메모리): {e}")
             return 0
+
+    def stats(self) -> dict:
+        return {
+            "blacklist": self._blacklisted_tokens.stats(),
+            "refresh_tokens": self._refresh_tokens.stats(),
+        }
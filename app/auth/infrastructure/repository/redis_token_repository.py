@@ -1,61 +1,87 @@
 """
 Redis Token Repository Adapter - Redis 기반 토큰 저장소
 """
+import asyncio
+import hmac
 import json
-from datetime import datetime
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
 
 import redis.asyncio as redis
 
 from app.auth.core.interface.token_repository_port import TokenRepositoryPort
+from app.auth.infrastructure.blacklist_filter import BlacklistFilter, blacklist_filter, BLACKLIST_KEY_PREFIX, \
+    BLACKLIST_CHANNEL
 from app.config.logger import logger
-from app.config.settings import REDIS_URL, JWT_EXPIRE_HOURS
+from app.config.settings import JWT_EXPIRE_HOURS, TOKEN_BLACKLIST_FILTER_ENABLED, TOKEN_CLEANUP_BATCH_SIZE, \
+    TOKEN_CLEANUP_TIME_BUDGET_SECONDS, TOKEN_BATCH_SIZE
+from app.shared.infrastructure.token_codec import token_revocation_id, token_digest, strip_bearer, \
+    token_remaining_seconds
+
+# jti 도입 이전, 토큰 원문을 키로 쓰던 블랙리스트 프리픽스 (마이그레이션 대상)
+LEGACY_BLACKLIST_KEY_PREFIX = "blacklist:token:"
+
+
+@dataclass
+class CleanupStats:
+    pattern: str
+    scanned: int = 0
+    cleaned: int = 0
+    batches: int = 0
+    completed: bool = False
+    elapsed_seconds: float = 0.0
 
 
 class RedisTokenRepository(TokenRepositoryPort):
 
-    def __init__(self, redis_url: str = REDIS_URL):
-        self.redis_url = redis_url
-        self._redis_client: Optional[redis.Redis] = None
-        self.blacklist_key_prefix = "blacklist:token:"
+    def __init__(
+            self,
+            redis_client: redis.Redis,
+            token_filter: Optional[BlacklistFilter] = blacklist_filter if TOKEN_BLACKLIST_FILTER_ENABLED else None,
+            cleanup_batch_size: int = TOKEN_CLEANUP_BATCH_SIZE,
+            cleanup_time_budget: float = TOKEN_CLEANUP_TIME_BUDGET_SECONDS,
+            batch_size: int = TOKEN_BATCH_SIZE
+    ):
+        # 클라이언트(커넥션 풀)는 RedisClientManager가 소유하므로 저장소에서 닫지 않는다
+        self._redis_client = redis_client
+        self.blacklist_key_prefix = BLACKLIST_KEY_PREFIX
+        self.blacklist_channel = BLACKLIST_CHANNEL
+        self.token_filter = token_filter
         self.refresh_key_prefix = "refresh_user:"  # Refresh Token 전용 프리픽스
-        logger.info(f"Redis 토큰 저장소 초기화: {redis_url}")
+        self.cleanup_batch_size = cleanup_batch_size
+        self.cleanup_time_budget = cleanup_time_budget
+        self.batch_size = batch_size
+        self._cleanup_cursors: Dict[str, int] = {}
+        self.last_cleanup_stats: Dict[str, CleanupStats] = {}
 
     async def _get_redis_client(self) -> redis.Redis:
-        if self._redis_client is None:
-            self._redis_client = redis.from_url(
-                self.redis_url,
-                decode_responses=True,
-                retry_on_timeout=True
-            )
         return self._redis_client
 
     async def blacklist_token(self, token: str, user_id: int = None, expires_at=None) -> bool:
         try:
             redis_client = await self._get_redis_client()
 
-            clean_token = token.replace("Bearer ", "") if token.startswith("Bearer ") else token
+            # 토큰 원문 대신 jti(없으면 digest)를 키로 사용
+            revocation_id = token_revocation_id(token)
+            redis_key = f"{self.blacklist_key_prefix}{revocation_id}"
 
-            redis_key = f"{self.blacklist_key_prefix}{clean_token}"
+            # 토큰 자체 만료 시각까지만 보관 (exp가 없으면 기본 만료시간)
+            ttl = token_remaining_seconds(token, expires_at, JWT_EXPIRE_HOURS * 3600)
 
-            token_info = {
-                "user_id": user_id,
-                "blacklisted_at": datetime.utcnow().isoformat(),
-                "expires_at": expires_at.isoformat() if expires_at else None
-            }
+            if ttl <= 0:
+                logger.info(f"이미 만료된 토큰은 블랙리스트에 추가하지 않음: {revocation_id}")
+                return True
 
-            if expires_at:
-                ttl = int((expires_at - datetime.utcnow()).total_seconds())
-            else:
-                ttl = JWT_EXPIRE_HOURS * 3600  # 기본 만료시간
+            if self.token_filter:
+                self.token_filter.add(revocation_id)
 
-            await redis_client.setex(
-                redis_key,
-                ttl,
-                json.dumps(token_info)
-            )
+            # 저장 후 다른 프로세스의 Bloom Filter에도 전파 (MULTI로 저장 -> 발행 순서 보장)
+            async with redis_client.pipeline(transaction=True) as pipe:
+                pipe.setex(redis_key, ttl, str(user_id) if user_id else "1")
+                pipe.publish(self.blacklist_channel, revocation_id)
+                await pipe.execute()
 
-            logger.info(f"토큰 블랙리스트 추가 (Redis): {clean_token[:20]}..., TTL: {ttl}s")
+            logger.info(f"토큰 블랙리스트 추가 (Redis): {revocation_id}, TTL: {ttl}s")
             return True
 
         except Exception as e:
@@ -64,19 +90,23 @@ class RedisTokenRepository(TokenRepositoryPort):
 
     async def is_blacklisted(self, token: str) -> bool:
         try:
-            redis_client = await self._get_redis_client()
+            revocation_id = token_revocation_id(token)
 
-            # Bearer 프리픽스 제거
-            clean_token = token.replace("Bearer ", "") if token.startswith("Bearer ") else token
+            # 로컬 Bloom Filter에 없으면 블랙리스트가 아님이 확실하므로 Redis 조회 생략
+            if self.token_filter and not self.token_filter.might_contain(revocation_id):
+                return False
+
+            redis_client = await self._get_redis_client()
 
             # Redis 키 확인
-            redis_key = f"{self.blacklist_key_prefix}{clean_token}"
-            token_info = await redis_client.get(redis_key)
+            redis_key = f"{self.blacklist_key_prefix}{revocation_id}"
+            is_blacklisted = bool(await redis_client.exists(redis_key))
 
-            is_blacklisted = token_info is not None
+            if not is_blacklisted and self.token_filter and self.token_filter.ready:
+                self.token_filter.record_false_positive()
 
             if is_blacklisted:
-                logger.warning(f"블랙리스트된 토큰 접근 시도 (Redis): {clean_token[:20]}...")
+                logger.warning(f"블랙리스트된 토큰 접근 시도 (Redis): {revocation_id}")
 
             return is_blacklisted
 
@@ -84,29 +114,77 @@ class RedisTokenRepository(TokenRepositoryPort):
             logger.error(f"토큰 블랙리스트 확인 실패 (Redis): {e}")
             return False
 
-    async def cleanup_expired_tokens(self) -> int:
+    async def blacklist_many(self, tokens: Sequence[str], user_id: int = None) -> int:
         try:
             redis_client = await self._get_redis_client()
+            default_ttl = JWT_EXPIRE_HOURS * 3600
+            value = str(user_id) if user_id else "1"
+
+            entries = []
+            for token in tokens:
+                ttl = token_remaining_seconds(token, None, default_ttl)
+                if ttl > 0:
+                    entries.append((token_revocation_id(token), ttl))
+
+            # batch_size개씩 파이프라인 1회 왕복으로 저장 + 전파
+            for start in range(0, len(entries), self.batch_size):
+                batch = entries[start:start + self.batch_size]
+                if self.token_filter:
+                    for revocation_id, _ in batch:
+                        self.token_filter.add(revocation_id)
+
+                async with redis_client.pipeline(transaction=True) as pipe:
+                    for revocation_id, ttl in batch:
+                        pipe.setex(f"{self.blacklist_key_prefix}{revocation_id}", ttl, value)
+                        pipe.publish(self.blacklist_channel, revocation_id)
+                    await pipe.execute()
+
+            logger.info(f"토큰 일괄 블랙리스트 추가 (Redis): {len(entries)}/{len(tokens)}개")
+            return len(entries)
+
+        except Exception as e:
+            logger.error(f"토큰 일괄 블랙리스트 추가 실패 (Redis): {e}")
+            return 0
+
+    async def is_blacklisted_many(self, tokens: Sequence[str]) -> List[bool]:
+        results = [False] * len(tokens)
+        try:
+            # Bloom Filter를 통과한 토큰만 MGET으로 확인
+            candidates = []
+            for index, token in enumerate(tokens):
+                revocation_id = token_revocation_id(token)
+                if self.token_filter and not self.token_filter.might_contain(revocation_id):
+                    continue
+                candidates.append((index, revocation_id))
 
-            pattern = f"{self.blacklist_key_prefix}*"
-            keys = await redis_client.keys(pattern)
+            if not candidates:
+                return results
 
-            if not keys:
-                return 0
+            redis_client = await self._get_redis_client()
+            for start in range(0, len(candidates), self.batch_size):
+                batch = candidates[start:start + self.batch_size]
+                values = await redis_client.mget([f"{self.blacklist_key_prefix}{rid}" for _, rid in batch])
+                for (index, revocation_id), value in zip(batch, values):
+                    if value is not None:
+                        results[index] = True
+                        logger.warning(f"블랙리스트된 토큰 접근 시도 (Redis): {revocation_id}")
+                    elif self.token_filter and self.token_filter.ready:
+                        self.token_filter.record_false_positive()
+
+            return results
+
+        except Exception as e:
+            logger.error(f"토큰 일괄 블랙리스트 확인 실패 (Redis): {e}")
+            return [False] * len(tokens)
 
-            # 만료된 키들 확인 및 정리
-            cleaned_count = 0
-            for key in keys:
-                ttl = await redis_client.ttl(key)
-                # TTL이 0보다 작으면 이미 만료되었거나 TTL이 설정되지 않음
-                if ttl < 0:
-                    await redis_client.delete(key)
-                    cleaned_count += 1
+    async def cleanup_expired_tokens(self) -> int:
+        try:
+            stats = await self._cleanup_keys(f"{self.blacklist_key_prefix}*")
 
-            if cleaned_count > 0:
-                logger.info(f"Redis 토큰 정리 완료: {cleaned_count}개 토큰")
+            if stats.cleaned > 0:
+                logger.info(f"Redis 토큰 정리 완료: {stats.cleaned}개 토큰")
 
-            return cleaned_count
+            return stats.cleaned
 
         except Exception as e:
             logger.error(f"토큰 정리 실패 (Redis): {e}")
@@ -119,7 +197,8 @@ class RedisTokenRepository(TokenRepositoryPort):
             redis_key = f"{self.refresh_key_prefix}{user_id}"
             ttl = ttl_seconds if ttl_seconds else 7 * 24 * 3600  # 기본 7일
 
-            await redis_client.setex(redis_key, ttl, refresh_token)
+            # 원문 대신 digest만 저장 (검증은 is_user_refresh_token에서 digest 비교)
+            await redis_client.setex(redis_key, ttl, token_digest(strip_bearer(refresh_token)).hex())
 
             logger.info(f"Refresh Token 저장 (Redis): user_id={user_id}, TTL={ttl}s")
             return True
@@ -128,18 +207,20 @@ class RedisTokenRepository(TokenRepositoryPort):
             logger.error(f"Refresh Token 저장 실패 (Redis): {e}")
             return False
 
-    async def get_user_refresh_token(self, user_id: int) -> Optional[str]:
+    async def is_user_refresh_token(self, user_id: int, refresh_token: str) -> bool:
         try:
             redis_client = await self._get_redis_client()
 
             redis_key = f"{self.refresh_key_prefix}{user_id}"
-            refresh_token = await redis_client.get(redis_key)
+            stored_digest = await redis_client.get(redis_key)
+            if not stored_digest:
+                return False
 
-            return refresh_token
+            return hmac.compare_digest(stored_digest, token_digest(strip_bearer(refresh_token)).hex())
 
         except Exception as e:
             logger.error(f"Refresh Token 조회 실패 (Redis): {e}")
-            return None
+            return False
 
     async def revoke_user_refresh_token(self, user_id: int) -> bool:
         try:
@@ -155,31 +236,144 @@ class RedisTokenRepository(TokenRepositoryPort):
             logger.error(f"Refresh Token 삭제 실패 (Redis): {e}")
             return False
 
-    async def cleanup_expired_refresh_tokens(self) -> int:
+    async def revoke_refresh_tokens_for_users(self, user_ids: Sequence[int]) -> int:
         try:
             redis_client = await self._get_redis_client()
+            revoked_count = 0
+
+            for start in range(0, len(user_ids), self.batch_size):
+                batch = user_ids[start:start + self.batch_size]
+                revoked_count += await redis_client.unlink(*[f"{self.refresh_key_prefix}{user_id}" for user_id in batch])
 
-            pattern = f"{self.refresh_key_prefix}*"
-            keys = await redis_client.keys(pattern)
+            logger.info(f"Refresh Token 일괄 삭제 (Redis): {revoked_count}/{len(user_ids)}명")
+            return revoked_count
 
-            # TTL이 만료된 키들 정리
-            cleaned_count = 0
-            for key in keys:
-                ttl = await redis_client.ttl(key)
-                if ttl < 0:  # 만료되었지만 아직 삭제되지 않은 키
-                    await redis_client.delete(key)
-                    cleaned_count += 1
+        except Exception as e:
+            logger.error(f"Refresh Token 일괄 삭제 실패 (Redis): {e}")
+            return 0
+
+    async def cleanup_expired_refresh_tokens(self) -> int:
+        try:
+            stats = await self._cleanup_keys(f"{self.refresh_key_prefix}*")
 
-            if cleaned_count > 0:
-                logger.info(f"Redis Refresh Token 정리 완료: {cleaned_count}개")
+            if stats.cleaned > 0:
+                logger.info(f"Redis Refresh Token 정리 완료: {stats.cleaned}개")
 
-            return cleaned_count
+            return stats.cleaned
 
         except Exception as e:
             logger.error(f"Refresh Token 정리 실패 (Redis): {e}")
             return 0
 
-    async def close(self):
-        if self._redis_client:
-            await self._redis_client.close()
-            logger.info("Redis 연결 종료")
+    async def _cleanup_keys(self, pattern: str) -> CleanupStats:
+        """
+        KEYS 대신 커서 기반 SCAN으로 batch_size씩 훑으면서
+        TTL 조회/UNLINK를 파이프라인으로 묶어 배치당 왕복 2번으로 처리한다.
+        시간 예산을 넘기면 커서를 저장해두고 다음 실행에서 이어서 진행한다.
+        """
+        redis_client = await self._get_redis_client()
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+
+        stats = CleanupStats(pattern=pattern)
+        cursor = self._cleanup_cursors.get(pattern, 0)
+
+        while True:
+            cursor, keys = await redis_client.scan(cursor=cursor, match=pattern, count=self.cleanup_batch_size)
+            stats.batches += 1
+            stats.scanned += len(keys)
+
+            if keys:
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key in keys:
+                        pipe.ttl(key)
+                    ttls = await pipe.execute()
+
+                # TTL -1: 만료 시간이 없는 키 (정리 대상), -2: 이미 삭제된 키
+                expired_keys = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+                if expired_keys:
+                    await redis_client.unlink(*expired_keys)
+                    stats.cleaned += len(expired_keys)
+
+            if cursor == 0:
+                stats.completed = True
+                break
+
+            if loop.time() - started_at >= self.cleanup_time_budget:
+                break
+
+        # 완료되면 다음 실행은 처음부터, 예산 초과면 현재 커서부터 이어서
+        self._cleanup_cursors[pattern] = 0 if stats.completed else cursor
+        stats.elapsed_seconds = loop.time() - started_at
+        self.last_cleanup_stats[pattern] = stats
+
+        logger.debug(
+            f"Redis 키 정리 진행: pattern={pattern}, scanned={stats.scanned}, cleaned={stats.cleaned}, "
+            f"batches={stats.batches}, completed={stats.completed}, elapsed={stats.elapsed_seconds:.3f}s"
+        )
+        return stats
+
+    def stats(self) -> dict:
+        return {
+            "blacklist_filter": self.token_filter.stats() if self.token_filter else None,
+            "last_cleanup": {pattern: vars(stats) for pattern, stats in self.last_cleanup_stats.items()},
+        }
+
+    async def migrate_legacy_keys(self, batch_size: int = 500) -> int:
+        """
+        이전 형식 키를 새 형식으로 변환 (남은 TTL 유지, 여러 번 실행해도 안전)
+        - blacklist:token:<토큰 원문>  -> blacklist:jti:<jti 또는 digest>
+        - refresh_user:<id> = <토큰 원문> -> refresh_user:<id> = <digest>
+        """
+        try:
+            redis_client = await self._get_redis_client()
+            migrated_count = 0
+
+            legacy_keys = [key async for key in redis_client.scan_iter(
+                match=f"{LEGACY_BLACKLIST_KEY_PREFIX}*", count=batch_size
+            )]
+            for start in range(0, len(legacy_keys), batch_size):
+                batch = legacy_keys[start:start + batch_size]
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key in batch:
+                        pipe.get(key)
+                        pipe.pttl(key)
+                    results = await pipe.execute()
+
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    for key, value, pttl in zip(batch, results[::2], results[1::2]):
+                        if value is not None and pttl > 0:
+                            user_id = _legacy_user_id(value)
+                            revocation_id = token_revocation_id(key[len(LEGACY_BLACKLIST_KEY_PREFIX):])
+                            pipe.psetex(
+                                f"{self.blacklist_key_prefix}{revocation_id}", pttl, str(user_id) if user_id else "1"
+                            )
+                            pipe.publish(self.blacklist_channel, revocation_id)
+                        pipe.unlink(key)
+                    await pipe.execute()
+                migrated_count += len(batch)
+
+            async for key in redis_client.scan_iter(match=f"{self.refresh_key_prefix}*", count=batch_size):
+                value = await redis_client.get(key)
+                # digest(hex 32자)가 아니라 JWT 원문이 저장된 경우만 변환
+                if value and "." in value:
+                    pttl = await redis_client.pttl(key)
+                    if pttl > 0:
+                        await redis_client.psetex(key, pttl, token_digest(strip_bearer(value)).hex())
+                        migrated_count += 1
+
+            if migrated_count > 0:
+                logger.info(f"Redis 토큰 키 마이그레이션 완료: {migrated_count}개")
+
+            return migrated_count
+
+        except Exception as e:
+            logger.error(f"Redis 토큰 키 마이그레이션 실패: {e}")
+            return 0
+
+
+def _legacy_user_id(token_info: str) -> Optional[int]:
+    try:
+        return json.loads(token_info).get("user_id")
+    except (ValueError, AttributeError):
+        return None
@@ -0,0 +1,57 @@
+"""
+의존성 컨테이너 구성 - 어떤 구현체를 어떤 생명주기로 쓸지 선언
+"""
+from app.auth.core.domain.services.token_service import TokenService
+from app.auth.core.interface.token_repository_port import TokenRepositoryPort
+from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
+from app.auth.infrastructure.repository.redis_token_repository import RedisTokenRepository
+from app.config.logger import logger
+from app.config.settings import TOKEN_STORAGE, DB_TYPE
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+from app.shared.core.container import Container
+from app.shared.infrastructure.redis_client import redis_client_manager
+from app.shared.infrastructure.unit_of_work import UnitOfWork
+from app.users.core.interface.user_repository_port import UserRepositoryPort
+from app.users.infrastructure.repository.cached_user_repository import CachedUserRepository
+from app.users.infrastructure.repository.postgres_user_repository import PostgresUserRepository
+from app.users.infrastructure.user_cache import user_cache
+
+
+def wire_container(container: Container) -> None:
+    # 싱글톤: 프로세스당 한 번 생성
+    container.singleton(TokenRepositoryPort, build_token_repository)
+    container.singleton(TokenService, lambda c: TokenService(c.resolve(TokenRepositoryPort)))
+
+    # 요청 단위: Unit of Work(DB 세션)에 묶인 객체 (이를 감싸는 UserService/AuthService는 Depends 체인에서 조립)
+    container.request(UserRepositoryPort, build_user_repository)
+
+    logger.info("의존성 컨테이너 구성 완료")
+
+
+def build_token_repository(container: Container) -> TokenRepositoryPort:
+    storage_type = TOKEN_STORAGE
+    if storage_type == "memory":
+        return MemoryTokenRepository()
+    if storage_type == "redis":
+        # 커넥션 풀이 없으면(리소스 초기화 실패) 500 대신 503으로 응답 (싱글톤이 캐시되지 않으므로 다음 요청에서 다시 시도)
+        if not redis_client_manager.is_started:
+            logger.error("Redis 커넥션 풀이 준비되지 않아 토큰 저장소를 만들 수 없습니다")
+            raise APIException(APIResponseCode.COMMON_SERVICE_UNAVAILABLE)
+        return RedisTokenRepository(redis_client_manager.client)
+    logger.warning(f"지원하지 않는 토큰 저장소 타입")
+    return MemoryTokenRepository()
+
+
+def build_user_repository(container: Container, unit_of_work: UnitOfWork) -> UserRepositoryPort:
+    db_type = DB_TYPE
+
+    if db_type == "postgres":
+        user_repository = PostgresUserRepository(unit_of_work)
+    else:
+        raise ValueError(f"지원하지 않는 DB 타입: {db_type}")
+
+    # 조회 캐시 decorator (USER_CACHE_ENABLED=false면 DB 저장소를 그대로 사용)
+    if user_cache.enabled:
+        return CachedUserRepository(user_repository, unit_of_work, user_cache)
+    return user_repository
@@ -8,6 +8,7 @@ from sqlalchemy import text
 
 from app.config.logger import logger
 from app.shared.infrastructure.base import Base, engine
+from app.shared.infrastructure.engine_router import engine_router
 
 
 async def init_database():
@@ -15,6 +16,7 @@ async def init_database():
     1. 데이터베이스 연결 확인
     2. Alembic을 사용한 자동 마이그레이션 실행
     3. 필요시 초기 데이터 설정
+    4. Read Replica 상태 확인 시작 (설정된 경우)
     """
     try:
         logger.info("-----데이터베이스 초기화 시작-----")
@@ -28,6 +30,9 @@ async def init_database():
         await initialize_db()
         logger.info("데이터베이스 초기화 완료")
 
+        # 3. Read Replica 상태 확인 시작
+        await start_replica_monitor()
+
     except Exception as e:
         logger.error(f"데이터베이스 초기화 실패: {e}")
         raise
@@ -48,6 +53,16 @@ async def initialize_db():
         raise
 
 
+async def start_replica_monitor():
+    try:
+        if engine_router.has_replicas:
+            await engine_router.start()
+            logger.info(f"Read Replica 라우팅 시작: {len(engine_router.replicas)}개")
+
+    except Exception as e:
+        logger.warning(f"Read Replica 상태 확인 시작 실패: {e}")
+
+
 async def check_database_health():
     try:
         async with engine.begin() as conn:
@@ -70,6 +85,7 @@ async def check_database_health():
 async def cleanup_database():
     try:
         logger.info("-----데이터베이스 연결 정리 중-----")
+        await engine_router.stop()
         await engine.dispose()
         logger.info("데이터베이스 연결 정리 완료")
 
@@ -1,10 +1,18 @@
 """
 애플리케이션 시작 시 필요한 리소스 초기화 & 정리
 """
-import redis.asyncio as redis
+import asyncio
 
+from app.auth.infrastructure.blacklist_filter import blacklist_filter
+from app.auth.infrastructure.repository.redis_token_repository import RedisTokenRepository
 from app.config.logger import logger
-from app.config.settings import TOKEN_STORAGE, REDIS_URL
+from app.config.settings import TOKEN_STORAGE, PASSWORD_HASH_CALIBRATE, PASSWORD_HASH_TARGET_MS, \
+    TOKEN_BLACKLIST_FILTER_ENABLED, USER_CACHE_ENABLED, USER_CACHE_L2_ENABLED
+from app.shared.infrastructure.hash_executor import password_hash_executor
+from app.shared.infrastructure.password_hashing import PasswordHashParams, calibrate
+from app.shared.infrastructure.redis_client import redis_client_manager
+from app.shared.infrastructure.security import configure_password_hash
+from app.users.infrastructure.last_login_buffer import last_login_buffer
 
 
 async def init_resources():
@@ -14,8 +22,8 @@ async def init_resources():
     try:
         logger.info("-----리소스 초기화 시작-----")
 
-        # 1. Redis 연결 테스트
-        await test_redis_connection()
+        # 1. Redis 커넥션 풀 생성 및 연결 테스트
+        await init_redis_connection()
 
         # 2. 외부 API 연결 테스트 (Optional)
         await test_external_apis()
@@ -26,20 +34,32 @@ async def init_resources():
         # 4. 기타 초기화 작업들 (Optional)
         await setup_background_tasks()
 
+        # 5. 비밀번호 해시 비용 보정 (Optional)
+        await calibrate_password_hash()
+
+        # 6. 이전 형식 토큰 키 마이그레이션 (Bloom Filter 구성 전에 실행)
+        await migrate_token_keys()
+
+        # 7. 토큰 블랙리스트 Bloom Filter 동기화 시작 (Optional)
+        await start_blacklist_filter()
+
+        # 8. 마지막 로그인 시각 일괄 반영 시작
+        await start_last_login_buffer()
+
         logger.info("리소스 초기화 완료")
 
     except Exception as e:
         logger.error(f"리소스 초기화 실패: {e}")
 
 
-async def test_redis_connection():
+async def init_redis_connection():
     try:
-        if TOKEN_STORAGE == "redis":
-            redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-            await redis_client.ping()
-            await redis_client.close()
+        # 토큰 저장소 또는 사용자 캐시(L2)가 Redis를 쓰면 풀 생성
+        if TOKEN_STORAGE == "redis" or (USER_CACHE_ENABLED and USER_CACHE_L2_ENABLED):
+            await redis_client_manager.start()
 
-            logger.info("Redis 연결 테스트 성공")
+            if await redis_client_manager.ping():
+                logger.info("Redis 연결 테스트 성공")
         else:
             logger.info("Redis 사용하지 않음 (서버 인메모리 사용)")
 
@@ -78,6 +98,51 @@ async def setup_background_tasks():
         logger.error(f"백그라운드 태스크 설정 실패: {e}")
 
 
+async def calibrate_password_hash():
+    try:
+        if PASSWORD_HASH_CALIBRATE:
+            # 벤치마크는 CPU 바운드이므로 이벤트 루프 밖에서 실행
+            params = await asyncio.to_thread(calibrate, PasswordHashParams.from_settings(), PASSWORD_HASH_TARGET_MS)
+            configure_password_hash(params)
+        else:
+            logger.info("비밀번호 해시 비용 보정 사용하지 않음 (설정값 사용)")
+
+    except Exception as e:
+        logger.warning(f"비밀번호 해시 비용 보정 실패: {e}")
+
+
+async def migrate_token_keys():
+    try:
+        if TOKEN_STORAGE == "redis":
+            token_repository = RedisTokenRepository(redis_client_manager.client)
+            await token_repository.migrate_legacy_keys()
+
+    except Exception as e:
+        logger.warning(f"토큰 키 마이그레이션 실패: {e}")
+
+
+async def start_blacklist_filter():
+    try:
+        if TOKEN_STORAGE == "redis" and TOKEN_BLACKLIST_FILTER_ENABLED:
+            await blacklist_filter.start(redis_client_manager.client)
+            logger.info("토큰 블랙리스트 Bloom Filter 동기화 시작")
+
+    except Exception as e:
+        logger.warning(f"토큰 블랙리스트 Bloom Filter 시작 실패: {e}")
+
+
+async def start_last_login_buffer():
+    try:
+        if last_login_buffer.enabled:
+            await last_login_buffer.start()
+            logger.info(f"마지막 로그인 시각 일괄 반영 시작: {last_login_buffer.flush_seconds}초 주기")
+        else:
+            logger.info("마지막 로그인 시각 일괄 반영 사용하지 않음 (로그인마다 즉시 반영)")
+
+    except Exception as e:
+        logger.warning(f"마지막 로그인 시각 일괄 반영 시작 실패: {e}")
+
+
 async def cleanup_resources():
     """
     애플리케이션 종료 시 사용한 리소스 정리
@@ -88,12 +153,19 @@ async def cleanup_resources():
         # 1. 이벤트 시스템 정리 (Optional)
         await cleanup_event_system()
 
-        # 2. Redis 연결 종료
+        # 2. 대기 중인 마지막 로그인 시각 반영 (DB 연결 정리 전에 실행)
+        await cleanup_last_login_buffer()
+
+        # 3. Redis 연결 종료
+        await cleanup_blacklist_filter()
         await cleanup_redis_connection()
 
-        # 3. 백그라운드 태스크 정리 (Optional)
+        # 4. 백그라운드 태스크 정리 (Optional)
         await cleanup_background_tasks()
 
+        # 5. 비밀번호 해싱 Executor 종료
+        await cleanup_password_hash_executor()
+
         logger.info("리소스 정리 완료")
 
     except Exception as e:
@@ -109,16 +181,42 @@ async def cleanup_event_system():
         logger.error(f"이벤트 시스템 정리 실패: {e}")
 
 
+async def cleanup_last_login_buffer():
+    try:
+        await last_login_buffer.stop()
+        logger.info(f"마지막 로그인 시각 일괄 반영 상태: {last_login_buffer.stats()}")
+
+    except Exception as e:
+        logger.error(f"마지막 로그인 시각 반영 종료 실패: {e}")
+
+
+async def cleanup_blacklist_filter():
+    try:
+        await blacklist_filter.stop()
+
+    except Exception as e:
+        logger.error(f"토큰 블랙리스트 Bloom Filter 종료 실패: {e}")
+
+
 async def cleanup_redis_connection():
     try:
-        if TOKEN_STORAGE == "redis":
-            # Redis 클라이언트 정리는 각 서비스에서 담당
+        if redis_client_manager.is_started:
+            logger.info(f"Redis 커넥션 풀 상태: {redis_client_manager.stats()}")
+            await redis_client_manager.close()
             logger.info("Redis 연결 정리 완료")
 
     except Exception as e:
         logger.error(f"Redis 연결 정리 실패: {e}")
 
 
+async def cleanup_password_hash_executor():
+    try:
+        await password_hash_executor.shutdown()
+
+    except Exception as e:
+        logger.error(f"비밀번호 해싱 Executor 종료 실패: {e}")
+
+
 async def cleanup_background_tasks():
     try:
         # 백그라운드 태스크 정리 로직 추가 가능
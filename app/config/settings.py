@@ -16,18 +16,109 @@ RELOAD = bool(os.getenv("RELOAD", False))
 DATABASE_URL = os.getenv("DATABASE_URL")
 DB_TYPE = os.getenv("DB_TYPE", "postgres").lower()
 
+# Database 커넥션 풀 설정 (primary/replica 공통)
+DATABASE_POOL_SIZE = int(os.getenv("DATABASE_POOL_SIZE", "5"))
+DATABASE_MAX_OVERFLOW = int(os.getenv("DATABASE_MAX_OVERFLOW", "10"))
+DATABASE_POOL_TIMEOUT_SECONDS = float(os.getenv("DATABASE_POOL_TIMEOUT_SECONDS", "30"))  # 연결 대기 최대 시간
+DATABASE_POOL_RECYCLE_SECONDS = int(os.getenv("DATABASE_POOL_RECYCLE_SECONDS", "-1"))  # -1이면 재생성하지 않음
+DATABASE_POOL_PRE_PING = os.getenv("DATABASE_POOL_PRE_PING", "false").lower() == "true"
+DATABASE_PREPARED_STATEMENT_CACHE_SIZE = int(os.getenv("DATABASE_PREPARED_STATEMENT_CACHE_SIZE", "100"))
+# 예: "application_name=fastapi-sandbox,jit=off"
+DATABASE_SERVER_SETTINGS = dict(
+    item.strip().split("=", 1) for item in os.getenv("DATABASE_SERVER_SETTINGS", "").split(",") if "=" in item
+)
+
+# Read Replica 설정 (쉼표로 구분, 비어 있으면 모든 읽기가 primary)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+DATABASE_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DATABASE_REPLICA_MAX_LAG_SECONDS", "5"))  # 초과 시 primary로 대체
+DATABASE_REPLICA_STICKY_SECONDS = float(os.getenv("DATABASE_REPLICA_STICKY_SECONDS", "5"))  # 쓰기 후 primary 고정 시간
+DATABASE_REPLICA_HEALTH_CHECK_SECONDS = float(os.getenv("DATABASE_REPLICA_HEALTH_CHECK_SECONDS", "10"))
+
+# 내부 API 설정 (/internal/*, 기본 비활성 - 켜려면 INTERNAL_API_TOKEN 필수, 요청에 X-Internal-Token 헤더 필요)
+INTERNAL_API_ENABLED = os.getenv("INTERNAL_API_ENABLED", "false").lower() == "true"
+INTERNAL_API_TOKEN = os.getenv("INTERNAL_API_TOKEN")
+
 # JWT 설정
 JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY")
-JWT_ALGORITHM = "HS256"
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")  # HS256 (JWT_SECRET_KEY), EdDSA/ES256 (JWT_KEYS_DIR)
+JWT_KEYS_DIR = os.getenv("JWT_KEYS_DIR", "keys/jwt")  # 비대칭 서명 키(PEM) 디렉토리
+JWT_ACTIVE_KID = os.getenv("JWT_ACTIVE_KID")  # 서명에 사용할 kid (없으면 이름순 마지막 개인키)
 JWT_EXPIRE_HOURS = int(os.getenv("JWT_EXPIRE_HOURS", "24"))
 
 # Token 수명 설정
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "15"))
 REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "7"))
 
+# Token 형식 설정
+TOKEN_PROFILE = os.getenv("TOKEN_PROFILE", "standard").lower()  # standard, compact
+TOKEN_INCLUDE_EMAIL = os.getenv("TOKEN_INCLUDE_EMAIL", "true").lower() == "true"  # compact 프로필에서 이메일 포함 여부
+
+# 검증된 토큰 캐시 설정
+TOKEN_CACHE_ENABLED = os.getenv("TOKEN_CACHE_ENABLED", "true").lower() == "true"
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
 # Token Storage 설정
 TOKEN_STORAGE = os.getenv("TOKEN_STORAGE", "memory").lower()  # memory, redis
+# 메모리 저장소 최대 항목 수 (0이면 제한 없음, 블랙리스트가 가득 차면 만료 전 항목을 지우지 않고 새 폐기를 거부)
+TOKEN_MEMORY_MAX_ENTRIES = int(os.getenv("TOKEN_MEMORY_MAX_ENTRIES", "100000"))
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
+# Redis 커넥션 풀 설정
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+REDIS_POOL_TIMEOUT_SECONDS = float(os.getenv("REDIS_POOL_TIMEOUT_SECONDS", "2"))  # 풀이 가득 찼을 때 연결 반납 대기 시간
+REDIS_SOCKET_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_TIMEOUT_SECONDS", "2"))
+REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS = float(os.getenv("REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS", "2"))
+REDIS_HEALTH_CHECK_INTERVAL_SECONDS = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL_SECONDS", "30"))
+
+# Redis 토큰 키 정리 설정
+TOKEN_CLEANUP_BATCH_SIZE = int(os.getenv("TOKEN_CLEANUP_BATCH_SIZE", "500"))  # SCAN 1회당 키 수
+TOKEN_CLEANUP_TIME_BUDGET_SECONDS = float(os.getenv("TOKEN_CLEANUP_TIME_BUDGET_SECONDS", "5"))  # 1회 실행 최대 시간
+TOKEN_BATCH_SIZE = int(os.getenv("TOKEN_BATCH_SIZE", "500"))  # 일괄 폐기/조회 시 파이프라인 1회당 키 수
+
+# 사용자 조회 캐시 설정 (L1: 프로세스 로컬, L2: Redis)
+USER_CACHE_ENABLED = os.getenv("USER_CACHE_ENABLED", "true").lower() == "true"
+USER_CACHE_L1_MAX_SIZE = int(os.getenv("USER_CACHE_L1_MAX_SIZE", "10000"))
+USER_CACHE_L1_TTL_SECONDS = float(os.getenv("USER_CACHE_L1_TTL_SECONDS", "5"))  # 다른 프로세스 변경이 늦게 보일 수 있는 최대 시간
+USER_CACHE_L2_ENABLED = os.getenv("USER_CACHE_L2_ENABLED", "true").lower() == "true"  # Redis 풀이 시작된 경우에만 사용
+USER_CACHE_L2_TTL_SECONDS = int(os.getenv("USER_CACHE_L2_TTL_SECONDS", "300"))
+USER_CACHE_NEGATIVE_TTL_SECONDS = float(os.getenv("USER_CACHE_NEGATIVE_TTL_SECONDS", "30"))  # 없는 사용자 캐시 시간
+
+# 마지막 로그인 시각 write-behind 설정
+USER_LAST_LOGIN_WRITE_BEHIND = os.getenv("USER_LAST_LOGIN_WRITE_BEHIND", "true").lower() == "true"  # false면 로그인마다 즉시 UPDATE
+USER_LAST_LOGIN_FLUSH_SECONDS = float(os.getenv("USER_LAST_LOGIN_FLUSH_SECONDS", "5"))  # DB 반영 최대 지연
+USER_LAST_LOGIN_BATCH_SIZE = int(os.getenv("USER_LAST_LOGIN_BATCH_SIZE", "1000"))  # UPDATE 1회당 행 수 (bind 파라미터 2개/행)
+USER_LAST_LOGIN_MAX_PENDING = int(os.getenv("USER_LAST_LOGIN_MAX_PENDING", "50000"))  # 넘으면 주기를 기다리지 않고 반영
+
+# 사용자 일괄 가져오기 설정
+USER_IMPORT_BATCH_SIZE = int(os.getenv("USER_IMPORT_BATCH_SIZE", "5000"))  # COPY/병합 1회당 행 수
+USER_IMPORT_HASH_CONCURRENCY = int(os.getenv("USER_IMPORT_HASH_CONCURRENCY", "0"))  # 동시 해싱 수 (0이면 해싱 Executor 워커+대기열 크기)
+
+# 사용자 내보내기 설정
+USER_EXPORT_FETCH_SIZE = int(os.getenv("USER_EXPORT_FETCH_SIZE", "1000"))  # server-side cursor 1회 fetch 행 수
+USER_EXPORT_CHUNK_BYTES = int(os.getenv("USER_EXPORT_CHUNK_BYTES", "65536"))  # 응답 chunk 크기 (gzip 압축 단위)
+
+# 사용자 일괄 조회 설정
+USER_BATCH_GET_MAX_KEYS = int(os.getenv("USER_BATCH_GET_MAX_KEYS", "1000"))  # batchGet 요청당 최대 id+이메일 수
+USER_LOADER_ENABLED = os.getenv("USER_LOADER_ENABLED", "true").lower() == "true"  # 동시 단건 이메일 조회를 ANY 쿼리 하나로 합침
+USER_LOADER_MAX_BATCH_SIZE = int(os.getenv("USER_LOADER_MAX_BATCH_SIZE", "500"))  # 넘으면 tick을 기다리지 않고 바로 조회
+
+# 블랙리스트 Bloom Filter 설정 (redis 저장소 전용)
+TOKEN_BLACKLIST_FILTER_ENABLED = os.getenv("TOKEN_BLACKLIST_FILTER_ENABLED", "true").lower() == "true"
+TOKEN_BLACKLIST_FILTER_CAPACITY = int(os.getenv("TOKEN_BLACKLIST_FILTER_CAPACITY", "100000"))
+TOKEN_BLACKLIST_FILTER_ERROR_RATE = float(os.getenv("TOKEN_BLACKLIST_FILTER_ERROR_RATE", "0.001"))
+TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS = int(os.getenv("TOKEN_BLACKLIST_FILTER_REBUILD_SECONDS", "3600"))
+
+# 비밀번호 해싱 설정
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread").lower()  # thread, process, interpreter
+PASSWORD_HASH_MAX_WORKERS = int(os.getenv("PASSWORD_HASH_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv("PASSWORD_HASH_QUEUE_LIMIT", "64"))  # 실행 중인 작업 외 대기 가능 개수
+PASSWORD_HASH_ALGORITHM = os.getenv("PASSWORD_HASH_ALGORITHM", "bcrypt").lower()  # bcrypt, argon2id
+PASSWORD_HASH_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_HASH_BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_ARGON2_TIME_COST = int(os.getenv("PASSWORD_HASH_ARGON2_TIME_COST", "3"))
+PASSWORD_HASH_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_HASH_ARGON2_MEMORY_COST", "65536"))  # KiB
+PASSWORD_HASH_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_HASH_ARGON2_PARALLELISM", "4"))
+PASSWORD_HASH_CALIBRATE = os.getenv("PASSWORD_HASH_CALIBRATE", "false").lower() == "true"  # 시작 시 비용 자동 보정
+PASSWORD_HASH_TARGET_MS = float(os.getenv("PASSWORD_HASH_TARGET_MS", "250"))
+
 # 로깅 설정
 LOG_LEVEL = os.getenv("LOG_LEVEL", "info")
@@ -9,13 +9,15 @@ from sqlalchemy.exc import SQLAlchemyError
 from app.auth.api.routers import auth_router
 from app.config.database import check_database_health
 from app.config.logger import setup_logger, logger
-from app.config.settings import HOST, PORT, RELOAD, LOG_LEVEL
+from app.config.settings import HOST, PORT, RELOAD, LOG_LEVEL, INTERNAL_API_ENABLED
 from app.shared.api.exception_handler import api_exception_handler, validation_exception_handler, \
     pydantic_validation_handler, sqlalchemy_exception_handler, general_exception_handler
 from app.shared.api.exceptions import APIException
+from app.shared.api.internal_routers import internal_router
 from app.shared.api.responses import success_response, APIResponseCode
 from app.shared.core.lifespan import lifespan
 from app.shared.core.middleware import setup_all_middleware
+from app.users.api.routers import user_router
 
 setup_logger()
 
@@ -38,6 +40,9 @@ app.add_exception_handler(Exception, general_exception_handler)
 
 # 라우터 등록
 app.include_router(auth_router, prefix="/api/auth/v1")
+app.include_router(user_router, prefix="/api/users/v1")
+if INTERNAL_API_ENABLED:
+    app.include_router(internal_router, prefix="/internal")
 
 
 @app.get("/")
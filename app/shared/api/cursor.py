@@ -0,0 +1,28 @@
+"""
+keyset 페이지네이션용 불투명 커서 - 정렬 키 값을 base64url로 감싸 클라이언트가 내용에 의존하지 않도록 한다
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple
+
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    raw = json.dumps([created_at.isoformat(), item_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, item_id = json.loads(raw)
+        if not isinstance(item_id, int):
+            raise ValueError("id가 정수가 아닙니다")
+        return datetime.fromisoformat(created_at), item_id
+
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError) as e:
+        raise APIException(APIResponseCode.COMMON_INVALID_PARAM, {"cursor": f"유효하지 않은 커서입니다: {e}"})
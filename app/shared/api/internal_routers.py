@@ -0,0 +1,53 @@
+"""
+내부 운영용 API - 커넥션 풀/캐시/Executor 상태 확인 (문서에 노출하지 않음)
+"""
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header
+
+from app.auth.dependencies import get_token_repository
+from app.config.settings import INTERNAL_API_TOKEN
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import success_response, APIResponseCode
+from app.shared.infrastructure.base import engine
+from app.shared.infrastructure.engine_router import engine_router
+from app.shared.infrastructure.hash_executor import password_hash_executor
+from app.shared.infrastructure.pool_metrics import pool_stats
+from app.shared.infrastructure.redis_client import redis_client_manager
+from app.shared.infrastructure.token_cache import verified_token_cache
+from app.users.infrastructure.last_login_buffer import last_login_buffer
+from app.users.infrastructure.repository.postgres_user_repository import user_email_loader
+from app.users.infrastructure.user_cache import user_cache
+
+
+def verify_internal_token(x_internal_token: Optional[str] = Header(None)) -> None:
+    # 토큰이 설정되지 않았으면 모두 거부 (내부 상태가 인증 없이 노출되지 않도록)
+    if not INTERNAL_API_TOKEN or not hmac.compare_digest(x_internal_token or "", INTERNAL_API_TOKEN):
+        raise APIException(APIResponseCode.AUTH_FORBIDDEN)
+
+
+internal_router = APIRouter(tags=["Internal"], include_in_schema=False, dependencies=[Depends(verify_internal_token)])
+
+
+@internal_router.get("/stats")
+async def stats():
+    token_repository = get_token_repository()
+    token_repository_stats = getattr(token_repository, "stats", None)
+
+    return success_response(
+        APIResponseCode.OK,
+        {
+            "database": {
+                "primary": pool_stats(engine),
+                "routing": engine_router.stats(),
+            },
+            "redis": redis_client_manager.stats(),
+            "password_hash_executor": password_hash_executor.stats(),
+            "verified_token_cache": verified_token_cache.stats(),
+            "user_cache": user_cache.stats(),
+            "last_login_buffer": last_login_buffer.stats(),
+            "user_email_loader": user_email_loader.stats() if user_email_loader else None,
+            "token_repository": token_repository_stats() if token_repository_stats else None,
+        }
+    )
@@ -41,6 +41,8 @@ class APIResponseCode(Enum):
     COMMON_INTERNAL_ERROR = ("COMMON-02", 500, "서버 내부 오류가 발생했습니다")
     COMMON_DATABASE_ERROR = ("COMMON-03", 500, "데이터베이스 오류가 발생했습니다")
     COMMON_JSON_INVALID = ("COMMON-04", 400, "JSON 형식이 올바르지 않습니다")
+    COMMON_SERVER_BUSY = ("COMMON-05", 503, "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요")
+    COMMON_SERVICE_UNAVAILABLE = ("COMMON-06", 503, "일시적으로 서비스를 이용할 수 없습니다")
 
     def __init__(self, code: str, status: int, description: str):
         self.code = code
@@ -0,0 +1,68 @@
+"""
+의존성 컨테이너 - 객체 생성 방법과 생명주기를 한 곳에서 관리
+
+- SINGLETON: 프로세스당 한 번만 생성 (상태 없는 서비스, 저장소, 매니저)
+- REQUEST: resolve할 때마다 생성 (DB 세션처럼 요청 단위 자원에 묶인 객체)
+  FastAPI가 같은 요청 안의 Depends 결과를 캐시하므로 결과적으로 요청당 한 번 생성된다
+"""
+from enum import Enum
+from typing import Any, Callable, Dict, Tuple, Type, TypeVar
+
+from app.config.logger import logger
+
+T = TypeVar("T")
+
+
+class Lifetime(str, Enum):
+    SINGLETON = "singleton"
+    REQUEST = "request"
+
+
+class Container:
+
+    def __init__(self):
+        self._providers: Dict[Any, Tuple[Callable[..., Any], Lifetime]] = {}
+        self._singletons: Dict[Any, Any] = {}
+
+    def register(self, key: Type[T], factory: Callable[..., T], lifetime: Lifetime = Lifetime.SINGLETON) -> None:
+        """
+        factory는 컨테이너를 첫 인자로 받는다 (REQUEST는 resolve에 넘긴 키워드 인자도 함께 받음)
+        """
+        self._providers[key] = (factory, lifetime)
+        self._singletons.pop(key, None)
+
+    def singleton(self, key: Type[T], factory: Callable[..., T]) -> None:
+        self.register(key, factory, Lifetime.SINGLETON)
+
+    def request(self, key: Type[T], factory: Callable[..., T]) -> None:
+        self.register(key, factory, Lifetime.REQUEST)
+
+    def resolve(self, key: Type[T], **kwargs) -> T:
+        provider = self._providers.get(key)
+        if provider is None:
+            raise RuntimeError(f"컨테이너에 등록되지 않은 의존성: {getattr(key, '__name__', key)}")
+
+        factory, lifetime = provider
+        if lifetime is Lifetime.REQUEST:
+            return factory(self, **kwargs)
+
+        instance = self._singletons.get(key)
+        if instance is None:
+            instance = factory(self)
+            self._singletons[key] = instance
+        return instance
+
+    def is_registered(self, key: Any) -> bool:
+        return key in self._providers
+
+    def reset(self) -> None:
+        """
+        등록 정보와 생성된 싱글톤을 모두 비운다 (자원 종료는 각 매니저의 cleanup 단계에서 담당)
+        """
+        self._providers.clear()
+        self._singletons.clear()
+        logger.info("의존성 컨테이너 초기화")
+
+
+# 프로세스 전역 컨테이너 (lifespan에서 wire_container로 구성)
+container = Container()
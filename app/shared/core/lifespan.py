@@ -6,6 +6,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
+from app.config.container import wire_container
 from app.config.database import (
     check_database_health,
     cleanup_database,
@@ -13,12 +14,14 @@ from app.config.database import (
 )
 from app.config.logger import logger
 from app.config.resource import cleanup_resources, init_resources
+from app.shared.core.container import container
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
     애플리케이션 시작 시:
+    - 의존성 컨테이너 구성
     - 데이터베이스 초기화
     - 필요한 서비스 초기화
 
@@ -29,28 +32,31 @@ async def lifespan(app: FastAPI):
     """
     logger.info("📦 FastAPI Sandbox 애플리케이션 시작")
 
+    # 의존성 컨테이너는 초기화 실패와 관계없이 구성 (싱글톤은 첫 요청 시 생성)
+    wire_container(container)
+
     try:
-        # 1. 데이터베이스 초기화
-        await init_database()
+        try:
+            # 1. 데이터베이스 초기화
+            await init_database()
 
-        # 2. 데이터베이스 상태 확인
-        db_healthy = await check_database_health()
-        if not db_healthy:
-            logger.warning(
-                "⚠️ 데이터베이스 상태가 비정상이지만 애플리케이션을 실행합니다."
-            )
+            # 2. 데이터베이스 상태 확인
+            db_healthy = await check_database_health()
+            if not db_healthy:
+                logger.warning(
+                    "⚠️ 데이터베이스 상태가 비정상이지만 애플리케이션을 실행합니다."
+                )
 
-        # 3. 기타 초기화 작업
-        await init_resources()
+            logger.info("✅ 데이터베이스 초기화 완료")
 
-        logger.info("✅ 데이터베이스 초기화 완료")
+        except Exception as e:
+            # 초기화 실패 시에도 애플리케이션이 실행되도록 함
+            logger.error(f"❌ 데이터베이스 초기화 실패: {e}")
 
-        # 애플리케이션 실행 상태 유지
-        yield
+        # 3. 기타 초기화 작업 (Redis 커넥션 풀 등은 DB 초기화 결과와 관계없이 준비)
+        await init_resources()
 
-    except Exception as e:
-        logger.error(f"❌ 애플리케이션 초기화 실패: {e}")
-        # 초기화 실패 시에도 애플리케이션이 실행되도록 함
+        # 애플리케이션 실행 상태 유지
         yield
 
     # 애플리케이션 종료 시 실행
@@ -64,6 +70,9 @@ async def lifespan(app: FastAPI):
             # 2. 데이터베이스 정리
             await cleanup_database()
 
+            # 3. 의존성 컨테이너 비우기
+            container.reset()
+
             logger.info("✅ 애플리케이션 종료 완료")
 
         except Exception as e:
@@ -1,13 +1,51 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from app.config.settings import DATABASE_URL
+from app.config.settings import DATABASE_URL, DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_POOL_TIMEOUT_SECONDS, \
+    DATABASE_POOL_RECYCLE_SECONDS, DATABASE_POOL_PRE_PING, DATABASE_PREPARED_STATEMENT_CACHE_SIZE, \
+    DATABASE_SERVER_SETTINGS
+from app.shared.infrastructure.pool_metrics import InstrumentedQueuePool, instrument_pool
 from app.shared.infrastructure.timestamp import BaseTimeEntity
 
-engine = create_async_engine(DATABASE_URL, echo=False)
+
+def build_engine(database_url: str) -> AsyncEngine:
+    """
+    설정값으로 풀을 구성한 엔진 생성 (primary/replica 공통)
+    """
+    connect_args = {}
+    if make_url(database_url).get_driver_name() == "asyncpg":
+        connect_args = {
+            # SQLAlchemy asyncpg 어댑터의 prepared statement 캐시 (연결당, 0이면 비활성화)
+            "prepared_statement_cache_size": DATABASE_PREPARED_STATEMENT_CACHE_SIZE,
+            # 연결 시 적용할 PostgreSQL 세션 설정 (application_name, jit 등)
+            "server_settings": DATABASE_SERVER_SETTINGS,
+        }
+
+    async_engine = create_async_engine(
+        database_url,
+        echo=False,
+        poolclass=InstrumentedQueuePool,
+        pool_size=DATABASE_POOL_SIZE,
+        max_overflow=DATABASE_MAX_OVERFLOW,
+        pool_timeout=DATABASE_POOL_TIMEOUT_SECONDS,
+        pool_recycle=DATABASE_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=DATABASE_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    instrument_pool(async_engine.sync_engine)
+    return async_engine
+
+
+engine = build_engine(DATABASE_URL)
 
 AsyncDBSession = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+# 같은 커넥션 풀을 쓰되 트랜잭션을 BEGIN READ ONLY로 시작하는 세션 (asyncpg 전용 실행 옵션)
+AsyncReadOnlyDBSession = async_sessionmaker(
+    engine.execution_options(postgresql_readonly=True), class_=AsyncSession, expire_on_commit=False
+)
+
 
 class Base(DeclarativeBase, BaseTimeEntity):
     """
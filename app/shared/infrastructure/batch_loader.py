@@ -0,0 +1,107 @@
+"""
+DataLoader 방식 배치 조회 - 같은 tick에 들어온 단건 조회를 모아 한 번의 배치 조회로 실행
+
+- load(key)는 키를 대기열에 넣고, 현재 이벤트 루프 반복이 끝난 직후(call_soon) 모인 키를 batch_fn 한 번으로 조회
+- 같은 키의 동시 조회는 하나로 합친다
+- 대기 키가 max_batch_size에 도달하면 tick을 기다리지 않고 바로 조회
+- 대기열은 이벤트 루프별로 따로 관리 (워커 스레드/테스트에서 루프가 여러 개여도 Future가 섞이지 않음)
+- 결과는 요청 사이에 캐시하지 않는다 (조회가 끝나면 버림)
+"""
+import asyncio
+import weakref
+from typing import Awaitable, Callable, Dict, Generic, Hashable, List, Optional, Set, TypeVar
+
+from app.config.logger import logger
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class _LoopState:
+    __slots__ = ("pending", "scheduled", "tasks")
+
+    def __init__(self):
+        self.pending: Dict = {}
+        self.scheduled = False
+        # 실행 중인 배치 조회 (GC로 취소되지 않도록 참조 유지)
+        self.tasks: Set[asyncio.Task] = set()
+
+
+class BatchLoader(Generic[K, V]):
+
+    def __init__(self, name: str, batch_fn: Callable[[List[K]], Awaitable[Dict[K, V]]], max_batch_size: int):
+        """
+        batch_fn: 키 목록을 받아 {키: 값}을 돌려준다 (없는 키는 빼면 load가 None을 돌려줌)
+        """
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = weakref.WeakKeyDictionary()
+
+        self.loads = 0
+        self.coalesced = 0
+        self.batches = 0
+        self.keys_loaded = 0
+        self.largest_batch = 0
+        self.failures = 0
+
+    async def load(self, key: K) -> Optional[V]:
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+
+        self.loads += 1
+        future = state.pending.get(key)
+        if future is not None:
+            self.coalesced += 1
+        else:
+            future = state.pending[key] = loop.create_future()
+            if len(state.pending) >= self.max_batch_size:
+                self._dispatch(loop, state)
+            elif not state.scheduled:
+                state.scheduled = True
+                loop.call_soon(self._dispatch, loop, state)
+
+        # 한 호출자가 취소되어도 같은 키를 기다리는 다른 호출자의 결과는 유지
+        return await asyncio.shield(future)
+
+    def _dispatch(self, loop: asyncio.AbstractEventLoop, state: _LoopState) -> None:
+        state.scheduled = False
+        if not state.pending:
+            return
+        batch, state.pending = state.pending, {}
+        task = loop.create_task(self._run(batch), name=f"{self.name}-batch")
+        state.tasks.add(task)
+        task.add_done_callback(state.tasks.discard)
+
+    async def _run(self, batch: Dict[K, asyncio.Future]) -> None:
+        self.batches += 1
+        self.keys_loaded += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        try:
+            values = await self.batch_fn(list(batch))
+
+        except Exception as e:
+            self.failures += 1
+            logger.error(f"배치 조회 실패 ({self.name}, {len(batch)}건): {e}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+                    # 기다리던 호출자가 모두 취소된 경우 "exception was never retrieved" 경고 방지
+                    future.exception()
+            return
+
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+    def stats(self) -> dict:
+        return {
+            "loads": self.loads,
+            "coalesced": self.coalesced,
+            "batches": self.batches,
+            "avg_batch_size": round(self.keys_loaded / self.batches, 1) if self.batches else 0.0,
+            "largest_batch": self.largest_batch,
+            "failures": self.failures,
+        }
@@ -0,0 +1,47 @@
+"""
+Bloom Filter - "확실히 없음"을 로컬에서 빠르게 판단하기 위한 확률적 집합
+(있다고 판단한 경우만 원본 저장소를 확인해야 함, 삭제 불가)
+"""
+import hashlib
+import math
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity는 양수, error_rate는 0과 1 사이여야 합니다")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # 최적 비트 수 m = -n·ln(p) / (ln2)^2, 해시 함수 수 k = (m/n)·ln2
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # 128비트 digest 하나를 둘로 나눠 k개의 위치를 만든다 (double hashing)
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def might_contain(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.might_contain(item)
+
+    @property
+    def is_saturated(self) -> bool:
+        """
+        설계 용량을 넘으면 오탐률이 급격히 올라가므로 재구성이 필요하다.
+        """
+        return self.count > self.capacity
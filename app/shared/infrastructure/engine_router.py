@@ -0,0 +1,174 @@
+"""
+Primary/Replica 엔진 라우팅
+
+- 쓰기는 항상 primary, 읽기는 정상 replica를 라운드로빈으로 선택
+- replica가 다운되었거나 복제 지연이 max_lag_seconds를 넘으면 primary로 대체
+- 쓰기 직후 sticky_seconds 동안은 같은 키(사용자 등)의 읽기를 primary로 보낸다 (read-your-writes)
+  (프로세스 로컬 기록이므로 다른 워커 프로세스로 간 요청에는 적용되지 않음)
+"""
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.logger import logger
+from app.config.settings import DATABASE_REPLICA_URLS, DATABASE_REPLICA_MAX_LAG_SECONDS, \
+    DATABASE_REPLICA_STICKY_SECONDS, DATABASE_REPLICA_HEALTH_CHECK_SECONDS
+from app.shared.infrastructure.base import engine, build_engine
+from app.shared.infrastructure.expiring_store import ExpiringStore
+from app.shared.infrastructure.pool_metrics import pool_stats
+
+# 수신한 WAL을 모두 적용했으면 0, 아니면 마지막 트랜잭션 적용 이후 경과 시간 (primary에서는 NULL -> 0)
+_REPLICATION_LAG_QUERY = text(
+    "SELECT COALESCE(CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, 0)"
+)
+
+_MAX_STICKY_KEYS = 100_000
+
+
+@dataclass
+class ReplicaState:
+    name: str
+    engine: AsyncEngine
+    healthy: bool = True
+    lag_seconds: float = 0.0
+    last_error: Optional[str] = None
+    reads: int = 0
+
+
+class EngineRouter:
+
+    def __init__(
+            self,
+            primary: AsyncEngine,
+            replica_urls: List[str],
+            max_lag_seconds: float = DATABASE_REPLICA_MAX_LAG_SECONDS,
+            sticky_seconds: float = DATABASE_REPLICA_STICKY_SECONDS,
+            health_check_seconds: float = DATABASE_REPLICA_HEALTH_CHECK_SECONDS
+    ):
+        self.primary = primary
+        self.replicas = [
+            ReplicaState(name=f"replica-{index}", engine=build_engine(url))
+            for index, url in enumerate(replica_urls)
+        ]
+        self.max_lag_seconds = max_lag_seconds
+        self.sticky_seconds = sticky_seconds
+        self.health_check_seconds = health_check_seconds
+
+        self._round_robin = itertools.cycle(self.replicas) if self.replicas else None
+        self._sticky_keys: ExpiringStore[str] = ExpiringStore(_MAX_STICKY_KEYS)
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.primary_reads = 0
+        self.fallbacks = 0
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self.replicas)
+
+    def mark_written(self, sticky_key: str) -> None:
+        if self.has_replicas and self.sticky_seconds > 0:
+            self._sticky_keys.set(sticky_key, True, time.time() + self.sticky_seconds)
+
+    def is_sticky(self, sticky_key: str) -> bool:
+        return self.has_replicas and bool(self._sticky_keys.get(sticky_key))
+
+    def reader_engine(self, sticky_key: Optional[str] = None) -> AsyncEngine:
+        if not self.has_replicas:
+            return self.primary
+
+        if sticky_key is not None and self._sticky_keys.get(sticky_key):
+            self.primary_reads += 1
+            return self.primary
+
+        for _ in range(len(self.replicas)):
+            replica = next(self._round_robin)
+            if replica.healthy and replica.lag_seconds <= self.max_lag_seconds:
+                replica.reads += 1
+                return replica.engine
+
+        # 사용할 수 있는 replica가 없으면 primary로 대체
+        self.fallbacks += 1
+        return self.primary
+
+    def mark_unhealthy(self, replica_engine: AsyncEngine, error: Exception) -> None:
+        for replica in self.replicas:
+            if replica.engine is replica_engine:
+                replica.healthy = False
+                replica.last_error = str(error)
+                self.fallbacks += 1
+                logger.warning(f"Replica 사용 중 오류, 다음 상태 확인까지 제외: {replica.name}, {error}")
+
+    async def check_replicas(self) -> None:
+        for replica in self.replicas:
+            try:
+                async with replica.engine.connect() as conn:
+                    lag_seconds = float((await conn.execute(_REPLICATION_LAG_QUERY)).scalar() or 0)
+
+                if lag_seconds > self.max_lag_seconds:
+                    logger.warning(f"Replica 복제 지연으로 읽기 제외: {replica.name}, lag={lag_seconds:.1f}s")
+                elif not replica.healthy:
+                    logger.info(f"Replica 복구: {replica.name}")
+
+                replica.lag_seconds = lag_seconds
+                replica.healthy = True
+                replica.last_error = None
+
+            except Exception as e:
+                if replica.healthy:
+                    logger.warning(f"Replica 상태 확인 실패, 읽기 제외: {replica.name}, {e}")
+                replica.healthy = False
+                replica.last_error = str(e)
+
+    async def start(self) -> None:
+        if self.has_replicas and self._task is None:
+            await self.check_replicas()
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_check_seconds)
+            try:
+                await self.check_replicas()
+            except Exception as e:
+                logger.error(f"Replica 상태 확인 루프 오류: {e}")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def stats(self) -> dict:
+        return {
+            "primary_reads": self.primary_reads,
+            "fallbacks": self.fallbacks,
+            "sticky_keys": len(self._sticky_keys),
+            "replicas": [
+                {
+                    "name": replica.name,
+                    "healthy": replica.healthy,
+                    "lag_seconds": round(replica.lag_seconds, 3),
+                    "reads": replica.reads,
+                    "last_error": replica.last_error,
+                    "pool": pool_stats(replica.engine),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+
+# 프로세스 전역 라우터 (replica 설정이 없으면 모든 읽기가 primary)
+engine_router = EngineRouter(engine, DATABASE_REPLICA_URLS)
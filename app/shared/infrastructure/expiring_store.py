@@ -0,0 +1,121 @@
+"""
+만료 시각 기반 인메모리 저장소 - dict + 만료 시각 min-heap
+
+- 조회 시 만료된 항목은 없는 것으로 취급 (Redis의 지연 만료와 동일)
+- 쓰기마다 만료된 항목을 최대 N개씩 힙에서 꺼내 점진적으로 제거 (O(log n))
+- 최대 항목 수를 넘으면 가장 먼저 만료될 항목부터 제거 (Redis volatile-ttl 정책과 동일)
+  evict_live=False면 만료되지 않은 항목은 지우지 않고 새 키를 거부 (블랙리스트처럼 지워지면 안 되는 데이터)
+"""
+import heapq
+import time
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# 쓰기 1회당 함께 정리할 만료 항목 수
+_EVICTIONS_PER_WRITE = 32
+
+
+class ExpiringStore(Generic[K]):
+
+    def __init__(self, max_entries: int = 0, evict_live: bool = True):
+        self.max_entries = max_entries  # 0이면 제한 없음
+        self.evict_live = evict_live
+        self._entries: Dict[K, Tuple[Any, float]] = {}
+        # (만료 시각, 키) - 값이 갱신/삭제되면 힙 항목은 남겨두고 꺼낼 때 무시한다 (lazy deletion)
+        self._expiry_heap: List[Tuple[float, K]] = []
+        self.expired_evictions = 0
+        self.capacity_evictions = 0
+        self.rejected = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set(self, key: K, value: Any, expires_at: float) -> bool:
+        """
+        저장 여부를 반환 (evict_live=False이고 만료된 항목을 모두 정리해도 가득 차 있으면 새 키는 저장하지 않음)
+        """
+        self.evict_expired(limit=_EVICTIONS_PER_WRITE)
+        if not self.evict_live and self._is_full_for(key):
+            self.evict_expired()
+            if self._is_full_for(key):
+                self.rejected += 1
+                return False
+
+        self._entries[key] = (value, expires_at)
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+
+        if self.max_entries:
+            while len(self._entries) > self.max_entries:
+                if self._pop_soonest() is None:
+                    break
+                self.capacity_evictions += 1
+
+        # 갱신으로 쌓인 오래된 힙 항목이 너무 많으면 재구성
+        if len(self._expiry_heap) > 2 * len(self._entries) + _EVICTIONS_PER_WRITE:
+            self._expiry_heap = [(expires, key) for key, (_, expires) in self._entries.items()]
+            heapq.heapify(self._expiry_heap)
+        return True
+
+    def _is_full_for(self, key: K) -> bool:
+        # 기존 키 갱신은 항목 수가 늘지 않으므로 항상 허용
+        return bool(self.max_entries) and key not in self._entries and len(self._entries) >= self.max_entries
+
+    def get(self, key: K, now: Optional[float] = None) -> Optional[Any]:
+        entry = self._live_entry(key, now)
+        return entry[0] if entry is not None else None
+
+    def contains(self, key: K, now: Optional[float] = None) -> bool:
+        """
+        만료되지 않은 키가 있는지 (값이 None이어도 True - 존재 여부는 get 결과로 판단하지 않는다)
+        """
+        return self._live_entry(key, now) is not None
+
+    def _live_entry(self, key: K, now: Optional[float]) -> Optional[Tuple[Any, float]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if entry[1] <= (time.time() if now is None else now):
+            del self._entries[key]
+            self.expired_evictions += 1
+            return None
+        return entry
+
+    def delete(self, key: K) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def _pop_soonest(self) -> Optional[Tuple[K, float]]:
+        while self._expiry_heap:
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._entries[key]
+                return key, expires_at
+        return None
+
+    def evict_expired(self, now: Optional[float] = None, limit: Optional[int] = None) -> int:
+        now = time.time() if now is None else now
+        evicted = 0
+
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            if limit is not None and evicted >= limit:
+                break
+            expires_at, key = heapq.heappop(self._expiry_heap)
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._entries[key]
+                evicted += 1
+
+        self.expired_evictions += evicted
+        return evicted
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "heap_size": len(self._expiry_heap),
+            "expired_evictions": self.expired_evictions,
+            "capacity_evictions": self.capacity_evictions,
+            "rejected": self.rejected,
+        }
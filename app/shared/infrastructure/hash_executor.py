@@ -0,0 +1,171 @@
+"""
+비밀번호 해싱 전용 Executor - bcrypt 같은 CPU 바운드 작업을 이벤트 루프 밖에서 실행
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Optional
+
+from app.config.logger import logger
+from app.config.settings import PASSWORD_HASH_EXECUTOR, PASSWORD_HASH_MAX_WORKERS, PASSWORD_HASH_QUEUE_LIMIT
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+
+
+@dataclass
+class HashExecutorStats:
+    executor_type: str
+    max_workers: int
+    queue_limit: int
+    in_flight: int = 0
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+    total_queue_wait_seconds: float = 0.0
+    max_queue_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    @property
+    def avg_queue_wait_seconds(self) -> float:
+        finished = self.completed + self.failed
+        return self.total_queue_wait_seconds / finished if finished else 0.0
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["avg_queue_wait_seconds"] = self.avg_queue_wait_seconds
+        return data
+
+
+def _timed_call(func: Callable, submitted_at: float, *args) -> tuple[float, float, Any]:
+    """
+    워커에서 실행되는 래퍼 (프로세스 풀에서도 pickle 가능하도록 모듈 레벨 함수로 둔다)
+    time.monotonic()은 시스템 전역 시계라 프로세스 간 비교가 가능하다.
+    """
+    started_at = time.monotonic()
+    result = func(*args)
+    return started_at - submitted_at, time.monotonic() - started_at, result
+
+
+class PasswordHashExecutor:
+    """
+    최대 동시 실행 수(max_workers) + 대기열(queue_limit)로 제한된 해싱 Executor
+
+    - thread: bcrypt/argon2는 해싱 중 GIL을 해제하므로 기본값으로 충분
+    - process: GIL 해제가 안 되는 해셔를 쓸 때
+    - interpreter: Python 3.14 InterpreterPoolExecutor (없으면 thread로 대체)
+
+    대기열이 가득 차면 COMMON_SERVER_BUSY(503)로 즉시 거절한다.
+    """
+
+    def __init__(
+            self,
+            executor_type: str = PASSWORD_HASH_EXECUTOR,
+            max_workers: int = PASSWORD_HASH_MAX_WORKERS,
+            queue_limit: int = PASSWORD_HASH_QUEUE_LIMIT
+    ):
+        self.executor_type = executor_type
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self._executor: Optional[concurrent.futures.Executor] = None
+        self._lock = threading.Lock()
+        self._stats = HashExecutorStats(executor_type, max_workers, queue_limit)
+
+    def _create_executor(self) -> concurrent.futures.Executor:
+        if self.executor_type == "process":
+            return concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+
+        if self.executor_type == "interpreter":
+            interpreter_pool = getattr(concurrent.futures, "InterpreterPoolExecutor", None)
+            if interpreter_pool is not None:
+                return interpreter_pool(max_workers=self.max_workers)
+            logger.warning("InterpreterPoolExecutor를 지원하지 않는 Python 버전 - thread로 대체")
+            self.executor_type = self._stats.executor_type = "thread"
+
+        elif self.executor_type != "thread":
+            logger.warning(f"지원하지 않는 해싱 Executor 타입: {self.executor_type} - thread로 대체")
+            self.executor_type = self._stats.executor_type = "thread"
+
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="password-hash"
+        )
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+                    logger.info(
+                        f"비밀번호 해싱 Executor 초기화: type={self.executor_type}, "
+                        f"workers={self.max_workers}, queue_limit={self.queue_limit}"
+                    )
+        return self._executor
+
+    def _acquire_slot(self) -> None:
+        with self._lock:
+            if self._stats.in_flight >= self.max_workers + self.queue_limit:
+                self._stats.rejected += 1
+                in_flight = self._stats.in_flight
+            else:
+                self._stats.in_flight += 1
+                self._stats.submitted += 1
+                return
+
+        logger.warning(f"비밀번호 해싱 대기열 초과: in_flight={in_flight}")
+        raise APIException(
+            APIResponseCode.COMMON_SERVER_BUSY,
+            {"reason": "password_hash_queue_full", "in_flight": in_flight}
+        )
+
+    def _release_slot(self, queue_wait: float, run_time: float, failed: bool) -> None:
+        with self._lock:
+            self._stats.in_flight -= 1
+            if failed:
+                self._stats.failed += 1
+            else:
+                self._stats.completed += 1
+            self._stats.total_queue_wait_seconds += queue_wait
+            self._stats.max_queue_wait_seconds = max(self._stats.max_queue_wait_seconds, queue_wait)
+            self._stats.total_run_seconds += run_time
+
+    async def run(self, func: Callable, *args) -> Any:
+        self._acquire_slot()
+        submitted_at = time.monotonic()
+
+        try:
+            future = self._get_executor().submit(_timed_call, func, submitted_at, *args)
+        except BaseException:
+            self._release_slot(time.monotonic() - submitted_at, 0.0, failed=True)
+            raise
+
+        # 슬롯은 워커 작업이 실제로 끝났을 때 반납한다
+        # (요청이 취소되어도 이미 실행 중인 해싱은 계속되므로, 그 전에 반납하면 대기열 제한이 무너진다)
+        future.add_done_callback(lambda done: self._on_done(done, submitted_at))
+        _, _, result = await asyncio.wrap_future(future)
+        return result
+
+    def _on_done(self, future: concurrent.futures.Future, submitted_at: float) -> None:
+        if future.cancelled() or future.exception() is not None:
+            self._release_slot(time.monotonic() - submitted_at, 0.0, failed=True)
+            return
+        queue_wait, run_time, _ = future.result()
+        self._release_slot(queue_wait, run_time, failed=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._stats.to_dict()
+
+    async def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # 실행 중인 해싱이 끝날 때까지 기다리는 동안 이벤트 루프를 막지 않도록 별도 스레드에서 대기
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+            logger.info("비밀번호 해싱 Executor 종료")
+
+
+# 전역 해싱 Executor 인스턴스
+password_hash_executor = PasswordHashExecutor()
@@ -0,0 +1,169 @@
+"""
+JWT 비대칭 서명 키 관리 (EdDSA / ES256)
+
+- JWT_KEYS_DIR 아래의 PEM 파일을 시작 시 한 번 읽어 kid -> 키 딕셔너리로 보관 (검증 시 I/O 없이 O(1) 조회)
+  - <kid>.pem     : 개인키 (서명 + 검증)
+  - <kid>.pub.pem : 공개키 (검증만, 교체된 이전 키 보관용)
+- JWT_ACTIVE_KID 키로 서명하고, 나머지 키로 서명된 토큰도 만료 전까지 계속 검증된다.
+
+키 생성:
+    python -m app.shared.infrastructure.jwt_keys --algorithm EdDSA --kid 2026-10
+"""
+import argparse
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+from jwt.algorithms import get_default_algorithms
+
+from app.config.logger import logger
+from app.config.settings import JWT_ALGORITHM, JWT_KEYS_DIR, JWT_ACTIVE_KID
+
+ASYMMETRIC_ALGORITHMS = ("EdDSA", "ES256")
+
+_PRIVATE_KEY_SUFFIX = ".pem"
+_PUBLIC_KEY_SUFFIX = ".pub.pem"
+
+
+def is_asymmetric_algorithm(algorithm: str) -> bool:
+    return algorithm in ASYMMETRIC_ALGORITHMS
+
+
+@dataclass(frozen=True)
+class SigningKey:
+    kid: str
+    algorithm: str
+    public_key: Any
+    private_key: Optional[Any] = None
+
+    @property
+    def can_sign(self) -> bool:
+        return self.private_key is not None
+
+    def to_jwk(self) -> Dict[str, Any]:
+        jwk = get_default_algorithms()[self.algorithm].to_jwk(self.public_key, as_dict=True)
+        jwk.update({"kid": self.kid, "alg": self.algorithm, "use": "sig"})
+        return jwk
+
+
+def _matches_algorithm(algorithm: str, public_key: Any) -> bool:
+    if algorithm == "EdDSA":
+        return isinstance(public_key, ed25519.Ed25519PublicKey)
+    if algorithm == "ES256":
+        return isinstance(public_key, ec.EllipticCurvePublicKey) and isinstance(public_key.curve, ec.SECP256R1)
+    return False
+
+
+def _load_key_file(path: str, kid: str, algorithm: str) -> Optional[SigningKey]:
+    with open(path, "rb") as key_file:
+        pem = key_file.read()
+
+    if path.endswith(_PUBLIC_KEY_SUFFIX):
+        private_key = None
+        public_key = serialization.load_pem_public_key(pem)
+    else:
+        private_key = serialization.load_pem_private_key(pem, password=None)
+        public_key = private_key.public_key()
+
+    if not _matches_algorithm(algorithm, public_key):
+        logger.warning(f"JWT 키 알고리즘 불일치로 무시: kid={kid}, algorithm={algorithm}")
+        return None
+
+    return SigningKey(kid=kid, algorithm=algorithm, public_key=public_key, private_key=private_key)
+
+
+class JWTKeyRing:
+
+    def __init__(self, algorithm: str, keys: Dict[str, SigningKey], active_kid: Optional[str] = None):
+        self.algorithm = algorithm
+        self._keys = dict(keys)
+
+        signable_kids = sorted(kid for kid, key in self._keys.items() if key.can_sign)
+        self.active_kid = active_kid or (signable_kids[-1] if signable_kids else None)
+
+        if self.active_kid not in self._keys or not self._keys[self.active_kid].can_sign:
+            raise ValueError(f"서명에 사용할 개인키가 없습니다: kid={self.active_kid}")
+
+    @classmethod
+    def from_directory(cls, keys_dir: str, algorithm: str, active_kid: Optional[str] = None) -> "JWTKeyRing":
+        if not os.path.isdir(keys_dir):
+            raise ValueError(f"JWT 키 디렉토리가 없습니다: {keys_dir}")
+
+        keys: Dict[str, SigningKey] = {}
+        for file_name in sorted(os.listdir(keys_dir)):
+            if file_name.endswith(_PUBLIC_KEY_SUFFIX):
+                kid = file_name[:-len(_PUBLIC_KEY_SUFFIX)]
+            elif file_name.endswith(_PRIVATE_KEY_SUFFIX):
+                kid = file_name[:-len(_PRIVATE_KEY_SUFFIX)]
+            else:
+                continue
+
+            # 같은 kid의 개인키/공개키가 모두 있으면 개인키 우선
+            if kid in keys and keys[kid].can_sign:
+                continue
+
+            signing_key = _load_key_file(os.path.join(keys_dir, file_name), kid, algorithm)
+            if signing_key is not None:
+                keys[kid] = signing_key
+
+        key_ring = cls(algorithm, keys, active_kid)
+        logger.info(f"JWT 서명 키 로드 완료: algorithm={algorithm}, kids={list(keys)}, active={key_ring.active_kid}")
+        return key_ring
+
+    @property
+    def signing_key(self) -> SigningKey:
+        return self._keys[self.active_kid]
+
+    def get(self, kid: Optional[str]) -> Optional[SigningKey]:
+        return self._keys.get(kid) if kid else None
+
+    def jwks(self) -> Dict[str, Any]:
+        return {"keys": [key.to_jwk() for key in self._keys.values()]}
+
+
+@lru_cache(maxsize=1)
+def get_key_ring() -> JWTKeyRing:
+    """
+    프로세스당 한 번만 키 파일을 읽는다.
+    """
+    return JWTKeyRing.from_directory(JWT_KEYS_DIR, JWT_ALGORITHM, JWT_ACTIVE_KID)
+
+
+def generate_private_key(algorithm: str):
+    if algorithm == "EdDSA":
+        return ed25519.Ed25519PrivateKey.generate()
+    if algorithm == "ES256":
+        return ec.generate_private_key(ec.SECP256R1())
+    raise ValueError(f"지원하지 않는 비대칭 알고리즘: {algorithm}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="JWT 서명 키 생성")
+    parser.add_argument("--algorithm", choices=ASYMMETRIC_ALGORITHMS, default="EdDSA")
+    parser.add_argument("--kid", required=True, help="키 ID (파일 이름으로 사용, 예: 2026-10)")
+    parser.add_argument("--keys-dir", default=JWT_KEYS_DIR)
+    args = parser.parse_args()
+
+    os.makedirs(args.keys_dir, exist_ok=True)
+    path = os.path.join(args.keys_dir, f"{args.kid}{_PRIVATE_KEY_SUFFIX}")
+    if os.path.exists(path):
+        raise SystemExit(f"이미 존재하는 kid입니다: {path}")
+
+    pem = generate_private_key(args.algorithm).private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    with open(path, "wb") as key_file:
+        key_file.write(pem)
+    os.chmod(path, 0o600)
+
+    print(f"키 생성 완료: {path}")
+    print(f"새 키로 서명하려면 JWT_ACTIVE_KID={args.kid} 로 설정 (이전 키는 검증용으로 유지)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+비밀번호 해시 알고리즘/비용 설정 및 호스트 기준 비용 보정(calibration)
+
+CLI 사용법:
+    python -m app.shared.infrastructure.password_hashing --algorithm bcrypt --target-ms 250
+"""
+import argparse
+import statistics
+import time
+from dataclasses import dataclass, replace
+from typing import Callable
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.bcrypt import BcryptHasher
+
+from app.config.logger import logger
+from app.config.settings import PASSWORD_HASH_ALGORITHM, PASSWORD_HASH_BCRYPT_ROUNDS, PASSWORD_HASH_ARGON2_TIME_COST, \
+    PASSWORD_HASH_ARGON2_MEMORY_COST, PASSWORD_HASH_ARGON2_PARALLELISM
+
+try:
+    from pwdlib.hashers.argon2 import Argon2Hasher
+except ImportError:  # argon2-cffi 미설치 시 bcrypt만 사용
+    Argon2Hasher = None
+
+# 보정 결과가 보안 하한선 아래로 내려가지 않도록 제한
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+ARGON2_MIN_TIME_COST = 1
+ARGON2_MAX_TIME_COST = 10
+ARGON2_MIN_MEMORY_COST = 19456  # KiB (OWASP 권장 최소 19 MiB)
+
+_CALIBRATION_PASSWORD = "calibration-password"
+
+
+@dataclass(frozen=True)
+class PasswordHashParams:
+    algorithm: str = "bcrypt"  # bcrypt, argon2id
+    bcrypt_rounds: int = 12
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 4
+
+    @classmethod
+    def from_settings(cls) -> "PasswordHashParams":
+        return cls(
+            algorithm=PASSWORD_HASH_ALGORITHM,
+            bcrypt_rounds=PASSWORD_HASH_BCRYPT_ROUNDS,
+            argon2_time_cost=PASSWORD_HASH_ARGON2_TIME_COST,
+            argon2_memory_cost=PASSWORD_HASH_ARGON2_MEMORY_COST,
+            argon2_parallelism=PASSWORD_HASH_ARGON2_PARALLELISM,
+        )
+
+    def to_env(self) -> dict[str, str]:
+        return {
+            "PASSWORD_HASH_ALGORITHM": self.algorithm,
+            "PASSWORD_HASH_BCRYPT_ROUNDS": str(self.bcrypt_rounds),
+            "PASSWORD_HASH_ARGON2_TIME_COST": str(self.argon2_time_cost),
+            "PASSWORD_HASH_ARGON2_MEMORY_COST": str(self.argon2_memory_cost),
+            "PASSWORD_HASH_ARGON2_PARALLELISM": str(self.argon2_parallelism),
+        }
+
+
+def _bcrypt_hasher(params: PasswordHashParams) -> BcryptHasher:
+    return BcryptHasher(rounds=params.bcrypt_rounds)
+
+
+def _argon2_hasher(params: PasswordHashParams):
+    if Argon2Hasher is None:
+        raise RuntimeError("argon2id를 사용하려면 pwdlib[argon2] 설치가 필요합니다")
+    return Argon2Hasher(
+        time_cost=params.argon2_time_cost,
+        memory_cost=params.argon2_memory_cost,
+        parallelism=params.argon2_parallelism,
+    )
+
+
+def build_password_hash(params: PasswordHashParams) -> PasswordHash:
+    """
+    현재 알고리즘 해셔를 맨 앞에 두고, 나머지 알고리즘도 검증용으로 함께 등록한다.
+    (pwdlib은 첫 번째 해셔로만 해싱하고, verify_and_update 시 다른 해셔/비용이면 재해싱 결과를 돌려준다)
+    """
+    if params.algorithm == "argon2id":
+        return PasswordHash((_argon2_hasher(params), _bcrypt_hasher(params)))
+
+    if params.algorithm != "bcrypt":
+        logger.warning(f"지원하지 않는 비밀번호 해시 알고리즘: {params.algorithm} - bcrypt로 대체")
+        params = replace(params, algorithm="bcrypt")
+
+    hashers = [_bcrypt_hasher(params)]
+    if Argon2Hasher is not None:
+        hashers.append(_argon2_hasher(params))
+    return PasswordHash(tuple(hashers))
+
+
+def _measure_seconds(func: Callable[[], object], samples: int) -> float:
+    timings = []
+    for _ in range(samples):
+        started_at = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started_at)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(target_ms: float, samples: int = 3) -> int:
+    """
+    최소 라운드의 해싱 시간을 측정한 뒤, 라운드가 1 증가할 때마다 시간이 2배가 되는 특성으로
+    목표 시간을 넘지 않는 가장 큰 라운드를 고른다.
+    """
+    hasher = BcryptHasher(rounds=BCRYPT_MIN_ROUNDS)
+    base_seconds = _measure_seconds(lambda: hasher.hash(_CALIBRATION_PASSWORD), samples)
+
+    rounds = BCRYPT_MIN_ROUNDS
+    while rounds < BCRYPT_MAX_ROUNDS and base_seconds * 2 ** (rounds + 1 - BCRYPT_MIN_ROUNDS) * 1000 <= target_ms:
+        rounds += 1
+    return rounds
+
+
+def calibrate_argon2_time_cost(target_ms: float, memory_cost: int, parallelism: int, samples: int = 3) -> int:
+    """
+    메모리/병렬도는 고정하고, time_cost=1 측정값 기준으로 선형 추정해 time_cost를 고른다.
+    """
+    hasher = _argon2_hasher(PasswordHashParams(
+        algorithm="argon2id",
+        argon2_time_cost=1,
+        argon2_memory_cost=memory_cost,
+        argon2_parallelism=parallelism,
+    ))
+    base_seconds = _measure_seconds(lambda: hasher.hash(_CALIBRATION_PASSWORD), samples)
+
+    time_cost = int(target_ms / (base_seconds * 1000)) if base_seconds > 0 else ARGON2_MAX_TIME_COST
+    return min(max(time_cost, ARGON2_MIN_TIME_COST), ARGON2_MAX_TIME_COST)
+
+
+def calibrate(params: PasswordHashParams, target_ms: float) -> PasswordHashParams:
+    """
+    현재 호스트에서 목표 해싱 시간(target_ms)에 맞는 비용 파라미터를 계산한다.
+    """
+    if params.algorithm == "argon2id":
+        memory_cost = max(params.argon2_memory_cost, ARGON2_MIN_MEMORY_COST)
+        time_cost = calibrate_argon2_time_cost(target_ms, memory_cost, params.argon2_parallelism)
+        calibrated = replace(params, argon2_time_cost=time_cost, argon2_memory_cost=memory_cost)
+    else:
+        calibrated = replace(params, bcrypt_rounds=calibrate_bcrypt_rounds(target_ms))
+
+    logger.info(f"비밀번호 해시 비용 보정 완료 (목표 {target_ms}ms): {calibrated}")
+    return calibrated
+
+
+def main() -> None:
+    defaults = PasswordHashParams.from_settings()
+
+    parser = argparse.ArgumentParser(description="비밀번호 해시 비용 보정")
+    parser.add_argument("--algorithm", choices=["bcrypt", "argon2id"], default=defaults.algorithm)
+    parser.add_argument("--target-ms", type=float, default=250.0, help="해시 1회 목표 시간 (ms)")
+    parser.add_argument("--memory-cost", type=int, default=defaults.argon2_memory_cost, help="argon2 메모리 (KiB)")
+    parser.add_argument("--parallelism", type=int, default=defaults.argon2_parallelism, help="argon2 병렬도")
+    args = parser.parse_args()
+
+    params = replace(
+        defaults,
+        algorithm=args.algorithm,
+        argon2_memory_cost=args.memory_cost,
+        argon2_parallelism=args.parallelism,
+    )
+    calibrated = calibrate(params, args.target_ms)
+
+    context = build_password_hash(calibrated)
+    elapsed_ms = _measure_seconds(lambda: context.hash(_CALIBRATION_PASSWORD), 3) * 1000
+    print(f"# 측정된 해시 시간: {elapsed_ms:.1f}ms (목표 {args.target_ms}ms)")
+    for key, value in calibrated.to_env().items():
+        print(f"{key}={value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+DB 커넥션 풀 계측 - 연결 대기 시간 히스토그램, 연결 수명, 체크아웃 통계, 컴파일 캐시 적중률
+"""
+import bisect
+import threading
+import time
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+# 대기 시간 히스토그램 구간 상한 (ms), 마지막 구간은 그 이상 전부
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000)
+
+
+class PoolMetrics:
+
+    def __init__(self, buckets_ms=WAIT_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._wait_counts: List[int] = [0] * (len(self.buckets_ms) + 1)
+        self._wait_total_ms = 0.0
+        self._wait_max_ms = 0.0
+        self._connected_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.connects = 0
+        self.closes = 0
+        self.compiled_cache_hits = 0
+        self.compiled_cache_misses = 0
+
+    def observe_wait(self, wait_seconds: float, timed_out: bool = False) -> None:
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self._wait_counts[bisect.bisect_left(self.buckets_ms, wait_ms)] += 1
+            self._wait_total_ms += wait_ms
+            self._wait_max_ms = max(self._wait_max_ms, wait_ms)
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+
+    def observe_connect(self, dbapi_connection) -> None:
+        with self._lock:
+            self._connected_at[id(dbapi_connection)] = time.monotonic()
+            self.connects += 1
+
+    def observe_close(self, dbapi_connection) -> None:
+        with self._lock:
+            if self._connected_at.pop(id(dbapi_connection), None) is not None:
+                self.closes += 1
+
+    def observe_compiled_cache(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.compiled_cache_hits += 1
+            else:
+                self.compiled_cache_misses += 1
+
+    def snapshot(self) -> dict:
+        now = time.monotonic()
+        with self._lock:
+            waits = sum(self._wait_counts)
+            compiled = self.compiled_cache_hits + self.compiled_cache_misses
+            ages = [now - connected_at for connected_at in self._connected_at.values()]
+            labels = [f"<={bucket}ms" for bucket in self.buckets_ms] + [f">{self.buckets_ms[-1]}ms"]
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "closes": self.closes,
+                "wait_ms": {
+                    "avg": round(self._wait_total_ms / waits, 3) if waits else 0.0,
+                    "max": round(self._wait_max_ms, 3),
+                    "histogram": dict(zip(labels, self._wait_counts)),
+                },
+                "compiled_cache": {
+                    "hits": self.compiled_cache_hits,
+                    "misses": self.compiled_cache_misses,
+                    "hit_rate": round(self.compiled_cache_hits / compiled, 4) if compiled else 0.0,
+                },
+                "connection_age_seconds": {
+                    "count": len(ages),
+                    "avg": round(sum(ages) / len(ages), 1) if ages else 0.0,
+                    "max": round(max(ages), 1) if ages else 0.0,
+                },
+            }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    커넥션을 꺼낼 때(_do_get) 걸린 시간을 기록하는 풀
+    (dispose 후 재생성되는 풀도 같은 PoolMetrics를 이어서 사용)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.observe_wait(time.perf_counter() - started_at, timed_out=True)
+            raise
+        self.metrics.observe_wait(time.perf_counter() - started_at)
+        return connection
+
+
+def instrument_pool(sync_engine) -> None:
+    """
+    연결 생성/종료 이벤트로 연결 수명을, 실행 이벤트로 컴파일 캐시 적중 여부를 추적한다.
+    """
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        _metrics_of(sync_engine).observe_connect(dbapi_connection)
+
+    @event.listens_for(sync_engine.pool, "close")
+    def _on_close(dbapi_connection, connection_record):
+        _metrics_of(sync_engine).observe_close(dbapi_connection)
+
+    @event.listens_for(sync_engine.pool, "close_detached")
+    def _on_close_detached(dbapi_connection):
+        _metrics_of(sync_engine).observe_close(dbapi_connection)
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        # 캐시 키가 없는 문자열 SQL 등은 적중률 계산에서 제외
+        cache_hit = getattr(context, "cache_hit", None)
+        if cache_hit is CACHE_HIT or cache_hit is CACHE_MISS:
+            _metrics_of(sync_engine).observe_compiled_cache(cache_hit is CACHE_HIT)
+
+
+def _metrics_of(sync_engine) -> PoolMetrics:
+    return sync_engine.pool.metrics
+
+
+def pool_stats(async_engine) -> dict:
+    pool = async_engine.sync_engine.pool
+    stats = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        stats.update(metrics.snapshot())
+    return stats
@@ -0,0 +1,103 @@
+"""
+애플리케이션 전역 Redis 클라이언트 - lifespan에서 생성/종료하고 모든 Redis 사용처가 하나의 커넥션 풀을 공유
+"""
+from typing import Optional
+
+import redis.asyncio as redis
+
+from app.config.logger import logger
+from app.config.settings import REDIS_URL, REDIS_MAX_CONNECTIONS, REDIS_POOL_TIMEOUT_SECONDS, \
+    REDIS_SOCKET_TIMEOUT_SECONDS, REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS, REDIS_HEALTH_CHECK_INTERVAL_SECONDS
+
+
+class RedisClientManager:
+    """
+    - BlockingConnectionPool: 풀이 가득 차면 새 연결을 만들지 않고 pool_timeout까지 반납을 기다린다
+    - health_check_interval: 그 시간 이상 쉬던 연결은 사용 전에 PING으로 확인
+    - start 이전/close 이후 client 접근은 RuntimeError
+    """
+
+    def __init__(
+            self,
+            redis_url: str = REDIS_URL,
+            max_connections: int = REDIS_MAX_CONNECTIONS,
+            pool_timeout: float = REDIS_POOL_TIMEOUT_SECONDS,
+            socket_timeout: float = REDIS_SOCKET_TIMEOUT_SECONDS,
+            socket_connect_timeout: float = REDIS_SOCKET_CONNECT_TIMEOUT_SECONDS,
+            health_check_interval: int = REDIS_HEALTH_CHECK_INTERVAL_SECONDS
+    ):
+        self.redis_url = redis_url
+        self.max_connections = max_connections
+        self.pool_timeout = pool_timeout
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.health_check_interval = health_check_interval
+
+        self._pool: Optional[redis.BlockingConnectionPool] = None
+        self._client: Optional[redis.Redis] = None
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            raise RuntimeError("Redis 클라이언트가 초기화되지 않았습니다")
+        return self._client
+
+    @property
+    def is_started(self) -> bool:
+        return self._client is not None
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+
+        self._pool = redis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=self.max_connections,
+            timeout=self.pool_timeout,
+            socket_timeout=self.socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            health_check_interval=self.health_check_interval,
+            retry_on_timeout=True,
+            decode_responses=True
+        )
+        self._client = redis.Redis(connection_pool=self._pool)
+        logger.info(f"Redis 커넥션 풀 생성: {self.redis_url}, max_connections={self.max_connections}")
+
+    async def ping(self) -> bool:
+        try:
+            return bool(await self.client.ping())
+
+        except Exception as e:
+            logger.warning(f"Redis 상태 확인 실패: {e}")
+            return False
+
+    async def close(self) -> None:
+        if self._client is None:
+            return
+
+        client, pool = self._client, self._pool
+        self._client = None
+        self._pool = None
+
+        await client.aclose()
+        await pool.disconnect()
+        logger.info("Redis 커넥션 풀 종료")
+
+    def stats(self) -> dict:
+        if self._pool is None:
+            return {"started": False, "max_connections": self.max_connections}
+
+        in_use = len(getattr(self._pool, "_in_use_connections", ()))
+        # BlockingConnectionPool은 미리 채워둔 None 자리를 포함하므로 실제 연결만 센다
+        idle = sum(1 for connection in getattr(self._pool, "_available_connections", ()) if connection is not None)
+        return {
+            "started": True,
+            "max_connections": self.max_connections,
+            "in_use": in_use,
+            "idle": idle,
+            "usage_ratio": round(in_use / self.max_connections, 3) if self.max_connections else 0.0,
+        }
+
+
+# 프로세스 전역 매니저 (lifespan에서 start/close)
+redis_client_manager = RedisClientManager()
@@ -1,48 +1,48 @@
 import base64
-from datetime import datetime, timedelta
+import time
 from typing import Dict, Any, Optional, List
 
 import jwt
 from pwdlib import PasswordHash
-from pwdlib.hashers.bcrypt import BcryptHasher
 
 from app.config.logger import logger
 from app.config.settings import ACCESS_TOKEN_EXPIRE_MINUTES, REFRESH_TOKEN_EXPIRE_DAYS, JWT_SECRET_KEY, JWT_ALGORITHM, \
-    JWT_EXPIRE_HOURS
+    JWT_EXPIRE_HOURS, TOKEN_PROFILE, TOKEN_INCLUDE_EMAIL
 from app.shared.api.exceptions import APIException
 from app.shared.api.responses import APIResponseCode
+from app.shared.infrastructure.hash_executor import password_hash_executor
+from app.shared.infrastructure.jwt_keys import get_key_ring, is_asymmetric_algorithm
+from app.shared.infrastructure.password_hashing import PasswordHashParams, build_password_hash
+from app.shared.infrastructure.token_cache import verified_token_cache
+from app.shared.infrastructure.token_codec import CompactTokenCodec, build_compact_claims, expand_claims, new_jti
 
-# 비밀번호 해싱을 위한 컨텍스트
-pwd_context = PasswordHash((BcryptHasher(),))
+# 비밀번호 해싱을 위한 컨텍스트 (configure_password_hash로 교체 가능)
+pwd_context = build_password_hash(PasswordHashParams.from_settings())
 
 
 class JWTManager:
     def __init__(self, token_repository=None):
-        self.secret_key = _decode_secret_key(JWT_SECRET_KEY)
         self.algorithm = JWT_ALGORITHM
         self.expire_hours = JWT_EXPIRE_HOURS
         self.token_prefix = "Bearer "
+        self.token_profile = TOKEN_PROFILE
+
+        # EdDSA/ES256: kid별 키를 메모리에 올려둔 키링으로 서명/검증 (HS256은 공유 비밀키)
+        self.key_ring = get_key_ring() if is_asymmetric_algorithm(self.algorithm) else None
+        self.secret_key = None if self.key_ring else _decode_secret_key(JWT_SECRET_KEY)
+
+        # compact 프로필: 짧은 클레임 이름 + 전용 인코더, 쿠키 크기를 줄이기 위해 "Bearer " 프리픽스 생략
+        # (parse_token은 프리픽스 유무와 관계없이 처리하므로 기존 토큰도 그대로 검증된다)
+        self.compact_codec = CompactTokenCodec(
+            self.secret_key, self.algorithm, include_email=TOKEN_INCLUDE_EMAIL
+        ) if self.token_profile == "compact" and not self.key_ring else None
 
         # 블랙리스트 토큰 저장소
         self.token_repository = token_repository
 
     def create_token(self, user_id: int, user_email: str, roles: List[str] = None) -> str:
         try:
-            now = datetime.utcnow()
-            expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-
-            payload = {
-                "user_id": user_id,
-                "user_email": user_email,
-                "roles": roles or [],  # 역할 목록 추가
-                "token_type": "access",
-                "iat": now,
-                "exp": expire,
-                "iss": "fastapi-boilerplate"
-            }
-
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
-            return f"{self.token_prefix}{token}"
+            return self._encode_token(user_id, user_email, roles, "access", ACCESS_TOKEN_EXPIRE_MINUTES * 60)
 
         except Exception as e:
             logger.error(f"Access Token 생성 실패: {e}")
@@ -50,26 +50,71 @@ class JWTManager:
 
     def create_refresh_token(self, user_id: int, user_email: str, roles: List[str] = None) -> str:
         try:
-            now = datetime.utcnow()
-            expire = now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-
-            payload = {
-                "user_id": user_id,
-                "user_email": user_email,
-                "roles": roles or [],  # 역할 목록 추가
-                "token_type": "refresh",
-                "iat": now,
-                "exp": expire,
-                "iss": "fastapi-boilerplate"
-            }
-
-            token = jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
-            return f"{self.token_prefix}{token}"
+            return self._encode_token(user_id, user_email, roles, "refresh", REFRESH_TOKEN_EXPIRE_DAYS * 24 * 3600)
 
         except Exception as e:
             logger.error(f"Refresh Token 생성 실패: {e}")
             raise APIException(APIResponseCode.AUTH_TOKEN_INVALID)
 
+    def _encode_token(
+            self,
+            user_id: int,
+            user_email: Optional[str],
+            roles: Optional[List[str]],
+            token_type: str,
+            ttl_seconds: int
+    ) -> str:
+        if self.compact_codec:
+            return self.compact_codec.encode(user_id, user_email, roles, token_type, ttl_seconds)
+
+        now = int(time.time())
+        if self.token_profile == "compact":
+            email = user_email if TOKEN_INCLUDE_EMAIL else None
+            return self._sign(build_compact_claims(user_id, email, roles, token_type, ttl_seconds, now))
+
+        payload = {
+            "user_id": user_id,
+            "user_email": user_email,
+            "roles": roles or [],  # 역할 목록 추가
+            "token_type": token_type,
+            "iat": now,
+            "exp": now + ttl_seconds,
+            "iss": "fastapi-boilerplate",
+            "jti": new_jti()  # 폐기(블랙리스트) 키
+        }
+
+        return f"{self.token_prefix}{self._sign(payload)}"
+
+    def _sign(self, payload: Dict[str, Any]) -> str:
+        if self.key_ring:
+            signing_key = self.key_ring.signing_key
+            return jwt.encode(
+                payload,
+                signing_key.private_key,
+                algorithm=self.algorithm,
+                headers={"kid": signing_key.kid}
+            )
+        return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
+
+    def _decode(self, pure_token: str, options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        if self.key_ring:
+            # 헤더의 kid로 검증 키 조회 (I/O 없이 메모리 조회)
+            kid = jwt.get_unverified_header(pure_token).get("kid")
+            verifying_key = self.key_ring.get(kid)
+            if verifying_key is None:
+                raise jwt.InvalidTokenError(f"알 수 없는 kid: {kid}")
+            key = verifying_key.public_key
+        else:
+            key = self.secret_key
+
+        return expand_claims(jwt.decode(pure_token, key, algorithms=[self.algorithm], options=options))
+
+    def jwks(self) -> Dict[str, Any]:
+        """
+        검증용 공개키 목록 (HS256은 공개할 키가 없으므로 빈 목록)
+        """
+        return self.key_ring.jwks() if self.key_ring else {"keys": []}
+
     def parse_token(self, token: str) -> str:
         if token and token.startswith(self.token_prefix):
             return token[len(self.token_prefix):]
@@ -79,12 +124,14 @@ class JWTManager:
         try:
             pure_token = self.parse_token(token)
 
-            payload = jwt.decode(
-                pure_token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
+            # 이미 검증된 토큰이면 서명 검증/디코딩 생략 (캐시 항목은 exp가 지나면 제거됨, 복사본을 돌려줌)
+            cached_payload = verified_token_cache.get(pure_token)
+            if cached_payload is not None:
+                return cached_payload
+
+            payload = self._decode(pure_token)
 
+            verified_token_cache.put(pure_token, payload)
             return payload
 
         except jwt.ExpiredSignatureError:
@@ -107,6 +154,8 @@ class JWTManager:
         return payload.get("roles", [])
 
     async def blacklist_token(self, token: str) -> bool:
+        if token:
+            verified_token_cache.invalidate(self.parse_token(token))
         if self.token_repository:
             return await self.token_repository.blacklist_token(token)
         return True
@@ -124,32 +173,31 @@ class JWTManager:
 
         return payload
 
-    async def auto_refresh_access_token(self, expired_token: str) -> Optional[str]:
+    async def auto_refresh_access_token(self, expired_token: str, refresh_token: str) -> Optional[str]:
         try:
             # 1. 만료된 토큰에서 user_id, roles 추출 (만료 검증 무시)
-            payload = jwt.decode(
+            payload = self._decode(
                 self.parse_token(expired_token),
-                self.secret_key,
-                algorithms=[self.algorithm],
                 options={"verify_exp": False}  # 만료 검증 무시
             )
             user_id = payload.get("user_id")
-            user_email = payload.get("user_email")
+            user_email = payload.get("user_email")  # compact 프로필에서는 생략될 수 있음
             roles = payload.get("roles", [])
 
-            if not user_id or not user_email:
+            if not user_id:
                 return None
 
-            # 2. 저장된 Refresh Token 조회
-            if not self.token_repository:
+            # 2. 클라이언트가 보낸 Refresh Token이 저장된 토큰(digest)과 일치하는지 확인
+            if not self.token_repository or not refresh_token:
                 return None
 
-            refresh_token = await self.token_repository.get_user_refresh_token(user_id)
-            if not refresh_token:
+            if not await self.token_repository.is_user_refresh_token(user_id, refresh_token):
                 return None
 
             # 3. Refresh Token 검증
-            self.verify_refresh_token(refresh_token)
+            refresh_payload = self.verify_refresh_token(refresh_token)
+            if refresh_payload.get("user_id") != user_id:
+                return None
 
             # 4. 새 Access Token 생성 (roles 포함)
             new_access_token = self.create_token(user_id, user_email, roles)
@@ -172,9 +220,44 @@ def _decode_secret_key(encoded_key: str) -> bytes:
         return encoded_key.encode('utf-8')
 
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+def configure_password_hash(params: PasswordHashParams) -> None:
+    """
+    해시 알고리즘/비용 교체 (비용 보정 결과 적용 등)
+    기존 해시는 계속 검증되고, verify_and_update 시 새 설정으로 재해싱된다.
+    """
+    global pwd_context
+    pwd_context = build_password_hash(params)
+    logger.info(f"비밀번호 해시 설정 적용: {params}")
+
+
+def _hash_with(context: PasswordHash, password: str) -> str:
+    return context.hash(password)
+
+
+def _verify_and_update_with(
+        context: PasswordHash, plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    return context.verify_and_update(plain_password, hashed_password)
+
+
+def is_supported_password_hash(hashed_password: str) -> bool:
+    """
+    현재 설정된 해셔(bcrypt/argon2) 중 하나로 검증 가능한 해시인지 (이미 해싱된 값을 가져올 때)
+    """
+    return any(hasher.identify(hashed_password) for hasher in pwd_context.hashers)
+
+
+# 현재 컨텍스트를 인자로 넘겨 프로세스 풀 워커에서도 보정된 설정이 적용되도록 한다.
+async def hash_password_async(password: str) -> str:
+    """
+    이벤트 루프를 막지 않도록 해싱 전용 Executor에서 해싱
+    """
+    return await password_hash_executor.run(_hash_with, pwd_context, password)
 
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+async def verify_and_update_password_async(plain_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """
+    검증 성공 시 알고리즘이나 비용이 현재 설정과 다르면 새 해시를 함께 반환한다.
+    (검증 실패 또는 재해싱 불필요 시 두 번째 값은 None)
+    """
+    return await password_hash_executor.run(_verify_and_update_with, pwd_context, plain_password, hashed_password)
@@ -0,0 +1,105 @@
+"""
+검증된 JWT payload 캐시 - 같은 토큰의 서명 검증/디코딩을 반복하지 않기 위한 LRU 캐시
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config.settings import TOKEN_CACHE_ENABLED, TOKEN_CACHE_MAX_SIZE
+from app.shared.infrastructure.token_codec import token_digest
+
+
+class VerifiedTokenCache:
+    """
+    - 최대 max_size개까지 보관하고 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - 토큰의 exp가 지나면 조회 시점에 제거하므로 만료된 payload를 돌려주지 않는다
+    - 블랙리스트 등록(폐기) 시 invalidate로 즉시 제거
+    - 저장/조회 시 payload를 복사하므로 호출자가 roles 등을 수정해도 캐시된 값은 바뀌지 않는다
+
+    invalidate는 현재 프로세스의 캐시에만 적용된다. 다른 워커에는 폐기된 토큰의 payload가 exp까지 남을 수 있지만,
+    캐시는 서명 검증만 생략할 뿐이고 get_token_payload가 매 요청 블랙리스트를 따로 조회하므로 폐기된 토큰은 거부된다.
+    """
+
+    def __init__(self, max_size: int = TOKEN_CACHE_MAX_SIZE, enabled: bool = TOKEN_CACHE_ENABLED):
+        self.max_size = max_size
+        self.enabled = enabled and max_size > 0
+        self._entries: "OrderedDict[bytes, tuple[Dict[str, Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        key = token_digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            payload, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _copy_payload(payload)
+
+    def put(self, token: str, payload: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        expires_at = payload.get("exp")
+        if expires_at is None:
+            # exp가 없는 토큰은 폐기 시점을 알 수 없으므로 캐시하지 않는다
+            return
+
+        key = token_digest(token)
+        payload = _copy_payload(payload)
+        with self._lock:
+            self._entries[key] = (payload, float(expires_at))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, token: str) -> None:
+        with self._lock:
+            if self._entries.pop(token_digest(token), None) is not None:
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _copy_payload(value: Any) -> Any:
+    """
+    payload 깊은 복사 (JWT 클레임은 dict/list/스칼라뿐이라 copy.deepcopy보다 가볍게 처리)
+    """
+    if isinstance(value, dict):
+        return {key: _copy_payload(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_payload(item) for item in value]
+    return value
+
+
+# 프로세스 전역 캐시 (JWTManager 인스턴스가 요청마다 생성되어도 공유)
+verified_token_cache = VerifiedTokenCache()
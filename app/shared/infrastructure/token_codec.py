@@ -0,0 +1,175 @@
+"""
+Compact JWT 인코더 - 짧은 클레임 이름/정수 타임스탬프를 쓰고, 헤더 세그먼트와 HMAC 키 객체를 재사용
+토큰 식별자(jti / digest) 유틸리티
+"""
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+# compact 클레임 이름 -> 애플리케이션에서 사용하는 표준 클레임 이름
+COMPACT_CLAIM_NAMES = {
+    "uid": "user_id",
+    "em": "user_email",
+    "rl": "roles",
+    "typ": "token_type",
+}
+COMPACT_TOKEN_TYPES = {"a": "access", "r": "refresh"}
+_TOKEN_TYPE_CODES = {name: code for code, name in COMPACT_TOKEN_TYPES.items()}
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+
+
+def _b64url(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _json_bytes(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def new_jti() -> str:
+    """
+    토큰 고유 ID (96비트 난수, 16자)
+    """
+    return secrets.token_urlsafe(12)
+
+
+def strip_bearer(token: str) -> str:
+    return token[len("Bearer "):] if token.startswith("Bearer ") else token
+
+
+def token_digest(token: str) -> bytes:
+    """
+    토큰 원문 대신 저장/비교할 고정 길이(16바이트) digest
+    """
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def unverified_claims(token: str) -> Dict[str, Any]:
+    """
+    서명 검증 없이 payload만 읽는다. 이미 검증된 토큰의 저장소 키 계산 용도로만 사용할 것.
+    """
+    try:
+        payload_segment = strip_bearer(token).split(".")[1]
+        padded = payload_segment + "=" * (-len(payload_segment) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(padded))
+        return claims if isinstance(claims, dict) else {}
+    except (IndexError, ValueError, binascii.Error):
+        return {}
+
+
+def token_revocation_id(token: str) -> str:
+    """
+    폐기/저장 키로 쓸 토큰 식별자: jti가 있으면 jti, 없는 이전 토큰은 digest(hex, 32자)
+    """
+    pure_token = strip_bearer(token)
+    jti = unverified_claims(pure_token).get("jti")
+    if isinstance(jti, str) and jti:
+        return jti
+    return token_digest(pure_token).hex()
+
+
+def token_remaining_seconds(token: str, expires_at: Optional[datetime] = None, default_seconds: int = 0) -> int:
+    """
+    저장소 보관 기간(TTL) 계산: 명시한 만료 시각(UTC) > 토큰 exp 클레임 > 기본값 순으로 사용
+    (timezone 없는 expires_at은 UTC로 간주)
+    """
+    if expires_at:
+        if expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=timezone.utc)
+        return int((expires_at - datetime.now(timezone.utc)).total_seconds())
+
+    token_exp = unverified_claims(token).get("exp")
+    if token_exp:
+        return int(token_exp - time.time())
+    return default_seconds
+
+
+def is_compact_payload(payload: Dict[str, Any]) -> bool:
+    return "uid" in payload
+
+
+def expand_claims(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    compact payload를 표준 클레임 이름으로 변환 (표준 payload는 그대로 반환)
+    """
+    if not is_compact_payload(payload):
+        return payload
+
+    expanded = {COMPACT_CLAIM_NAMES.get(key, key): value for key, value in payload.items()}
+    expanded["token_type"] = COMPACT_TOKEN_TYPES.get(expanded.get("token_type"), expanded.get("token_type"))
+    expanded.setdefault("user_email", None)
+    expanded.setdefault("roles", [])
+    return expanded
+
+
+def build_compact_claims(
+        user_id: int,
+        user_email: Optional[str],
+        roles: Optional[List[str]],
+        token_type: str,
+        ttl_seconds: int,
+        now: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    비어 있는 값(이메일, 역할)은 생략해 토큰 크기를 줄인다.
+    """
+    issued_at = int(time.time()) if now is None else now
+    claims: Dict[str, Any] = {
+        "uid": user_id,
+        "typ": _TOKEN_TYPE_CODES.get(token_type, token_type),
+        "iat": issued_at,
+        "exp": issued_at + ttl_seconds,
+        "jti": new_jti(),
+    }
+    if user_email:
+        claims["em"] = user_email
+    if roles:
+        claims["rl"] = roles
+    return claims
+
+
+class CompactTokenCodec:
+    """
+    PyJWT의 범용 인코더 대신 고정 헤더/HMAC 전용으로 토큰을 서명한다.
+    - 헤더 세그먼트는 생성 시 한 번만 직렬화
+    - HMAC 키 패딩 계산을 생략하도록 키가 적용된 HMAC 객체를 copy()해서 사용
+    결과물은 표준 JWT라 jwt.decode로 그대로 검증할 수 있다.
+    """
+
+    def __init__(self, secret_key: bytes, algorithm: str = "HS256", include_email: bool = True):
+        if algorithm not in _HMAC_DIGESTS:
+            raise ValueError(f"compact 토큰은 HMAC 알고리즘만 지원합니다: {algorithm}")
+
+        self.algorithm = algorithm
+        self.include_email = include_email
+        self._header_segment = _b64url(_json_bytes({"alg": algorithm, "typ": "JWT"}))
+        self._hmac = hmac.new(secret_key, digestmod=_HMAC_DIGESTS[algorithm])
+
+    def sign(self, claims: Dict[str, Any]) -> str:
+        signing_input = self._header_segment + b"." + _b64url(_json_bytes(claims))
+        mac = self._hmac.copy()
+        mac.update(signing_input)
+        return (signing_input + b"." + _b64url(mac.digest())).decode("ascii")
+
+    def encode(
+            self,
+            user_id: int,
+            user_email: Optional[str],
+            roles: Optional[List[str]],
+            token_type: str,
+            ttl_seconds: int,
+            now: Optional[int] = None
+    ) -> str:
+        email = user_email if self.include_email else None
+        return self.sign(build_compact_claims(user_id, email, roles, token_type, ttl_seconds, now))
@@ -6,22 +6,25 @@ import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
+from fastapi import Depends
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.api.exceptions import APIException
 from app.shared.api.responses import APIResponseCode
 from app.shared.infrastructure.base import AsyncDBSession
+from app.shared.infrastructure.unit_of_work import UnitOfWork, get_unit_of_work
 
 logger = logging.getLogger(__name__)
 
 
-async def get_transaction_db() -> AsyncGenerator[AsyncSession, None]:
+def get_transaction_db(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> AsyncSession:
     """
     트랜잭션 DB 세션 의존성 주입 함수
 
     트랜잭션 적용 범위:
-    - get_transaction_db()를 호출한 곳
+    - 요청 전체 (요청 단위 Unit of Work의 세션을 그대로 돌려주므로
+      같은 요청에서 조회용으로 주입받은 세션과 동일한 세션/커넥션이다)
 
     사용법:
     ```python
@@ -29,12 +32,11 @@ async def get_transaction_db() -> AsyncGenerator[AsyncSession, None]:
     async def create_example(
         db: AsyncSession = Depends(get_transaction_db)
     ):
-        # db에 의존성을 주입한 순간 트랜잭션이 시작
+        # 첫 쿼리 시점에 커넥션을 가져오고 트랜잭션이 시작 (요청 종료 시 커밋)
         # Repository CUD 메소드에 db 파라미터로 전달
     ```
     """
-    async with transaction_context() as db:
-        yield db
+    return unit_of_work.session
 
 
 @asynccontextmanager
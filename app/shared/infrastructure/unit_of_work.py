@@ -0,0 +1,194 @@
+"""
+요청 단위 Unit of Work - 한 요청의 읽기/쓰기가 세션(커넥션) 하나를 공유
+
+- 세션은 첫 쿼리 시점에 풀에서 커넥션을 가져온다 (쿼리가 없는 요청은 커넥션을 쓰지 않음)
+- 요청이 정상 종료되면 커밋, 예외가 나면 롤백
+- 읽기 전용 모드는 BEGIN READ ONLY로 시작하고 종료 시 커밋 대신 롤백
+- execute_read는 EngineRouter가 고른 replica에서 실행 (이 요청에서 이미 쓰기를 시작했으면 primary 세션 사용)
+"""
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, List, Optional
+
+from fastapi import Depends
+from sqlalchemy import Executable, Result, Row
+from sqlalchemy.exc import SQLAlchemyError, OperationalError, InterfaceError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config.logger import logger
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+from app.shared.infrastructure.base import AsyncDBSession, AsyncReadOnlyDBSession
+from app.shared.infrastructure.engine_router import EngineRouter, engine_router
+
+
+class UnitOfWork:
+
+    def __init__(self, read_only: bool = False, router: EngineRouter = engine_router):
+        self.read_only = read_only
+        self.router = router
+        self._session: Optional[AsyncSession] = None
+        self._replica_session: Optional[AsyncSession] = None
+        self._written_keys: List[str] = []
+        self._after_commit: List[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            session_factory = AsyncReadOnlyDBSession if self.read_only else AsyncDBSession
+            self._session = session_factory()
+        return self._session
+
+    @property
+    def is_active(self) -> bool:
+        return self._session is not None and self._session.in_transaction()
+
+    @property
+    def has_writes(self) -> bool:
+        """
+        이 요청에서 쓰기를 시작했는지 (그렇다면 조회도 요청 세션에서 해야 커밋 전 변경이 보인다)
+        """
+        return self.is_active or bool(self._written_keys)
+
+    def read_session(self, sticky_key: Optional[str] = None) -> AsyncSession:
+        # 이 요청에서 primary 트랜잭션이 이미 열렸으면 같은 세션에서 읽는다 (read-your-writes)
+        if self.has_writes:
+            return self.session
+
+        reader = self.router.reader_engine(sticky_key)
+        if reader is self.router.primary:
+            return self.session
+
+        # replica 세션은 요청당 하나만 열고 이후 읽기에서 재사용
+        if self._replica_session is None:
+            self._replica_session = AsyncSession(bind=reader, expire_on_commit=False)
+        return self._replica_session
+
+    async def execute_read(
+            self, statement: Executable, params: Optional[dict] = None, sticky_key: Optional[str] = None
+    ) -> Result:
+        session = self.read_session(sticky_key)
+        if session is not self._replica_session:
+            return await session.execute(statement, params)
+
+        try:
+            return await session.execute(statement, params)
+
+        except (OperationalError, InterfaceError, OSError) as e:
+            # replica 연결 실패 시 제외 표시 후 primary에서 재시도
+            self.router.mark_unhealthy(session.bind, e)
+            await self._close_replica_session()
+            return await self.session.execute(statement, params)
+
+    async def stream_read(self, statement: Executable, yield_per: int) -> AsyncIterator[Row]:
+        """
+        server-side cursor로 yield_per 행씩 가져오며 한 행씩 돌려준다 (결과 전체를 메모리에 올리지 않음)
+
+        응답 스트리밍이 요청 처리보다 오래 이어질 수 있으므로 요청 세션과 별개의 연결을 사용하고,
+        PostgreSQL에서는 REPEATABLE READ READ ONLY 트랜잭션으로 내보내는 동안 같은 스냅샷을 본다.
+        """
+        async with self.router.reader_engine().connect() as conn:
+            if conn.dialect.name == "postgresql":
+                await conn.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True)
+            result = await conn.stream(statement.execution_options(yield_per=yield_per))
+            async for row in result:
+                yield row
+
+    def mark_written(self, sticky_key: str) -> None:
+        """
+        커밋 후 sticky_seconds 동안 같은 키의 읽기를 primary로 보내도록 기록
+        """
+        self._written_keys.append(sticky_key)
+
+    def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        커밋이 성공한 뒤 실행할 작업 등록 (캐시 무효화 등, 롤백되면 버림)
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        await self._close_replica_session()
+        if not self.is_active:
+            return
+        if self.read_only:
+            await self._session.rollback()
+            return
+        await self._session.commit()
+        logger.debug("트랜잭션 커밋 완료")
+
+        for sticky_key in self._written_keys:
+            self.router.mark_written(sticky_key)
+        self._written_keys.clear()
+
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                # 이미 커밋된 요청을 실패로 만들지 않는다
+                logger.warning(f"커밋 후 작업 실패: {e}")
+
+    async def rollback(self) -> None:
+        await self._close_replica_session()
+        self._written_keys.clear()
+        self._after_commit.clear()
+        if self.is_active:
+            await self._session.rollback()
+
+    async def _close_replica_session(self) -> None:
+        if self._replica_session is not None:
+            await self._replica_session.close()
+            self._replica_session = None
+
+    async def close(self) -> None:
+        await self._close_replica_session()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        try:
+            if exc is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        except SQLAlchemyError as e:
+            # 커밋 중 실패도 롤백 대상
+            exc = e
+            await self.rollback()
+        finally:
+            await self.close()
+
+        if isinstance(exc, SQLAlchemyError):
+            logger.error(f"DB 에러로 인한 롤백: {str(exc)}")
+            raise APIException(
+                APIResponseCode.TRANSACTION_ERROR,
+                {"original_error": str(exc), "error_type": "database_error"},
+            ) from exc
+        if exc is not None:
+            logger.error(f"예외 발생으로 인한 롤백: {str(exc)}")
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    요청 단위 Unit of Work 의존성 (FastAPI가 요청당 한 번만 생성해 모든 Depends에 공유)
+    """
+    async with UnitOfWork() as unit_of_work:
+        yield unit_of_work
+
+
+async def get_read_only_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    조회 전용 엔드포인트용 (쓰기 쿼리는 DB에서 거부됨)
+    """
+    async with UnitOfWork(read_only=True) as unit_of_work:
+        yield unit_of_work
+
+
+def get_session(unit_of_work: UnitOfWork = Depends(get_unit_of_work)) -> AsyncSession:
+    return unit_of_work.session
+
+
+def get_read_only_session(unit_of_work: UnitOfWork = Depends(get_read_only_unit_of_work)) -> AsyncSession:
+    return unit_of_work.session
@@ -0,0 +1,19 @@
+from typing import List
+
+from pydantic import BaseModel, EmailStr, Field, model_validator
+
+from app.config.settings import USER_BATCH_GET_MAX_KEYS
+
+
+class UserBatchGetRequest(BaseModel):
+    ids: List[int] = Field(default_factory=list, description="조회할 사용자 id")
+    emails: List[EmailStr] = Field(default_factory=list, description="조회할 사용자 이메일")
+
+    @model_validator(mode="after")
+    def check_key_count(self) -> "UserBatchGetRequest":
+        key_count = len(self.ids) + len(self.emails)
+        if key_count == 0:
+            raise ValueError("ids 또는 emails 중 하나 이상 필요합니다")
+        if key_count > USER_BATCH_GET_MAX_KEYS:
+            raise ValueError(f"한 번에 최대 {USER_BATCH_GET_MAX_KEYS}건까지 조회할 수 있습니다")
+        return self
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel
 
@@ -12,3 +12,15 @@ class UserResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     last_login: Optional[datetime]
+
+
+class UserListResponse(BaseModel):
+    items: List[UserResponse]
+    next_cursor: Optional[str]  # 다음 페이지 요청 시 cursor로 전달, 마지막 페이지면 null
+    approximate_total: int  # 통계 기반 근사값 (정확한 COUNT 아님)
+
+
+class UserBatchGetResponse(BaseModel):
+    items: List[UserResponse]  # 요청한 순서 (ids 먼저, 그다음 emails), 같은 사용자는 한 번만
+    missing_ids: List[int]
+    missing_emails: List[str]
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from app.shared.api.cursor import decode_cursor
+from app.shared.api.internal_routers import verify_internal_token
+from app.shared.api.responses import APIResponse, success_response, APIResponseCode
+from app.users.api.requests import UserBatchGetRequest
+from app.users.api.responses import UserBatchGetResponse, UserListResponse
+from app.users.api.user_api_mapper import UserApiMapper
+from app.users.api.user_export import EXPORT_FORMATS, encode_export
+from app.users.core.application.user_service import UserService
+from app.users.dependencies import get_read_only_user_service
+
+user_router = APIRouter(tags=["Users"])
+
+
+# 역할 모델이 생기기 전까지 다른 사용자 정보를 돌려주는 API(목록/일괄 조회/내보내기)는 내부 토큰(X-Internal-Token)으로만 허용
+@user_router.get("", response_model=APIResponse[UserListResponse], dependencies=[Depends(verify_internal_token)])
+async def list_users(
+        limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (없으면 첫 페이지)"),
+        is_active: Optional[bool] = Query(None, description="활성 여부 필터"),
+        user_service: UserService = Depends(get_read_only_user_service),
+):
+    """
+    가입일 최신순 사용자 목록 (keyset 페이지네이션 - 페이지 깊이와 무관하게 일정한 응답 시간)
+    """
+    after = decode_cursor(cursor) if cursor else None
+    page_output = await user_service.list_users(limit, after, is_active)
+
+    return success_response(APIResponseCode.OK, UserApiMapper.page_output_to_response(page_output))
+
+
+@user_router.post(
+    ":batchGet", response_model=APIResponse[UserBatchGetResponse], dependencies=[Depends(verify_internal_token)]
+)
+async def batch_get_users(
+        request: UserBatchGetRequest,
+        user_service: UserService = Depends(get_read_only_user_service),
+):
+    """
+    id/이메일 목록으로 여러 사용자를 한 번에 조회 (종류별로 = ANY 쿼리 한 번씩, 없는 키는 missing_*로 반환)
+    """
+    batch_output = await user_service.batch_get(request.ids, request.emails)
+
+    return success_response(APIResponseCode.OK, UserApiMapper.batch_output_to_response(batch_output))
+
+
+@user_router.get("/export", response_class=StreamingResponse, dependencies=[Depends(verify_internal_token)])
+async def export_users(
+        format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="ndjson 또는 csv"),
+        include_profile: bool = Query(False, description="프로필(bio, phone, avatar_url) 포함 여부"),
+        user_service: UserService = Depends(get_read_only_user_service),
+):
+    """
+    전체 사용자 내보내기 - server-side cursor로 읽으면서 바로 응답으로 흘려보낸다 (전체를 메모리에 올리지 않음)
+
+    Accept-Encoding: gzip이면 GZipMiddleware가 chunk 단위로 압축한다.
+    """
+    media_type, extension = EXPORT_FORMATS[format]
+    return StreamingResponse(
+        encode_export(user_service.export_users(include_profile), format, include_profile),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="users.{extension}"'},
+    )
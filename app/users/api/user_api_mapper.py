@@ -1,12 +1,14 @@
-from app.users.api.responses import UserResponse
-from app.users.core.application.outputs import UserCreateOutput
+from app.shared.api.cursor import encode_cursor
+from app.users.api.responses import UserBatchGetResponse, UserListResponse, UserResponse
+from app.users.core.application.outputs import UserBatchOutput, UserCreateOutput, UserOutput, UserPageOutput
 
 
 class UserApiMapper:
 
     @staticmethod
     def create_output_to_response(user_create_output: UserCreateOutput) -> UserResponse:
-        return UserResponse(
+        # 내부에서 검증된 값이므로 pydantic 검증 생략
+        return UserResponse.model_construct(
             id=user_create_output.id,
             email=user_create_output.email,
             name=user_create_output.name,
@@ -15,3 +17,31 @@ class UserApiMapper:
             updated_at=user_create_output.updated_at,
             last_login=user_create_output.last_login,
         )
+
+    @staticmethod
+    def output_to_response(user_output: UserOutput) -> UserResponse:
+        return UserResponse.model_construct(
+            id=user_output.id,
+            email=user_output.email,
+            name=user_output.name,
+            is_active=user_output.is_active,
+            created_at=user_output.created_at,
+            updated_at=user_output.updated_at,
+            last_login=user_output.last_login,
+        )
+
+    @staticmethod
+    def page_output_to_response(page_output: UserPageOutput) -> UserListResponse:
+        return UserListResponse.model_construct(
+            items=[UserApiMapper.output_to_response(user) for user in page_output.users],
+            next_cursor=encode_cursor(*page_output.next_key) if page_output.next_key else None,
+            approximate_total=page_output.approximate_total,
+        )
+
+    @staticmethod
+    def batch_output_to_response(batch_output: UserBatchOutput) -> UserBatchGetResponse:
+        return UserBatchGetResponse.model_construct(
+            items=[UserApiMapper.output_to_response(user) for user in batch_output.users],
+            missing_ids=batch_output.missing_ids,
+            missing_emails=batch_output.missing_emails,
+        )
@@ -0,0 +1,84 @@
+"""
+사용자 내보내기 응답 인코딩 - NDJSON/CSV를 한 행씩 만들어 일정 크기 chunk로 묶어 보낸다
+
+chunk가 너무 작으면 GZipMiddleware가 chunk마다 flush하면서 압축률과 처리량이 떨어지므로
+chunk_bytes 단위로 모아서 내보낸다 (메모리 사용량은 chunk 하나 크기로 일정).
+"""
+import csv
+import io
+import json
+from dataclasses import MISSING, fields
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, Tuple
+
+from app.config.settings import USER_EXPORT_CHUNK_BYTES
+from app.users.core.application.outputs import UserExportOutput
+
+# 컬럼은 UserExportOutput 필드 순서를 그대로 따른다 (기본값이 있는 필드 = include_profile일 때만 채워지는 프로필)
+USER_COLUMNS = tuple(field.name for field in fields(UserExportOutput) if field.default is MISSING)
+PROFILE_COLUMNS = tuple(field.name for field in fields(UserExportOutput) if field.default is not MISSING)
+# 형식 -> (media type, 파일 확장자)
+EXPORT_FORMATS: Dict[str, Tuple[str, str]] = {
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "csv": ("text/csv; charset=utf-8", "csv"),
+}
+
+
+def export_columns(include_profile: bool) -> Tuple[str, ...]:
+    return USER_COLUMNS + PROFILE_COLUMNS if include_profile else USER_COLUMNS
+
+
+def _to_text(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def _ndjson_encoder(columns: Tuple[str, ...]) -> Callable[[UserExportOutput], str]:
+    def encode(output: UserExportOutput) -> str:
+        return json.dumps(
+            {column: _to_text(getattr(output, column)) for column in columns},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ) + "\n"
+
+    return encode
+
+
+def _csv_encoder(columns: Tuple[str, ...]) -> Callable[[UserExportOutput], str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def encode(output: UserExportOutput) -> str:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow([_to_text(getattr(output, column)) for column in columns])
+        return buffer.getvalue()
+
+    return encode
+
+
+async def encode_export(
+        outputs: AsyncIterator[UserExportOutput],
+        export_format: str,
+        include_profile: bool,
+        chunk_bytes: int = USER_EXPORT_CHUNK_BYTES,
+) -> AsyncIterator[bytes]:
+    columns = export_columns(include_profile)
+    encode = _ndjson_encoder(columns) if export_format == "ndjson" else _csv_encoder(columns)
+
+    parts = []
+    size = 0
+    if export_format == "csv":
+        header = ",".join(columns) + "\r\n"
+        parts.append(header)
+        size += len(header)
+
+    async for output in outputs:
+        line = encode(output)
+        parts.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield "".join(parts).encode()
+            parts, size = [], 0
+
+    if parts:
+        yield "".join(parts).encode()
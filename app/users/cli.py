@@ -0,0 +1,105 @@
+"""
+사용자 관리 명령
+
+실행:
+    python -m app.users.cli import users.csv
+    python -m app.users.cli import users.ndjson --errors import_errors.ndjson --batch-size 10000
+    python -m app.users.cli export users.ndjson.gz --include-profile
+
+CSV는 헤더 행(email, password 또는 password_hash, name, bio, avatar_url, phone)이 필요하고,
+NDJSON은 한 줄에 같은 키를 가진 JSON 객체 하나씩 작성한다.
+내보내기는 GET /api/users/v1/export와 같은 형식이며, 경로가 .gz로 끝나면 gzip으로 압축해 저장한다.
+"""
+import argparse
+import asyncio
+import gzip
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+from app.config.logger import logger
+from app.config.settings import USER_IMPORT_BATCH_SIZE
+from app.shared.infrastructure.base import engine
+from app.shared.infrastructure.engine_router import engine_router
+from app.shared.infrastructure.hash_executor import password_hash_executor
+from app.shared.infrastructure.unit_of_work import UnitOfWork
+from app.users.api.user_export import EXPORT_FORMATS, encode_export
+from app.users.core.application.user_service import UserService
+from app.users.infrastructure.repository.postgres_user_repository import PostgresUserRepository
+from app.users.infrastructure.user_importer import IMPORT_FORMATS, ImportReport, RowError, UserImporter
+
+
+async def import_users(source: Path, import_format: str, errors_path: Optional[Path], batch_size: int) -> ImportReport:
+    importer = UserImporter(batch_size=batch_size)
+    error_file = errors_path.open("w", encoding="utf-8") if errors_path else None
+
+    def on_error(error: RowError) -> None:
+        if error_file is not None:
+            error_file.write(json.dumps(error.to_dict(), ensure_ascii=False) + "\n")
+
+    def on_progress(report: ImportReport) -> None:
+        logger.info(
+            f"가져오기 진행: {report.processed}행 처리, 추가 {report.inserted}, 기존 {report.existing}, "
+            f"오류 {report.invalid} ({report.rows_per_second:.0f}행/초)"
+        )
+
+    try:
+        # utf-8-sig: 스프레드시트에서 내보낸 CSV의 BOM 제거
+        with source.open("r", encoding="utf-8-sig", newline="") as lines:
+            return await importer.run(lines, import_format, on_error=on_error, on_progress=on_progress)
+    finally:
+        if error_file is not None:
+            error_file.close()
+        await password_hash_executor.shutdown()
+        await engine.dispose()
+
+
+async def export_users(target: Path, export_format: str, include_profile: bool) -> int:
+    user_service = UserService(PostgresUserRepository(UnitOfWork(read_only=True)))
+    open_target = gzip.open if target.suffix.lower() == ".gz" else open
+    written = 0
+    try:
+        with open_target(target, "wb") as output:
+            async for chunk in encode_export(user_service.export_users(include_profile), export_format, include_profile):
+                output.write(chunk)
+                written += len(chunk)
+        return written
+    finally:
+        await engine_router.stop()
+        await engine.dispose()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.users.cli", description="사용자 관리 명령")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_parser = commands.add_parser("import", help="CSV/NDJSON 파일에서 사용자 일괄 가져오기")
+    import_parser.add_argument("source", type=Path, help="가져올 파일 경로")
+    import_parser.add_argument("--format", choices=IMPORT_FORMATS, help="파일 형식 (기본: 확장자로 판단)")
+    import_parser.add_argument("--errors", type=Path, help="행별 오류 보고서(NDJSON) 저장 경로")
+    import_parser.add_argument("--batch-size", type=int, default=USER_IMPORT_BATCH_SIZE, help="COPY/병합 1회당 행 수")
+
+    export_parser = commands.add_parser("export", help="전체 사용자를 NDJSON/CSV 파일로 내보내기")
+    export_parser.add_argument("target", type=Path, help="저장할 파일 경로 (.gz로 끝나면 gzip 압축)")
+    export_parser.add_argument("--format", choices=tuple(EXPORT_FORMATS), help="파일 형식 (기본: 확장자로 판단)")
+    export_parser.add_argument("--include-profile", action="store_true", help="프로필(bio, phone, avatar_url) 포함")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "export":
+        suffixes = [suffix.lower() for suffix in args.target.suffixes]
+        export_format = args.format or ("csv" if ".csv" in suffixes else "ndjson")
+        written = asyncio.run(export_users(args.target, export_format, args.include_profile))
+        logger.info(f"사용자 내보내기 완료: {args.target} ({written} bytes, 압축 전)")
+        return 0
+
+    import_format = args.format or ("ndjson" if args.source.suffix.lower() in (".ndjson", ".jsonl") else "csv")
+    report = asyncio.run(import_users(args.source, import_format, args.errors, args.batch_size))
+
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+    return 1 if report.invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
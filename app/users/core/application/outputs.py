@@ -1,11 +1,10 @@
-from dataclasses import field
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
-from pydantic import BaseModel
 
-
-class UserCreateOutput(BaseModel):
+@dataclass(slots=True, frozen=True)
+class UserCreateOutput:
     id: Optional[int] = None
     email: str = ""
     password_hash: str = ""
@@ -15,3 +14,43 @@ class UserCreateOutput(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     last_login: Optional[datetime] = None
+
+
+@dataclass(slots=True, frozen=True)
+class UserOutput:
+    id: int
+    email: str
+    name: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    last_login: Optional[datetime]
+
+
+@dataclass(slots=True, frozen=True)
+class UserPageOutput:
+    users: List[UserOutput]
+    next_key: Optional[Tuple[datetime, int]]  # 다음 페이지 시작 키 (created_at, id), 마지막 페이지면 None
+    approximate_total: int
+
+
+@dataclass(slots=True, frozen=True)
+class UserBatchOutput:
+    users: List[UserOutput]  # 요청한 순서 (id 먼저, 그다음 이메일), 중복 제거
+    missing_ids: List[int]
+    missing_emails: List[str]
+
+
+@dataclass(slots=True, frozen=True)
+class UserExportOutput:
+    id: int
+    email: str
+    name: Optional[str]
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+    last_login: Optional[datetime]
+    # 프로필 (include_profile일 때만 채워짐)
+    bio: Optional[str] = None
+    phone: Optional[str] = None
+    avatar_url: Optional[str] = None
@@ -1,4 +1,4 @@
-from app.users.core.application.outputs import UserCreateOutput
+from app.users.core.application.outputs import UserCreateOutput, UserExportOutput, UserOutput
 from app.users.core.domain.user import User
 
 
@@ -16,3 +16,32 @@ class UserOutputMapper:
             updated_at=user.updated_at,
             last_login=user.last_login,
         )
+
+    @staticmethod
+    def domain_to_output(user: User) -> UserOutput:
+        # 비밀번호 해시 제외
+        return UserOutput(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login=user.last_login,
+        )
+
+    @staticmethod
+    def domain_to_export_output(user: User) -> UserExportOutput:
+        profile = user.profile
+        return UserExportOutput(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            is_active=user.is_active,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+            last_login=user.last_login,
+            bio=profile.bio if profile else None,
+            phone=profile.phone if profile else None,
+            avatar_url=profile.avatar_url if profile else None,
+        )
@@ -1,11 +1,18 @@
+from datetime import datetime
+from typing import AsyncIterator, Dict, Optional, Sequence, Tuple
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.logger import logger
-from app.shared.api.exceptions import APIException
-from app.shared.api.responses import APIResponseCode
-from app.shared.infrastructure.security import hash_password
+from app.shared.infrastructure.security import hash_password_async, verify_and_update_password_async
 from app.users.core.application.inputs import UserCreateInput
-from app.users.core.application.outputs import UserCreateOutput
+from app.users.core.application.outputs import (
+    UserBatchOutput,
+    UserCreateOutput,
+    UserExportOutput,
+    UserOutput,
+    UserPageOutput,
+)
 from app.users.core.application.user_output_mapper import UserOutputMapper
 from app.users.core.domain.user import User
 from app.users.core.interface.user_repository_port import UserRepositoryPort
@@ -17,17 +24,91 @@ class UserService:
         self.user_repository = user_repository
 
     async def create(self, db: AsyncSession, user_data: UserCreateInput) -> UserCreateOutput:
-        same_user = await self.user_repository.find_by_email(user_data.email)
-        if same_user:
-            logger.warning(f"이미 존재하는 이메일로 회원가입 시도: {user_data.email}")
-            raise APIException(APIResponseCode.USER_EMAIL_ALREADY_EXISTS)
-
-        password_hash = hash_password(user_data.password)
-        user_payload = {
-            "email": user_data.email,
-            "password_hash": password_hash,
-            "name": user_data.name or user_data.email.split("@")[0]
-        }
-
-        saved_user = await self.user_repository.create(db, User(**user_payload))
+        # 이메일 중복은 저장소의 INSERT ... ON CONFLICT에서 USER_EMAIL_ALREADY_EXISTS로 처리 (사전 조회 없음)
+        password_hash = await hash_password_async(user_data.password)
+        user = User(
+            email=user_data.email,
+            password_hash=password_hash,
+            name=user_data.name or user_data.email.split("@")[0]
+        )
+
+        saved_user = await self.user_repository.create(db, user)
         return UserOutputMapper.domain_to_create_output(saved_user)
+
+    async def list_users(
+            self, limit: int, after: Optional[Tuple[datetime, int]] = None, is_active: Optional[bool] = None
+    ) -> UserPageOutput:
+        # 한 명 더 조회해 다음 페이지가 있는지 판단 (별도 COUNT 없음)
+        users = await self.user_repository.find_page(limit + 1, after, is_active)
+        has_next = len(users) > limit
+        users = users[:limit]
+
+        return UserPageOutput(
+            users=[UserOutputMapper.domain_to_output(user) for user in users],
+            next_key=(users[-1].created_at, users[-1].id) if has_next else None,
+            approximate_total=await self.user_repository.estimate_count(is_active),
+        )
+
+    async def batch_get(self, user_ids: Sequence[int], emails: Sequence[str]) -> UserBatchOutput:
+        users_by_id = {user.id: user for user in await self.user_repository.find_many_by_ids(user_ids)}
+        users_by_email = {user.email: user for user in await self.user_repository.find_many_by_emails(emails)}
+
+        # 같은 사용자를 id와 이메일로 모두 요청해도 한 번만 담는다
+        found: Dict[int, User] = {}
+        missing_ids, missing_emails = [], []
+        for user_id in dict.fromkeys(user_ids):
+            user = users_by_id.get(user_id)
+            if user is None:
+                missing_ids.append(user_id)
+            else:
+                found.setdefault(user.id, user)
+        for email in dict.fromkeys(emails):
+            user = users_by_email.get(email)
+            if user is None:
+                missing_emails.append(email)
+            else:
+                found.setdefault(user.id, user)
+
+        return UserBatchOutput(
+            users=[UserOutputMapper.domain_to_output(user) for user in found.values()],
+            missing_ids=missing_ids,
+            missing_emails=missing_emails,
+        )
+
+    async def export_users(self, include_profile: bool = False) -> AsyncIterator[UserExportOutput]:
+        async for user in self.user_repository.stream_users(include_profile):
+            yield UserOutputMapper.domain_to_export_output(user)
+
+    async def record_login(self, user: User) -> None:
+        user.record_login()
+        await self.user_repository.record_login(user.id, user.last_login)
+
+    async def authenticate(self, db: AsyncSession, email: str, plain_password: str) -> Optional[UserOutput]:
+        """
+        이메일/비밀번호 확인 후 로그인 시각 기록 (사용자가 없거나 비활성 상태이거나 비밀번호가 틀리면 None)
+        """
+        user = await self.user_repository.find_by_email(email)
+        if user is None or not user.is_active:
+            return None
+        if not await self.verify_password(db, user, plain_password):
+            return None
+        await self.record_login(user)
+        return UserOutputMapper.domain_to_output(user)
+
+    async def verify_password(self, db: AsyncSession, user: User, plain_password: str) -> bool:
+        """
+        비밀번호 검증 후, 해시 알고리즘/비용이 현재 설정과 다르면 새 해시로 교체 저장한다.
+        """
+        if not user.is_password_set():
+            # 캐시에서 온 사용자는 해시가 없으므로 DB에서 읽어 온다
+            user.update_password(await self.user_repository.find_password_hash(user.id) or "")
+            if not user.is_password_set():
+                return False
+
+        is_valid, updated_hash = await verify_and_update_password_async(plain_password, user.password_hash)
+        if is_valid and updated_hash:
+            await self.user_repository.update_password_hash(db, user.id, user.email, updated_hash)
+            user.update_password(updated_hash)
+            logger.info(f"비밀번호 해시 재설정 완료: user_id={user.id}")
+
+        return is_valid
@@ -5,7 +5,7 @@ from typing import Optional, List
 from app.users.core.domain.user_profile import UserProfile
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     id: Optional[int] = None
     email: str = ""
@@ -19,10 +19,13 @@ class User:
     profile: Optional[UserProfile] = None
 
     def __post_init__(self):
-        if self.created_at is None:
-            self.created_at = datetime.now()
-        if self.updated_at is None:
-            self.updated_at = datetime.now()
+        # DB에서 읽은 객체는 두 값이 이미 있으므로 현재 시각을 구하지 않는다
+        if self.created_at is None or self.updated_at is None:
+            now = datetime.now()
+            if self.created_at is None:
+                self.created_at = now
+            if self.updated_at is None:
+                self.updated_at = now
 
     def update_name(self, new_name: str) -> None:
         self.name = new_name
@@ -3,11 +3,12 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     user_id: int = 0
     bio: Optional[str] = None
     phone: Optional[str] = None
+    avatar_url: Optional[str] = None
     additional_info: dict = field(default_factory=dict)
     updated_at: Optional[datetime] = None
 
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -10,8 +11,74 @@ class UserRepositoryPort(ABC):
 
     @abstractmethod
     async def create(self, transaction_session: AsyncSession, user: User) -> User:
+        """
+        이메일이 이미 있으면 USER_EMAIL_ALREADY_EXISTS, 커밋하지 않는다.
+        """
         pass
 
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[User]:
+        """
+        캐시를 거친 결과는 password_hash가 비어 있을 수 있다 (비밀번호 확인은 find_password_hash)
+        """
+        pass
+
+    @abstractmethod
+    async def find_password_hash(self, user_id: int) -> Optional[str]:
+        """
+        비밀번호 확인용 해시 조회 - 캐시를 거치지 않는다
+        """
+        pass
+
+    @abstractmethod
+    async def find_many_by_ids(self, user_ids: Sequence[int]) -> List[User]:
+        """
+        한 번의 쿼리로 여러 명 조회 (없는 id는 결과에서 빠지고, 순서는 보장하지 않음)
+        """
+        pass
+
+    @abstractmethod
+    async def find_many_by_emails(self, emails: Sequence[str]) -> List[User]:
+        """
+        한 번의 쿼리로 여러 명 조회 (없는 이메일은 결과에서 빠지고, 순서는 보장하지 않음)
+        """
+        pass
+
+    @abstractmethod
+    async def update_password_hash(
+            self, transaction_session: AsyncSession, user_id: int, email: str, password_hash: str
+    ) -> None:
+        """
+        email은 이후 이메일 조회가 변경을 보도록(read-your-writes, 캐시 무효화) 표시하는 데 쓴다.
+        """
+        pass
+
+    @abstractmethod
+    async def record_login(self, user_id: int, logged_in_at: datetime) -> None:
+        """
+        마지막 로그인 시각 기록 - 호출한 트랜잭션과 무관하게 나중에 일괄 반영될 수 있다.
+        """
+        pass
+
+    @abstractmethod
+    async def find_page(
+            self, limit: int, after: Optional[Tuple[datetime, int]] = None, is_active: Optional[bool] = None
+    ) -> List[User]:
+        """
+        (created_at, id) 내림차순으로 after 키 다음부터 최대 limit명 (keyset 페이지네이션)
+        """
+        pass
+
+    @abstractmethod
+    async def estimate_count(self, is_active: Optional[bool] = None) -> int:
+        """
+        통계 기반 근사 사용자 수 (COUNT(*) 없이)
+        """
+        pass
+
+    @abstractmethod
+    def stream_users(self, include_profile: bool = False) -> AsyncIterator[User]:
+        """
+        전체 사용자를 id 순으로 한 명씩 (결과 전체를 메모리에 올리지 않음)
+        """
         pass
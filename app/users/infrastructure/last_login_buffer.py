@@ -0,0 +1,211 @@
+"""
+마지막 로그인 시각 write-behind 버퍼
+
+- 로그인마다 UPDATE하지 않고 사용자별 최신 시각만 메모리에 모은다 (같은 사용자의 반복 로그인은 하나로 합침)
+- flush_seconds마다(또는 대기 건수가 max_pending을 넘으면 즉시) UPDATE ... FROM (VALUES ...) 한 번으로 반영
+- DB 반영 지연은 최대 flush_seconds (+ flush 소요 시간), 프로세스가 비정상 종료되면 대기 중인 값은 유실될 수 있다
+- 반영 실패 시 다음 주기에 다시 시도하고, 종료 시 lifespan에서 남은 값을 모두 반영
+"""
+import asyncio
+import bisect
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import DateTime, Integer, column, func, update, values
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.logger import logger
+from app.config.settings import (
+    USER_LAST_LOGIN_BATCH_SIZE,
+    USER_LAST_LOGIN_FLUSH_SECONDS,
+    USER_LAST_LOGIN_MAX_PENDING,
+    USER_LAST_LOGIN_WRITE_BEHIND,
+)
+from app.shared.infrastructure.base import engine
+from app.users.infrastructure.models import UserDB
+
+# 배치 크기 히스토그램 구간 상한, 마지막 구간은 그 이상 전부
+BATCH_SIZE_BUCKETS = (1, 10, 100, 1000, 10000)
+
+
+def build_bulk_update(rows: List[Tuple[int, datetime]]):
+    """
+    UPDATE tb_users SET last_login = GREATEST(tb_users.last_login, v.last_login), ...
+    FROM (VALUES (:id, :last_login), ...) AS v (id, last_login) WHERE tb_users.id = v.id
+
+    (반영이 늦게 도착해도 더 최근 값을 덮어쓰지 않도록 GREATEST 사용)
+    """
+    login_values = values(
+        column("id", Integer), column("last_login", DateTime), name="login_values"
+    ).data(rows)
+    return (
+        update(UserDB)
+        .where(UserDB.id == login_values.c.id)
+        .values(
+            last_login=func.greatest(UserDB.last_login, login_values.c.last_login),
+            updated_at=func.greatest(UserDB.updated_at, login_values.c.last_login),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+class LastLoginBuffer:
+
+    def __init__(
+            self,
+            db_engine: AsyncEngine = engine,
+            enabled: bool = USER_LAST_LOGIN_WRITE_BEHIND,
+            flush_seconds: float = USER_LAST_LOGIN_FLUSH_SECONDS,
+            batch_size: int = USER_LAST_LOGIN_BATCH_SIZE,
+            max_pending: int = USER_LAST_LOGIN_MAX_PENDING,
+    ):
+        self.engine = db_engine
+        self.enabled = enabled
+        self.flush_seconds = flush_seconds
+        self.batch_size = batch_size
+        self.max_pending = max_pending
+
+        self._pending: Dict[int, datetime] = {}
+        self._oldest_pending_at: Optional[float] = None
+        self._flush_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.recorded = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.rows_flushed = 0
+        self.failures = 0
+        self.max_batch_size = 0
+        self._batch_size_counts: List[int] = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+        self._max_staleness_seconds = 0.0
+        self._last_flush_ms = 0.0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def record(self, user_id: int, logged_in_at: datetime) -> None:
+        self.recorded += 1
+        previous = self._pending.get(user_id)
+        if previous is not None:
+            self.coalesced += 1
+            if previous >= logged_in_at:
+                return
+        elif self._oldest_pending_at is None:
+            self._oldest_pending_at = time.monotonic()
+
+        self._pending[user_id] = logged_in_at
+        if len(self._pending) >= self.max_pending:
+            self._wakeup.set()
+
+    async def write(self, rows: Iterable[Tuple[int, datetime]]) -> int:
+        """
+        batch_size씩 나눠 bulk UPDATE (버퍼를 거치지 않는 즉시 반영에도 사용)
+        """
+        rows = list(rows)
+        updated = 0
+        async with self.engine.begin() as conn:
+            for start in range(0, len(rows), self.batch_size):
+                result = await conn.execute(build_bulk_update(rows[start:start + self.batch_size]))
+                updated += result.rowcount
+        return updated
+
+    async def flush(self) -> int:
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            batch, self._pending = self._pending, {}
+            oldest_pending_at, self._oldest_pending_at = self._oldest_pending_at, None
+            started_at = time.perf_counter()
+            try:
+                await self.write(batch.items())
+
+            except Exception as e:
+                self.failures += 1
+                # 실패한 값은 그 사이 새로 기록된 값과 합쳐 다음 주기에 다시 시도
+                self._restore(batch, oldest_pending_at)
+                logger.error(f"마지막 로그인 시각 반영 실패 ({len(batch)}건, 다음 주기에 재시도): {e}")
+                return 0
+
+            except BaseException:
+                # 반영 중 취소(stop 등)되면 되돌려 두고 stop의 마지막 반영에서 다시 쓴다 (GREATEST라 중복 반영해도 무방)
+                self._restore(batch, oldest_pending_at)
+                raise
+
+            self._observe_flush(len(batch), oldest_pending_at, time.perf_counter() - started_at)
+            return len(batch)
+
+    def _restore(self, batch: Dict[int, datetime], oldest_pending_at: Optional[float]) -> None:
+        for user_id, logged_in_at in batch.items():
+            current = self._pending.get(user_id)
+            if current is None or current < logged_in_at:
+                self._pending[user_id] = logged_in_at
+        self._oldest_pending_at = oldest_pending_at or self._oldest_pending_at
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="last-login-flush")
+
+    async def stop(self) -> None:
+        """
+        주기 반영을 멈추고 남은 값을 모두 반영 (lifespan 종료 시, 취소로 중단된 반영분 포함)
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        pending = self.pending
+        if pending:
+            flushed = await self.flush()
+            logger.info(f"마지막 로그인 시각 종료 전 반영: {flushed}/{pending}건")
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    def _observe_flush(self, batch_size: int, oldest_pending_at: Optional[float], elapsed_seconds: float) -> None:
+        self.flushes += 1
+        self.rows_flushed += batch_size
+        self.max_batch_size = max(self.max_batch_size, batch_size)
+        self._batch_size_counts[bisect.bisect_left(BATCH_SIZE_BUCKETS, batch_size)] += 1
+        self._last_flush_ms = elapsed_seconds * 1000
+        if oldest_pending_at is not None:
+            self._max_staleness_seconds = max(self._max_staleness_seconds, time.monotonic() - oldest_pending_at)
+
+    def stats(self) -> dict:
+        labels = [f"<={bucket}" for bucket in BATCH_SIZE_BUCKETS] + [f">{BATCH_SIZE_BUCKETS[-1]}"]
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "pending": self.pending,
+            "recorded": self.recorded,
+            "coalesced": self.coalesced,
+            "flushes": self.flushes,
+            "rows_flushed": self.rows_flushed,
+            "failures": self.failures,
+            "batch_size": {
+                "avg": round(self.rows_flushed / self.flushes, 1) if self.flushes else 0.0,
+                "max": self.max_batch_size,
+                "histogram": dict(zip(labels, self._batch_size_counts)),
+            },
+            "last_flush_ms": round(self._last_flush_ms, 3),
+            "max_staleness_seconds": round(self._max_staleness_seconds, 3),
+        }
+
+
+# 프로세스 전역 버퍼 (lifespan에서 시작/종료)
+last_login_buffer = LastLoginBuffer()
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Integer, String, Boolean, DateTime, ForeignKey, Text, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.shared.infrastructure.base import Base
@@ -8,6 +8,10 @@ from app.shared.infrastructure.base import Base
 
 class UserDB(Base):
     __tablename__ = "tb_users"
+    __table_args__ = (
+        # 목록 keyset 페이지네이션 (created_at, id) 정렬/탐색용
+        Index("ix_tb_users_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     email: Mapped[str] = mapped_column(String(254), unique=True, nullable=False, comment="이메일")
@@ -0,0 +1,72 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.unit_of_work import UnitOfWork
+from app.users.core.domain.user import User
+from app.users.core.interface.user_repository_port import UserRepositoryPort
+from app.users.infrastructure.user_cache import UserCache, user_cache
+
+
+class CachedUserRepository(UserRepositoryPort):
+    """
+    UserRepositoryPort 구현체를 감싸 조회 결과를 캐시하는 decorator
+
+    쓰기 시 즉시 무효화하고, 커밋 후 한 번 더 무효화한다
+    (커밋 전에 다른 요청이 이전 값을 다시 채운 경우까지 제거)
+    """
+
+    def __init__(self, repository: UserRepositoryPort, unit_of_work: UnitOfWork, cache: UserCache = user_cache):
+        self._repository = repository
+        self._unit_of_work = unit_of_work
+        self._cache = cache
+
+    async def create(self, transaction_session: AsyncSession, user: User) -> User:
+        saved_user = await self._repository.create(transaction_session, user)
+        # 이 이메일로 캐시된 "없는 사용자"를 제거
+        await self._invalidate_email(saved_user.email)
+        return saved_user
+
+    async def find_by_email(self, email: str) -> Optional[User]:
+        # 이 요청에서 쓰기를 시작했으면 커밋 전 값을 읽어야 하므로 캐시를 거치지 않는다
+        if self._unit_of_work.is_active:
+            return await self._repository.find_by_email(email)
+        return await self._cache.get_by_email(email, lambda: self._repository.find_by_email(email))
+
+    async def find_password_hash(self, user_id: int) -> Optional[str]:
+        # 비밀번호 해시는 캐시(특히 Redis L2)에 두지 않는다
+        return await self._repository.find_password_hash(user_id)
+
+    async def find_many_by_ids(self, user_ids: Sequence[int]) -> List[User]:
+        # 일괄 조회는 이미 쿼리 하나이고 캐시는 이메일 단위라 거치지 않는다
+        return await self._repository.find_many_by_ids(user_ids)
+
+    async def find_many_by_emails(self, emails: Sequence[str]) -> List[User]:
+        return await self._repository.find_many_by_emails(emails)
+
+    async def update_password_hash(
+            self, transaction_session: AsyncSession, user_id: int, email: str, password_hash: str
+    ) -> None:
+        await self._repository.update_password_hash(transaction_session, user_id, email, password_hash)
+        await self._invalidate_email(email)
+
+    async def record_login(self, user_id: int, logged_in_at: datetime) -> None:
+        # 로그인 시각은 일괄 반영되므로 캐시 값의 last_login은 캐시 TTL만큼 늦게 보일 수 있다 (무효화하지 않음)
+        await self._repository.record_login(user_id, logged_in_at)
+
+    async def find_page(
+            self, limit: int, after: Optional[Tuple[datetime, int]] = None, is_active: Optional[bool] = None
+    ) -> List[User]:
+        # 목록은 키 조합이 많고 적중률이 낮아 캐시하지 않는다
+        return await self._repository.find_page(limit, after, is_active)
+
+    async def estimate_count(self, is_active: Optional[bool] = None) -> int:
+        return await self._repository.estimate_count(is_active)
+
+    def stream_users(self, include_profile: bool = False) -> AsyncIterator[User]:
+        return self._repository.stream_users(include_profile)
+
+    async def _invalidate_email(self, email: str) -> None:
+        await self._cache.invalidate_email(email)
+        self._unit_of_work.after_commit(lambda: self._cache.invalidate_email(email))
@@ -1,47 +1,311 @@
-from typing import Optional
+import dataclasses
+from datetime import datetime
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import any_, bindparam, func, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config.logger import logger
+from app.config.settings import USER_EXPORT_FETCH_SIZE, USER_LOADER_ENABLED, USER_LOADER_MAX_BATCH_SIZE
 from app.shared.api.exceptions import APIException
 from app.shared.api.responses import APIResponseCode
+from app.shared.infrastructure.batch_loader import BatchLoader
+from app.shared.infrastructure.unit_of_work import UnitOfWork
 from app.users.core.domain.user import User
 from app.users.core.interface.user_repository_port import UserRepositoryPort
-from app.users.infrastructure.models import UserDB
+from app.users.infrastructure.last_login_buffer import LastLoginBuffer, last_login_buffer
+from app.users.infrastructure.models import UserDB, UserDBProfile
 from app.users.infrastructure.user_db_mapper import UserDBMapper
 
+# 자주 실행되는 쿼리는 모듈 로드 시 한 번만 구성하고 값은 bindparam으로 넘긴다
+# (호출마다 구문 트리/캐시 키를 다시 만들지 않고, 엔진의 컴파일 캐시와 asyncpg prepared statement를 재사용)
+_INSERT_USER = (
+    insert(UserDB)
+    .on_conflict_do_nothing(index_elements=[UserDB.email])
+    .returning(*UserDBMapper.COLUMNS)
+)
+_UPDATE_PASSWORD_HASH = (
+    update(UserDB)
+    .where(UserDB.id == bindparam("user_id"))
+    .values(password_hash=bindparam("new_password_hash"), updated_at=bindparam("now"))
+    .execution_options(synchronize_session=False)
+)
+# 조회는 필요한 컬럼만 가져와 ORM 객체를 거치지 않고 도메인 객체로 변환
+_FIND_BY_EMAIL = select(*UserDBMapper.COLUMNS).where(UserDB.email == bindparam("email"))
+_FIND_PASSWORD_HASH = select(UserDB.password_hash).where(UserDB.id == bindparam("user_id"))
+# 여러 건 조회는 배열 파라미터 하나로 (= ANY($1)) - IN (...)과 달리 키 개수와 무관하게 같은 prepared statement 재사용
+_FIND_MANY_BY_IDS = select(*UserDBMapper.COLUMNS).where(
+    UserDB.id == any_(bindparam("user_ids", type_=ARRAY(UserDB.id.type)))
+)
+_FIND_MANY_BY_EMAILS = select(*UserDBMapper.COLUMNS).where(
+    UserDB.email == any_(bindparam("emails", type_=ARRAY(UserDB.email.type)))
+)
+
+
+def _build_page_query(after: bool, filter_active: bool):
+    # (created_at, id) 행 값 비교로 인덱스를 이어서 탐색하므로 페이지 깊이와 무관하게 일정한 비용
+    statement = (
+        select(*UserDBMapper.COLUMNS)
+        .order_by(UserDB.created_at.desc(), UserDB.id.desc())
+        .limit(bindparam("limit"))
+    )
+    if after:
+        statement = statement.where(
+            tuple_(UserDB.created_at, UserDB.id) < tuple_(
+                bindparam("after_created_at", type_=UserDB.created_at.type),
+                bindparam("after_id", type_=UserDB.id.type),
+            )
+        )
+    if filter_active:
+        statement = statement.where(UserDB.is_active == bindparam("is_active"))
+    return statement
+
+
+# (after 키 유무, is_active 필터 유무) 조합별로 미리 구성
+_FIND_PAGE = {
+    (after, filter_active): _build_page_query(after, filter_active)
+    for after in (False, True)
+    for filter_active in (False, True)
+}
+# 내보내기 (server-side cursor로 순회)
+_STREAM_USERS = select(*UserDBMapper.COLUMNS).order_by(UserDB.id)
+_STREAM_USERS_WITH_PROFILE = (
+    select(*UserDBMapper.COLUMNS, *UserDBMapper.PROFILE_COLUMNS)
+    .outerjoin(UserDBProfile, UserDBProfile.user_id == UserDB.id)
+    .order_by(UserDB.id)
+)
+# 마지막 ANALYZE/autovacuum 기준 행 수와 is_active 값 분포 (테이블 전체를 세지 않음)
+_ESTIMATE_COUNT = text(f"""
+    SELECT c.reltuples::bigint AS estimate,
+           s.most_common_vals::text AS common_values,
+           s.most_common_freqs AS common_freqs
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    LEFT JOIN pg_stats s ON s.schemaname = n.nspname AND s.tablename = c.relname AND s.attname = 'is_active'
+    WHERE c.oid = to_regclass('{UserDB.__tablename__}')
+""")
+
+
+async def _load_users_by_email(emails: List[str]) -> Dict[str, User]:
+    """
+    여러 요청에서 모인 이메일 단건 조회를 한 번에 실행 (특정 요청의 세션이 아닌 별도 읽기 전용 Unit of Work 사용)
+    """
+    async with UnitOfWork(read_only=True) as unit_of_work:
+        result = await unit_of_work.execute_read(_FIND_MANY_BY_EMAILS, {"emails": emails})
+        return {row.email: UserDBMapper.row_to_domain(row) for row in result}
+
+
+# 프로세스 전역 이메일 조회 loader (USER_LOADER_ENABLED=false면 요청마다 단건 조회)
+user_email_loader: Optional[BatchLoader[str, User]] = (
+    BatchLoader("user-email-loader", _load_users_by_email, USER_LOADER_MAX_BATCH_SIZE) if USER_LOADER_ENABLED else None
+)
+
 
 class PostgresUserRepository(UserRepositoryPort):
 
-    def __init__(self, session: AsyncSession):
-        self._read_session = session
+    def __init__(
+            self,
+            unit_of_work: UnitOfWork,
+            login_buffer: LastLoginBuffer = last_login_buffer,
+            email_loader: Optional[BatchLoader[str, User]] = user_email_loader,
+    ):
+        # 조회는 Unit of Work를 통해 replica로 라우팅 (쓰기 직후에는 primary)
+        self._unit_of_work = unit_of_work
+        self._login_buffer = login_buffer
+        self._email_loader = email_loader
 
     async def create(self, transaction_session: AsyncSession, user: User) -> User:
+        """
+        INSERT ... ON CONFLICT (email) DO NOTHING RETURNING 한 번으로 중복 확인과 생성을 처리한다.
+        커밋은 트랜잭션을 연 쪽(요청 단위 Unit of Work)에서 담당한다.
+        """
         try:
-            user_db = UserDBMapper.domain_to_db(user)
-            transaction_session.add(user_db)
-            await transaction_session.commit()
-            await transaction_session.refresh(user_db)
-
-            return UserDBMapper.db_to_domain(user_db)
+            result = await transaction_session.execute(_INSERT_USER, UserDBMapper.domain_to_insert_values(user))
+            row = result.one_or_none()
 
-        except Exception as e:
+        except SQLAlchemyError as e:
             logger.error(f"사용자 생성 실패: {e}")
             raise APIException(APIResponseCode.USER_CREATION_FAILED)
 
+        # 충돌로 삽입되지 않으면 반환 행이 없다
+        if row is None:
+            logger.warning(f"이미 존재하는 이메일로 회원가입 시도: {user.email}")
+            raise APIException(APIResponseCode.USER_EMAIL_ALREADY_EXISTS)
+
+        self._unit_of_work.mark_written(_email_key(user.email))
+        return UserDBMapper.row_to_domain(row)
+
+    async def update_password_hash(
+            self, transaction_session: AsyncSession, user_id: int, email: str, password_hash: str
+    ) -> None:
+        try:
+            await transaction_session.execute(
+                _UPDATE_PASSWORD_HASH,
+                {"user_id": user_id, "new_password_hash": password_hash, "now": datetime.now()}
+            )
+            # 조회 경로(find_by_email)가 확인하는 이메일 키와 id 키를 함께 표시
+            self._unit_of_work.mark_written(_email_key(email))
+            self._unit_of_work.mark_written(_id_key(user_id))
+
+        except SQLAlchemyError as e:
+            logger.error(f"비밀번호 해시 갱신 실패: {e}")
+            raise APIException(APIResponseCode.USER_UPDATE_FAILED)
+
+    async def record_login(self, user_id: int, logged_in_at: datetime) -> None:
+        # 로그인마다 UPDATE하지 않고 버퍼에 모아 주기적으로 일괄 반영
+        if self._login_buffer.enabled:
+            self._login_buffer.record(user_id, logged_in_at)
+            return
+
+        try:
+            await self._login_buffer.write([(user_id, logged_in_at)])
+        except SQLAlchemyError as e:
+            logger.error(f"마지막 로그인 시각 갱신 실패: {e}")
+            raise APIException(APIResponseCode.USER_UPDATE_FAILED)
+
+    async def find_page(
+            self, limit: int, after: Optional[Tuple[datetime, int]] = None, is_active: Optional[bool] = None
+    ) -> List[User]:
+        params = {"limit": limit}
+        if after is not None:
+            params["after_created_at"], params["after_id"] = after
+        if is_active is not None:
+            params["is_active"] = is_active
+
+        try:
+            result = await self._unit_of_work.execute_read(_FIND_PAGE[(after is not None, is_active is not None)], params)
+            return [UserDBMapper.row_to_domain(row) for row in result]
+
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 목록 조회 실패: {e}")
+            raise
+
+    async def estimate_count(self, is_active: Optional[bool] = None) -> int:
+        try:
+            row = (await self._unit_of_work.execute_read(_ESTIMATE_COUNT)).one_or_none()
+            # reltuples < 0: 아직 ANALYZE 되지 않은 테이블 (PostgreSQL 14+)
+            if row is not None and row.estimate >= 0:
+                if is_active is None:
+                    return row.estimate
+                ratio = _active_ratio(row.common_values, row.common_freqs, is_active)
+                if ratio is not None:
+                    return round(row.estimate * ratio)
+
+            # 통계가 없을 때(새 테이블 등, 보통 작음)만 실제로 센다
+            statement = select(func.count()).select_from(UserDB)
+            if is_active is not None:
+                statement = statement.where(UserDB.is_active == is_active)
+            return (await self._unit_of_work.execute_read(statement)).scalar_one()
+
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 수 추정 실패: {e}")
+            raise
+
+    async def stream_users(self, include_profile: bool = False) -> AsyncIterator[User]:
+        if include_profile:
+            statement, to_domain = _STREAM_USERS_WITH_PROFILE, UserDBMapper.row_to_domain_with_profile
+        else:
+            statement, to_domain = _STREAM_USERS, UserDBMapper.row_to_domain
+
+        try:
+            async for row in self._unit_of_work.stream_read(statement, USER_EXPORT_FETCH_SIZE):
+                yield to_domain(row)
+
+        except SQLAlchemyError as e:
+            # 응답 전송 중이면 상태 코드를 바꿀 수 없으므로 연결이 끊겨 잘린 응답으로 전달된다
+            logger.error(f"사용자 내보내기 조회 실패: {e}")
+            raise
+
     async def find_by_email(self, email: str) -> Optional[User]:
+        sticky_key = _email_key(email)
+        # 이 요청의 쓰기나 최근 쓰기를 봐야 하는 조회는 모으지 않고 요청 세션/primary에서 바로 조회
+        if (
+                self._email_loader is not None
+                and not self._unit_of_work.has_writes
+                and not self._unit_of_work.router.is_sticky(sticky_key)
+        ):
+            user = await self._email_loader.load(email)
+            # 같은 이메일을 동시에 조회한 요청끼리 같은 객체를 공유하지 않도록 복사
+            return dataclasses.replace(user, roles=list(user.roles)) if user else None
+
         try:
-            result = await self._read_session.execute(
-                select(UserDB)
-                .where(UserDB.email == email)
+            result = await self._unit_of_work.execute_read(
+                _FIND_BY_EMAIL, {"email": email}, sticky_key=sticky_key
             )
-            user = result.scalar_one_or_none()
-            if user is None:
+            row = result.one_or_none()
+            if row is None:
                 return None
-            return UserDBMapper.db_to_domain(user)
+            return UserDBMapper.row_to_domain(row)
 
         except SQLAlchemyError as e:
             logger.error(f"사용자 이메일 조회 실패: {e}")
             raise
+
+    async def find_password_hash(self, user_id: int) -> Optional[str]:
+        try:
+            result = await self._unit_of_work.execute_read(
+                _FIND_PASSWORD_HASH, {"user_id": user_id}, sticky_key=_id_key(user_id)
+            )
+            return result.scalar_one_or_none()
+
+        except SQLAlchemyError as e:
+            logger.error(f"비밀번호 해시 조회 실패: {e}")
+            raise
+
+    async def find_many_by_ids(self, user_ids: Sequence[int]) -> List[User]:
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            return []
+        try:
+            result = await self._unit_of_work.execute_read(
+                _FIND_MANY_BY_IDS, {"user_ids": user_ids}, sticky_key=self._sticky_key(map(_id_key, user_ids))
+            )
+            return [UserDBMapper.row_to_domain(row) for row in result]
+
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 id 일괄 조회 실패 ({len(user_ids)}건): {e}")
+            raise
+
+    async def find_many_by_emails(self, emails: Sequence[str]) -> List[User]:
+        emails = list(dict.fromkeys(emails))
+        if not emails:
+            return []
+        try:
+            result = await self._unit_of_work.execute_read(
+                _FIND_MANY_BY_EMAILS, {"emails": emails}, sticky_key=self._sticky_key(map(_email_key, emails))
+            )
+            return [UserDBMapper.row_to_domain(row) for row in result]
+
+        except SQLAlchemyError as e:
+            logger.error(f"사용자 이메일 일괄 조회 실패 ({len(emails)}건): {e}")
+            raise
+
+    def _sticky_key(self, keys: Iterable[str]) -> Optional[str]:
+        # 최근 쓰기가 있는 키가 하나라도 있으면 그 키로 라우팅해 묶음 전체를 primary에서 조회
+        return next((key for key in keys if self._unit_of_work.router.is_sticky(key)), None)
+
+
+def _active_ratio(common_values: Optional[str], common_freqs: Optional[List[float]], is_active: bool) -> Optional[float]:
+    """
+    pg_stats의 most_common_vals('{t,f}')/most_common_freqs에서 is_active 값의 비율 (통계가 없으면 None)
+    """
+    if common_values is None or common_freqs is None:
+        return None
+
+    values = [value == "t" for value in common_values.strip("{}").split(",") if value]
+    frequencies = dict(zip(values, common_freqs))
+    if is_active in frequencies:
+        return frequencies[is_active]
+    # 자주 나오는 값 목록에 없으면 나머지 비율
+    return max(0.0, 1.0 - sum(common_freqs))
+
+
+# read-your-writes 판단용 키 (쓰기 직후 같은 사용자의 조회는 primary로)
+def _email_key(email: str) -> str:
+    return f"user:email:{email}"
+
+
+def _id_key(user_id: int) -> str:
+    return f"user:id:{user_id}"
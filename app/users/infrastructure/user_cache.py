@@ -0,0 +1,305 @@
+"""
+사용자 조회 캐시 - 프로세스 로컬 L1(TTL + LRU) + Redis L2
+
+- 조회 순서: L1 -> L2 -> DB (찾은 값은 상위 계층에 다시 채움)
+- 없는 사용자도 짧은 TTL로 캐시 (negative caching, 존재하지 않는 이메일 반복 조회 차단)
+- 같은 키의 동시 miss는 DB 조회 하나로 합친다 (single-flight)
+- L2(Redis) 장애 시 경고만 남기고 DB 조회로 진행 (잠시 L2를 건너뜀)
+- 다른 프로세스의 L1은 무효화되지 않으므로 L1 TTL은 짧게 유지 (최대 stale 시간 = L1 TTL)
+- password_hash는 캐시하지 않는다 (비밀번호 확인은 저장소의 find_password_hash로 DB에서 조회)
+"""
+import asyncio
+import dataclasses
+import json
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from app.config.logger import logger
+from app.config.settings import (
+    USER_CACHE_ENABLED,
+    USER_CACHE_L1_MAX_SIZE,
+    USER_CACHE_L1_TTL_SECONDS,
+    USER_CACHE_L2_ENABLED,
+    USER_CACHE_L2_TTL_SECONDS,
+    USER_CACHE_NEGATIVE_TTL_SECONDS,
+)
+from app.shared.infrastructure.redis_client import redis_client_manager
+from app.users.core.domain.user import User
+
+# 캐시 값 형식이 바뀌면 버전을 올려 이전 형식의 L2 값을 읽지 않도록 한다
+_KEY_PREFIX = "user:cache:v2"
+# L2에 저장하는 "없는 사용자" 표시
+_MISSING = b"-"
+# Redis 오류 후 L2를 건너뛰는 시간 (장애 중 매 조회가 소켓 타임아웃을 기다리지 않도록)
+_L2_ERROR_BACKOFF_SECONDS = 10.0
+
+
+class UserCache:
+
+    def __init__(
+            self,
+            enabled: bool = USER_CACHE_ENABLED,
+            l1_max_size: int = USER_CACHE_L1_MAX_SIZE,
+            l1_ttl_seconds: float = USER_CACHE_L1_TTL_SECONDS,
+            l2_enabled: bool = USER_CACHE_L2_ENABLED,
+            l2_ttl_seconds: int = USER_CACHE_L2_TTL_SECONDS,
+            negative_ttl_seconds: float = USER_CACHE_NEGATIVE_TTL_SECONDS,
+    ):
+        self.enabled = enabled
+        self.l1_max_size = l1_max_size
+        self.l1_ttl_seconds = l1_ttl_seconds
+        self.l2_enabled = l2_enabled
+        self.l2_ttl_seconds = l2_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+        # email -> (User 또는 None(없는 사용자), 만료 시각)
+        self._l1: "OrderedDict[str, Tuple[Optional[User], float]]" = OrderedDict()
+        # 진행 중인 DB 조회 (single-flight)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # 실행 중인 조회 태스크 (무효화로 _inflight에서 빠져도 끝날 때까지 참조 유지)
+        self._load_tasks: Set[asyncio.Task] = set()
+        self._l2_retry_at = 0.0
+
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+        self.l1_evictions = 0
+        self.l2_errors = 0
+        self._load_count = 0
+        self._load_total_ms = 0.0
+        self._load_max_ms = 0.0
+
+    async def get_by_email(self, email: str, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        """
+        캐시에 없으면 loader(DB 조회)를 호출해 결과를 캐시한다.
+        돌려주는 User는 호출자가 수정해도 캐시에 영향이 없도록 복사본이고, password_hash는 비어 있다.
+        """
+        if not self.enabled:
+            return _without_credentials(await loader())
+
+        found, user = self._l1_get(email)
+        if found:
+            self.l1_hits += 1
+            if user is None:
+                self.negative_hits += 1
+            return _clone(user)
+
+        found, user = await self._l2_get(email)
+        if found:
+            self.l2_hits += 1
+            if user is None:
+                self.negative_hits += 1
+            self._l1_put(email, user)
+            return _clone(user)
+
+        self.misses += 1
+        task = self._inflight.get(email)
+        if task is not None:
+            # 같은 키를 이미 조회 중이면 그 결과를 기다린다
+            self.coalesced += 1
+        else:
+            # 조회는 별도 태스크로 실행해, 시작한 요청이 취소되어도(클라이언트 연결 종료 등) 기다리는 다른 요청은 결과를 받는다
+            task = asyncio.get_running_loop().create_task(self._load(email, loader))
+            self._inflight[email] = task
+            self._load_tasks.add(task)
+            task.add_done_callback(self._on_load_done)
+        return _clone(await asyncio.shield(task))
+
+    async def _load(self, email: str, loader: Callable[[], Awaitable[Optional[User]]]) -> Optional[User]:
+        task = asyncio.current_task()
+        try:
+            started_at = time.perf_counter()
+            user = _without_credentials(await loader())
+            self._observe_load(time.perf_counter() - started_at)
+
+            # 조회 중 무효화되었으면(_inflight에서 빠짐) 오래된 값일 수 있으므로 캐시에 쓰지 않는다
+            if self._inflight.get(email) is task:
+                self._l1_put(email, user)
+                await self._l2_put(email, user)
+            return user
+
+        finally:
+            if self._inflight.get(email) is task:
+                del self._inflight[email]
+
+    def _on_load_done(self, task: asyncio.Task) -> None:
+        self._load_tasks.discard(task)
+        # 기다리는 쪽이 모두 취소되었어도 "exception was never retrieved" 경고가 나지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    async def invalidate_email(self, email: str) -> None:
+        if not self.enabled:
+            return
+
+        self.invalidations += 1
+        self._inflight.pop(email, None)
+        self._l1.pop(email, None)
+        await self._l2_delete(email)
+
+    def clear(self) -> None:
+        self._l1.clear()
+        self._inflight.clear()
+
+    def stats(self) -> dict:
+        lookups = self.l1_hits + self.l2_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "l1_size": len(self._l1),
+            "l1_max_size": self.l1_max_size,
+            "l2_enabled": self._l2_available(),
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.l1_hits + self.l2_hits) / lookups, 4) if lookups else 0.0,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "l1_evictions": self.l1_evictions,
+            "l2_errors": self.l2_errors,
+            "load_ms": {
+                "count": self._load_count,
+                "avg": round(self._load_total_ms / self._load_count, 3) if self._load_count else 0.0,
+                "max": round(self._load_max_ms, 3),
+            },
+        }
+
+    def _l1_get(self, email: str) -> Tuple[bool, Optional[User]]:
+        entry = self._l1.get(email)
+        if entry is None:
+            return False, None
+
+        user, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._l1[email]
+            return False, None
+
+        self._l1.move_to_end(email)
+        return True, user
+
+    def _l1_put(self, email: str, user: Optional[User]) -> None:
+        if self.l1_max_size <= 0:
+            return
+
+        ttl = self.l1_ttl_seconds if user is not None else min(self.l1_ttl_seconds, self.negative_ttl_seconds)
+        self._l1[email] = (user, time.monotonic() + ttl)
+        self._l1.move_to_end(email)
+
+        while len(self._l1) > self.l1_max_size:
+            self._l1.popitem(last=False)
+            self.l1_evictions += 1
+
+    def _l2_available(self) -> bool:
+        return self.l2_enabled and redis_client_manager.is_started and time.monotonic() >= self._l2_retry_at
+
+    async def _l2_get(self, email: str) -> Tuple[bool, Optional[User]]:
+        if not self._l2_available():
+            return False, None
+
+        try:
+            raw = await redis_client_manager.client.get(_email_key(email))
+        except Exception as e:
+            self._on_l2_error("조회", e)
+            return False, None
+
+        if raw is None:
+            return False, None
+        if raw == _MISSING or raw == _MISSING.decode():
+            return True, None
+        try:
+            return True, _deserialize(raw)
+        except (ValueError, TypeError) as e:
+            logger.warning(f"사용자 캐시 값 해석 실패, DB에서 다시 조회: {e}")
+            return False, None
+
+    async def _l2_put(self, email: str, user: Optional[User]) -> None:
+        if not self._l2_available():
+            return
+
+        try:
+            if user is None:
+                await redis_client_manager.client.set(
+                    _email_key(email), _MISSING, ex=max(1, int(self.negative_ttl_seconds))
+                )
+            else:
+                await redis_client_manager.client.set(_email_key(email), _serialize(user), ex=self.l2_ttl_seconds)
+        except Exception as e:
+            self._on_l2_error("저장", e)
+
+    async def _l2_delete(self, email: str) -> None:
+        if not self._l2_available():
+            return
+
+        try:
+            await redis_client_manager.client.unlink(_email_key(email))
+        except Exception as e:
+            self._on_l2_error("삭제", e)
+
+    def _on_l2_error(self, action: str, error: Exception) -> None:
+        self.l2_errors += 1
+        self._l2_retry_at = time.monotonic() + _L2_ERROR_BACKOFF_SECONDS
+        logger.warning(f"사용자 캐시 Redis {action} 실패 (DB로 진행): {error}")
+
+    def _observe_load(self, elapsed_seconds: float) -> None:
+        elapsed_ms = elapsed_seconds * 1000
+        self._load_count += 1
+        self._load_total_ms += elapsed_ms
+        self._load_max_ms = max(self._load_max_ms, elapsed_ms)
+
+
+def _email_key(email: str) -> str:
+    return f"{_KEY_PREFIX}:email:{email}"
+
+
+def _clone(user: Optional[User]) -> Optional[User]:
+    if user is None:
+        return None
+    return dataclasses.replace(user, roles=list(user.roles))
+
+
+def _without_credentials(user: Optional[User]) -> Optional[User]:
+    if user is None or not user.password_hash:
+        return user
+    return dataclasses.replace(user, password_hash="")
+
+
+def _serialize(user: User) -> str:
+    return json.dumps([
+        user.id,
+        user.email,
+        user.name,
+        user.is_active,
+        _format_datetime(user.last_login),
+        _format_datetime(user.created_at),
+        _format_datetime(user.updated_at),
+    ], separators=(",", ":"))
+
+
+def _deserialize(raw) -> User:
+    user_id, email, name, is_active, last_login, created_at, updated_at = json.loads(raw)
+    return User(
+        id=user_id,
+        email=email,
+        name=name,
+        is_active=is_active,
+        last_login=_parse_datetime(last_login),
+        created_at=_parse_datetime(created_at),
+        updated_at=_parse_datetime(updated_at),
+    )
+
+
+def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+# 프로세스 전역 캐시 (요청마다 생성되는 저장소 decorator가 공유)
+user_cache = UserCache()
@@ -1,8 +1,32 @@
+from typing import Any, Dict
+
+from sqlalchemy import Row
+
 from app.users.core.domain.user import User
-from app.users.infrastructure.models import UserDB
+from app.users.core.domain.user_profile import UserProfile
+from app.users.infrastructure.models import UserDB, UserDBProfile
 
 
 class UserDBMapper:
+    # 조회/INSERT RETURNING에서 ORM 객체 없이 도메인 객체로 바로 변환할 컬럼 (row_to_domain과 순서 일치)
+    COLUMNS = (
+        UserDB.id,
+        UserDB.email,
+        UserDB.password_hash,
+        UserDB.name,
+        UserDB.is_active,
+        UserDB.last_login,
+        UserDB.created_at,
+        UserDB.updated_at,
+    )
+    # 프로필 outer join 시 COLUMNS 뒤에 붙는 컬럼 (row_to_domain_with_profile과 순서 일치, user_id가 NULL이면 프로필 없음)
+    PROFILE_COLUMNS = (
+        UserDBProfile.user_id,
+        UserDBProfile.bio,
+        UserDBProfile.phone,
+        UserDBProfile.avatar_url,
+        UserDBProfile.updated_at,
+    )
 
     @staticmethod
     def domain_to_db(user: User) -> UserDB:
@@ -27,3 +51,46 @@ class UserDBMapper:
             created_at=getattr(user_db, 'created_at', None),
             updated_at=getattr(user_db, 'updated_at', None)
         )
+
+    @staticmethod
+    def domain_to_insert_values(user: User) -> Dict[str, Any]:
+        return {
+            "email": user.email,
+            "password_hash": user.password_hash,
+            "name": user.name,
+            "is_active": user.is_active,
+            "last_login": user.last_login,
+            "created_at": user.created_at,
+            "updated_at": user.updated_at,
+        }
+
+    @staticmethod
+    def row_to_domain(row: Row) -> User:
+        """
+        ORM 인스턴스(identity map, 계측, lazy 관계) 없이 컬럼 행에서 바로 도메인 객체 생성
+        """
+        user_id, email, password_hash, name, is_active, last_login, created_at, updated_at = row
+        return User(
+            id=user_id,
+            email=email,
+            password_hash=password_hash,
+            name=name,
+            is_active=is_active,
+            last_login=last_login,
+            created_at=created_at,
+            updated_at=updated_at
+        )
+
+    @staticmethod
+    def row_to_domain_with_profile(row: Row) -> User:
+        user = UserDBMapper.row_to_domain(row[:len(UserDBMapper.COLUMNS)])
+        profile_user_id, bio, phone, avatar_url, profile_updated_at = row[len(UserDBMapper.COLUMNS):]
+        if profile_user_id is not None:
+            user.profile = UserProfile(
+                user_id=profile_user_id,
+                bio=bio,
+                phone=phone,
+                avatar_url=avatar_url,
+                updated_at=profile_updated_at
+            )
+        return user
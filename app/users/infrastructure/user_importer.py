@@ -0,0 +1,318 @@
+"""
+사용자 일괄 가져오기 - CSV/NDJSON 스트리밍 -> 행 단위 검증 -> 병렬 해싱 -> COPY(임시 테이블) -> 집합 단위 병합
+
+- 파일 전체를 메모리에 올리지 않고 batch_size 행씩 처리 (검증/해싱과 DB 적재를 겹쳐 실행)
+- 배치마다 한 트랜잭션: COPY로 임시 테이블에 적재 후 INSERT ... SELECT ... ON CONFLICT (email) DO NOTHING
+  (tb_users와 tb_user_profiles를 한 문장에서 함께 삽입)
+- 이미 존재하는 이메일은 건너뛰고 오류로 보고하므로, 중간에 실패해도 같은 파일로 다시 실행하면 이어서 적재된다
+- password_hash 열에 bcrypt/argon2 해시가 있으면 해싱을 생략 (다른 시스템에서 이전할 때)
+- 실행 중인 서버의 사용자 캐시에 남아 있는 "없는 사용자" 항목은 negative TTL 동안 유지될 수 있다
+"""
+import asyncio
+import csv
+import json
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, ValidationError, model_validator
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config.logger import logger
+from app.config.settings import USER_IMPORT_BATCH_SIZE, USER_IMPORT_HASH_CONCURRENCY
+from app.shared.infrastructure.base import engine
+from app.shared.infrastructure.hash_executor import password_hash_executor
+from app.shared.infrastructure.security import hash_password_async, is_supported_password_hash
+from app.users.infrastructure.models import UserDB, UserDBProfile
+
+IMPORT_FORMATS = ("csv", "ndjson")
+# 보고서 객체에 보관할 오류 예시 수 (전체 오류는 on_error로 전달)
+ERROR_SAMPLE_SIZE = 100
+
+_STAGING_TABLE = "tb_users_import"
+_STAGING_COLUMNS = ("line_no", "email", "password_hash", "name", "bio", "avatar_url", "phone")
+# 세션 전용 임시 테이블, 커밋마다 비워진다 (배치마다 새로 적재)
+_CREATE_STAGING_TABLE = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    line_no integer NOT NULL,
+    email varchar(254) NOT NULL,
+    password_hash varchar(255) NOT NULL,
+    name varchar(100),
+    bio text,
+    avatar_url varchar(500),
+    phone varchar(20)
+) ON COMMIT DELETE ROWS
+"""
+_MERGE_STAGING_TABLE = f"""
+WITH inserted AS (
+    INSERT INTO {UserDB.__tablename__} (email, password_hash, name, is_active, created_at, updated_at)
+    SELECT email, password_hash, name, TRUE, LOCALTIMESTAMP, LOCALTIMESTAMP
+    FROM {_STAGING_TABLE}
+    ORDER BY line_no
+    ON CONFLICT (email) DO NOTHING
+    RETURNING id, email
+), inserted_profiles AS (
+    INSERT INTO {UserDBProfile.__tablename__} (user_id, bio, avatar_url, phone, created_at, updated_at)
+    SELECT inserted.id, staged.bio, staged.avatar_url, staged.phone, LOCALTIMESTAMP, LOCALTIMESTAMP
+    FROM inserted
+    JOIN {_STAGING_TABLE} AS staged ON staged.email = inserted.email
+    WHERE staged.bio IS NOT NULL OR staged.avatar_url IS NOT NULL OR staged.phone IS NOT NULL
+)
+SELECT email FROM inserted
+"""
+
+
+class ImportRow(BaseModel):
+    """
+    가져오기 한 행 - 회원가입 요청과 같은 제약 + 프로필 필드
+    """
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
+    email: EmailStr = Field(..., description="사용자 이메일")
+    password: Optional[str] = Field(None, min_length=8, description="비밀번호 (최소 8자)")
+    password_hash: Optional[str] = Field(None, max_length=255, description="이미 해싱된 비밀번호 (bcrypt/argon2)")
+    name: Optional[str] = Field(None, max_length=100, description="사용자 이름")
+    bio: Optional[str] = Field(None, description="자기소개")
+    avatar_url: Optional[str] = Field(None, max_length=500, description="아바타 URL")
+    phone: Optional[str] = Field(None, max_length=20, description="전화번호")
+
+    @model_validator(mode="after")
+    def check_password(self) -> "ImportRow":
+        if (self.password is None) == (self.password_hash is None):
+            raise ValueError("password와 password_hash 중 하나만 있어야 합니다")
+        if self.password_hash is not None and not is_supported_password_hash(self.password_hash):
+            raise ValueError("지원하지 않는 비밀번호 해시 형식입니다")
+        return self
+
+
+@dataclass(slots=True, frozen=True)
+class RowError:
+    line: int
+    reason: str
+    email: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        return {"line": self.line, "email": self.email, "reason": self.reason}
+
+
+@dataclass(slots=True)
+class ImportReport:
+    processed: int = 0
+    inserted: int = 0
+    existing: int = 0
+    invalid: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+    error_samples: List[RowError] = field(default_factory=list)
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "processed": self.processed,
+            "inserted": self.inserted,
+            "existing": self.existing,
+            "invalid": self.invalid,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "rows_per_second": round(self.rows_per_second, 1),
+            "error_samples": [error.to_dict() for error in self.error_samples],
+        }
+
+
+def read_records(lines: Iterable[str], import_format: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    (행 번호, 레코드, 파싱 오류)를 한 행씩 돌려준다 (CSV는 헤더 행이 필요, 빈 값은 없는 값으로 취급)
+    """
+    if import_format == "csv":
+        reader = csv.DictReader(lines)
+        for record in reader:
+            yield reader.line_num, {
+                key: value for key, value in record.items() if key is not None and value not in ("", None)
+            }, None
+        return
+
+    if import_format != "ndjson":
+        raise ValueError(f"지원하지 않는 가져오기 형식: {import_format}")
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, None, f"JSON 형식 오류: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_no, None, "JSON 객체가 아닙니다"
+            continue
+        yield line_no, {key: value for key, value in record.items() if value not in ("", None)}, None
+
+
+class UserImporter:
+
+    def __init__(
+            self,
+            db_engine: AsyncEngine = engine,
+            batch_size: int = USER_IMPORT_BATCH_SIZE,
+            hash_concurrency: int = USER_IMPORT_HASH_CONCURRENCY,
+    ):
+        self.engine = db_engine
+        self.batch_size = batch_size
+        # 해싱 Executor가 대기열 초과로 거절하지 않는 범위에서 최대한 병렬로 제출
+        self.hash_concurrency = hash_concurrency or (
+            password_hash_executor.max_workers + password_hash_executor.queue_limit
+        )
+
+    async def run(
+            self,
+            lines: Iterable[str],
+            import_format: str,
+            on_error: Optional[Callable[[RowError], None]] = None,
+            on_progress: Optional[Callable[[ImportReport], None]] = None,
+    ) -> ImportReport:
+        if self.engine.dialect.driver != "asyncpg":
+            raise RuntimeError("사용자 일괄 가져오기는 asyncpg 드라이버에서만 지원합니다 (COPY 사용)")
+
+        report = ImportReport()
+        started_at = time.perf_counter()
+
+        def emit(error: RowError) -> None:
+            if len(report.error_samples) < ERROR_SAMPLE_SIZE:
+                report.error_samples.append(error)
+            if on_error is not None:
+                on_error(error)
+
+        def report_invalid(error: RowError) -> None:
+            report.invalid += 1
+            emit(error)
+
+        # 검증/해싱(prepare)과 DB 적재(load)를 겹쳐 실행, 준비된 배치는 최대 2개까지만 대기
+        batches: asyncio.Queue = asyncio.Queue(maxsize=2)
+        producer = asyncio.create_task(self._prepare_batches(lines, import_format, batches, report, report_invalid))
+
+        try:
+            async with self.engine.connect() as conn:
+                raw_connection = await conn.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                await driver_connection.execute(_CREATE_STAGING_TABLE)
+
+                while True:
+                    records = await batches.get()
+                    if records is None:
+                        break
+
+                    inserted_emails = await self._load_batch(driver_connection, records)
+                    report.inserted += len(inserted_emails)
+                    report.batches += 1
+                    for line_no, email, *_ in records:
+                        if email not in inserted_emails:
+                            report.existing += 1
+                            emit(RowError(line_no, "이미 존재하는 이메일입니다", email))
+
+                    report.elapsed_seconds = time.perf_counter() - started_at
+                    if on_progress is not None:
+                        on_progress(report)
+
+            # 준비 단계 예외(파일 읽기 오류 등)를 전달
+            await producer
+
+        except BaseException:
+            producer.cancel()
+            raise
+
+        report.elapsed_seconds = time.perf_counter() - started_at
+        logger.info(
+            f"사용자 일괄 가져오기 완료: {report.processed}행, 추가 {report.inserted}, "
+            f"기존 {report.existing}, 오류 {report.invalid}, {report.rows_per_second:.0f}행/초"
+        )
+        return report
+
+    async def _prepare_batches(
+            self,
+            lines: Iterable[str],
+            import_format: str,
+            batches: asyncio.Queue,
+            report: ImportReport,
+            report_invalid: Callable[[RowError], None],
+    ) -> None:
+        try:
+            pending: List[Tuple[int, ImportRow]] = []
+            seen_emails = set()
+
+            for line_no, record, parse_error in read_records(lines, import_format):
+                report.processed += 1
+                if parse_error is not None:
+                    report_invalid(RowError(line_no, parse_error))
+                    continue
+
+                try:
+                    row = ImportRow.model_validate(record)
+                except ValidationError as e:
+                    report_invalid(RowError(line_no, _format_validation_error(e), record.get("email")))
+                    continue
+
+                # 같은 배치 안의 중복은 COPY 전에 제거 (배치 사이 중복은 병합 시 "이미 존재"로 보고)
+                if row.email in seen_emails:
+                    report_invalid(RowError(line_no, "파일 내 중복 이메일입니다", row.email))
+                    continue
+                seen_emails.add(row.email)
+                pending.append((line_no, row))
+
+                if len(pending) >= self.batch_size:
+                    await batches.put(await self._to_records(pending, report_invalid))
+                    pending, seen_emails = [], set()
+
+            if pending:
+                await batches.put(await self._to_records(pending, report_invalid))
+        finally:
+            await batches.put(None)
+
+    async def _to_records(
+            self, rows: List[Tuple[int, ImportRow]], report_invalid: Callable[[RowError], None]
+    ) -> List[tuple]:
+        """
+        비밀번호를 병렬로 해싱하고 임시 테이블 열 순서(_STAGING_COLUMNS)의 튜플로 변환
+        """
+        semaphore = asyncio.Semaphore(self.hash_concurrency)
+
+        async def hash_row(row: ImportRow) -> Optional[str]:
+            if row.password_hash is not None:
+                return row.password_hash
+            async with semaphore:
+                return await hash_password_async(row.password)
+
+        hashes = await asyncio.gather(*(hash_row(row) for _, row in rows), return_exceptions=True)
+
+        records = []
+        for (line_no, row), password_hash in zip(rows, hashes):
+            if isinstance(password_hash, BaseException):
+                report_invalid(RowError(line_no, f"비밀번호 해싱 실패: {password_hash}", row.email))
+                continue
+            records.append((
+                line_no,
+                row.email,
+                password_hash,
+                row.name or row.email.split("@")[0],
+                row.bio,
+                row.avatar_url,
+                row.phone,
+            ))
+        return records
+
+    async def _load_batch(self, driver_connection, records: List[tuple]) -> set:
+        if not records:
+            return set()
+
+        async with driver_connection.transaction():
+            await driver_connection.copy_records_to_table(_STAGING_TABLE, records=records, columns=_STAGING_COLUMNS)
+            rows = await driver_connection.fetch(_MERGE_STAGING_TABLE)
+        return {row["email"] for row in rows}
+
+
+def _format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in detail['loc']) or 'row'}: {detail['msg']}" for detail in error.errors()
+    )
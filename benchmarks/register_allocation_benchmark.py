@@ -0,0 +1,95 @@
+"""
+회원가입 요청의 계층 간 객체 변환 할당량 벤치마크 (tracemalloc)
+
+요청 JSON -> RegisterRequest -> RegisterInput -> UserCreateInput -> User -> UserCreateOutput
+-> RegisterOutput -> RegisterResponse -> APIResponse JSON 까지, DB/해싱/JWT를 제외한 변환 경로만 측정한다.
+
+실행:
+    python -m benchmarks.register_allocation_benchmark
+"""
+import time
+import tracemalloc
+from datetime import datetime
+
+from app.auth.api.auth_api_mapper import AuthAPIMapper
+from app.auth.api.requests import RegisterRequest
+from app.auth.core.application.auth_output_mapper import AuthOutputMapper
+from app.auth.core.domain.token import Token
+from app.shared.api.responses import APIResponseCode, success_response
+from app.users.core.application.inputs import UserCreateInput
+from app.users.core.application.user_output_mapper import UserOutputMapper
+from app.users.core.domain.user import User
+
+ITERATIONS = 2000
+REQUEST_BODY = b'{"email": "someone@example.com", "password": "correct horse battery", "name": "someone"}'
+ACCESS_TOKEN = "Bearer " + "a" * 200
+REFRESH_TOKEN = "Bearer " + "r" * 200
+NOW = datetime.now()
+
+
+def handle_register() -> tuple:
+    """
+    요청 하나가 거치는 변환을 모두 수행하고, 계층별 중간 객체를 돌려준다
+    """
+    request = RegisterRequest.model_validate_json(REQUEST_BODY)
+    register_input = AuthAPIMapper.register_request_to_input(request)
+
+    user_create_input = UserCreateInput(
+        email=register_input.email,
+        password=register_input.password,
+        name=register_input.name
+    )
+    # 저장소가 돌려주는 저장된 사용자 (RETURNING 행에서 변환된 것과 같은 형태)
+    saved_user = User(
+        id=1,
+        email=user_create_input.email,
+        password_hash="$argon2id$v=19$m=65536,t=3,p=4$placeholder",
+        name=user_create_input.name,
+        created_at=NOW,
+        updated_at=NOW
+    )
+    user_create_output = UserOutputMapper.domain_to_create_output(saved_user)
+    register_output = AuthOutputMapper.domain_to_register_output(Token(ACCESS_TOKEN, REFRESH_TOKEN), user_create_output)
+
+    register_response = AuthAPIMapper.register_output_to_response(register_output)
+    body = success_response(APIResponseCode.CREATED, register_response).model_dump_json().encode()
+    return request, register_input, user_create_input, saved_user, user_create_output, register_output, register_response, body
+
+
+def main() -> None:
+    for _ in range(100):
+        handle_register()
+
+    started_at = time.perf_counter()
+    for _ in range(ITERATIONS):
+        handle_register()
+    elapsed = time.perf_counter() - started_at
+
+    tracemalloc.start()
+
+    # 1) 요청 하나를 처리하는 동안의 최대 추가 메모리
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    handle_register()
+    _, peak = tracemalloc.get_traced_memory()
+
+    # 2) 요청당 계층별 중간 객체가 차지하는 블록 수/바이트 (해제되지 않도록 결과를 살려둔다)
+    before = tracemalloc.take_snapshot()
+    intermediates = []
+    for _ in range(ITERATIONS):
+        intermediates.append(handle_register())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    diff = after.compare_to(before, "filename")
+    retained_blocks = sum(stat.count_diff for stat in diff)
+    retained_bytes = sum(stat.size_diff for stat in diff)
+
+    print(f"{'us/request':<28}{elapsed / ITERATIONS * 1e6:>10.1f}")
+    print(f"{'peak bytes/request':<28}{peak - baseline:>10}")
+    print(f"{'retained bytes/request':<28}{retained_bytes / ITERATIONS:>10.0f}")
+    print(f"{'retained blocks/request':<28}{retained_blocks / ITERATIONS:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
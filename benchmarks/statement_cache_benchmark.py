@@ -0,0 +1,90 @@
+"""
+사용자 조회 쿼리 구성/컴파일 비용 마이크로벤치마크 - 매 호출 구성 vs 미리 구성한 bindparam 쿼리
+
+실행:
+    python -m benchmarks.statement_cache_benchmark
+
+BENCHMARK_DATABASE_URL(예: postgresql+asyncpg://...)을 지정하면 실제 DB에 조회를 반복 실행하고
+엔진 컴파일 캐시 적중률과 호출당 시간도 함께 출력한다.
+"""
+import asyncio
+import os
+import time
+import timeit
+
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.shared.infrastructure.base import build_engine
+from app.shared.infrastructure.pool_metrics import pool_stats
+from app.users.infrastructure.models import UserDB
+from app.users.infrastructure.repository.postgres_user_repository import _FIND_BY_EMAIL
+
+ITERATIONS = 20000
+EMAIL = "someone@example.com"
+DIALECT = postgresql.asyncpg.dialect()
+
+
+def rebuild_and_compile():
+    # 캐시가 없을 때: 구문 트리 구성 + SQL 문자열 컴파일
+    return select(UserDB).where(UserDB.email == EMAIL).compile(dialect=DIALECT)
+
+
+def rebuild_and_cache_key():
+    # 캐시 적중 시에도 매번 드는 비용: 구문 트리 구성 + 캐시 키 생성
+    return select(UserDB).where(UserDB.email == EMAIL)._generate_cache_key()
+
+
+def prebuilt_cache_key():
+    return _FIND_BY_EMAIL._generate_cache_key()
+
+
+def lambda_cache_key():
+    email = EMAIL
+    return lambda_stmt(lambda: select(UserDB).where(UserDB.email == email))._generate_cache_key()
+
+
+async def run_database(database_url: str, iterations: int = 2000) -> None:
+    engine = build_engine(database_url)
+    try:
+        async with AsyncSession(engine) as session:
+            cases = {
+                "rebuilt select": lambda: session.execute(select(UserDB).where(UserDB.email == EMAIL)),
+                "prebuilt bindparam": lambda: session.execute(_FIND_BY_EMAIL, {"email": EMAIL}),
+            }
+            print(f"\n{'database case':<24}{'us/query':>10}")
+            for name, execute in cases.items():
+                started_at = time.perf_counter()
+                for _ in range(iterations):
+                    (await execute()).scalar_one_or_none()
+                print(f"{name:<24}{(time.perf_counter() - started_at) / iterations * 1e6:>10.1f}")
+
+        print(f"compiled cache: {pool_stats(engine)['compiled_cache']}")
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    cases = {
+        "rebuild + compile": rebuild_and_compile,
+        "rebuild + cache key": rebuild_and_cache_key,
+        "lambda_stmt cache key": lambda_cache_key,
+        "prebuilt cache key": prebuilt_cache_key,
+    }
+
+    # 미리 구성한 쿼리의 캐시 키는 값과 무관하게 동일해야 컴파일 캐시를 재사용한다
+    assert _FIND_BY_EMAIL._generate_cache_key() == _FIND_BY_EMAIL._generate_cache_key()
+
+    print(f"{'case':<24}{'us/call':>10}{'calls/s':>12}")
+    for name, func in cases.items():
+        elapsed = timeit.timeit(func, number=ITERATIONS, timer=time.perf_counter)
+        print(f"{name:<24}{elapsed / ITERATIONS * 1e6:>10.2f}{ITERATIONS / elapsed:>12.0f}")
+
+    database_url = os.getenv("BENCHMARK_DATABASE_URL")
+    if database_url:
+        asyncio.run(run_database(database_url))
+
+
+if __name__ == "__main__":
+    main()
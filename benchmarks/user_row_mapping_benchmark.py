@@ -0,0 +1,68 @@
+"""
+조회 결과 -> User 도메인 객체 변환 벤치마크 - ORM 엔티티 경유 vs 컬럼 projection 직접 변환
+
+실행:
+    python -m benchmarks.user_row_mapping_benchmark
+
+(ORM 계측/identity map 비용만 비교하기 위해 표준 라이브러리 sqlite 인메모리 DB를 사용)
+"""
+import time
+from datetime import datetime
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.base import Base
+from app.users.infrastructure.models import UserDB
+from app.users.infrastructure.user_db_mapper import UserDBMapper
+
+ROWS = 5000
+ROUNDS = 10
+
+
+def orm_path(session: Session):
+    return [UserDBMapper.db_to_domain(user_db) for user_db in session.execute(select(UserDB)).scalars()]
+
+
+def projection_path(session: Session):
+    return [UserDBMapper.row_to_domain(row) for row in session.execute(select(*UserDBMapper.COLUMNS))]
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+
+    now = datetime.now()
+    with engine.begin() as conn:
+        conn.execute(insert(UserDB), [
+            {
+                "email": f"user{index}@example.com",
+                "password_hash": "$argon2id$v=19$m=65536,t=3,p=4$placeholder",
+                "name": f"user{index}",
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for index in range(ROWS)
+        ])
+
+    cases = {
+        "ORM entity -> User": orm_path,
+        "projection -> User": projection_path,
+    }
+
+    print(f"{'case':<24}{'ms/round':>10}{'objects/s':>14}")
+    for name, read in cases.items():
+        elapsed = 0.0
+        for _ in range(ROUNDS):
+            # 요청마다 세션이 새로 열리는 상황과 같게 라운드마다 새 세션 사용
+            with Session(engine) as session:
+                started_at = time.perf_counter()
+                users = read(session)
+                elapsed += time.perf_counter() - started_at
+            assert len(users) == ROWS
+        print(f"{name:<24}{elapsed / ROUNDS * 1000:>10.1f}{ROWS * ROUNDS / elapsed:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
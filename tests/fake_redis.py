@@ -0,0 +1,136 @@
+"""
+테스트용 인메모리 Redis 대역 - 저장소가 사용하는 명령만 구현 (decode_responses=True 클라이언트처럼 str 반환)
+"""
+import fnmatch
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class FakeRedis:
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[str, Optional[float]]] = {}
+        self.published: List[Tuple[str, str]] = []
+        self.commands: List[str] = []
+        self._scan_cursors: Dict[int, str] = {}
+        self._next_scan_cursor = 0
+
+    def _live(self, key: str) -> Optional[Tuple[str, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+            del self._data[key]
+            return None
+        return entry
+
+    def _record(self, command: str) -> None:
+        self.commands.append(command)
+
+    # 문자열 명령
+    async def set(self, key: str, value, ex: Optional[int] = None) -> bool:
+        self._record("set")
+        value = value.decode() if isinstance(value, bytes) else str(value)
+        self._data[key] = (value, time.monotonic() + ex if ex is not None else None)
+        return True
+
+    async def setex(self, key: str, seconds: int, value) -> bool:
+        self._record("setex")
+        self._data[key] = (str(value), time.monotonic() + seconds)
+        return True
+
+    async def psetex(self, key: str, milliseconds: int, value) -> bool:
+        self._record("psetex")
+        self._data[key] = (str(value), time.monotonic() + milliseconds / 1000)
+        return True
+
+    async def get(self, key: str) -> Optional[str]:
+        self._record("get")
+        entry = self._live(key)
+        return entry[0] if entry else None
+
+    async def mget(self, keys: List[str]) -> List[Optional[str]]:
+        self._record("mget")
+        return [entry[0] if entry else None for entry in map(self._live, keys)]
+
+    async def exists(self, *keys: str) -> int:
+        self._record("exists")
+        return sum(self._live(key) is not None for key in keys)
+
+    async def delete(self, *keys: str) -> int:
+        self._record("delete")
+        return sum(self._data.pop(key, None) is not None for key in keys if self._live(key))
+
+    async def unlink(self, *keys: str) -> int:
+        self._record("unlink")
+        return sum(self._data.pop(key, None) is not None for key in keys if self._live(key))
+
+    async def ttl(self, key: str) -> int:
+        self._record("ttl")
+        entry = self._live(key)
+        if entry is None:
+            return -2
+        return -1 if entry[1] is None else int(entry[1] - time.monotonic())
+
+    async def pttl(self, key: str) -> int:
+        self._record("pttl")
+        entry = self._live(key)
+        if entry is None:
+            return -2
+        return -1 if entry[1] is None else int((entry[1] - time.monotonic()) * 1000)
+
+    async def publish(self, channel: str, message: str) -> int:
+        self._record("publish")
+        self.published.append((channel, message))
+        return 0
+
+    # 키 순회 (정렬 순서, 커서는 마지막으로 돌려준 키를 가리킴 -> 순회 중 삭제해도 남은 키를 빠뜨리지 않음)
+    def _matching_keys(self, match: str) -> List[str]:
+        return sorted(key for key in list(self._data) if self._live(key) and fnmatch.fnmatchcase(key, match))
+
+    async def scan(self, cursor: int = 0, match: str = "*", count: int = 10) -> Tuple[int, List[str]]:
+        self._record("scan")
+        after = self._scan_cursors.pop(cursor, None) if cursor else None
+        keys = [key for key in self._matching_keys(match) if after is None or key > after]
+        batch = keys[:count]
+        if len(keys) <= count:
+            return 0, batch
+        self._next_scan_cursor += 1
+        self._scan_cursors[self._next_scan_cursor] = batch[-1]
+        return self._next_scan_cursor, batch
+
+    async def scan_iter(self, match: str = "*", count: int = 10):
+        self._record("scan_iter")
+        for key in self._matching_keys(match):
+            yield key
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """
+    명령을 모아두었다가 execute에서 순서대로 실행하고 결과 목록을 돌려준다
+    """
+
+    def __init__(self, client: FakeRedis):
+        self._client = client
+        self._queued = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._queued.clear()
+
+    def __getattr__(self, name: str):
+        command = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._queued.append((command, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list:
+        self._client._record("execute")
+        queued, self._queued = self._queued, []
+        return [await command(*args, **kwargs) for command, args, kwargs in queued]
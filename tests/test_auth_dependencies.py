@@ -0,0 +1,44 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth.core.domain.services.token_service import TokenService
+from app.auth.dependencies import get_token_payload, get_token_service
+from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
+from app.shared.api.exception_handler import api_exception_handler
+from app.shared.api.exceptions import APIException
+
+
+@pytest.fixture
+def token_service():
+    return TokenService(MemoryTokenRepository())
+
+
+@pytest.fixture
+def client(token_service):
+    app = FastAPI()
+    app.add_exception_handler(APIException, api_exception_handler)
+
+    @app.get("/me")
+    async def me(payload=Depends(get_token_payload)):
+        return {"user_id": payload["user_id"]}
+
+    app.dependency_overrides[get_token_service] = lambda: token_service
+    return TestClient(app)
+
+
+def test_access_token_is_accepted(client, token_service):
+    token = token_service.jwt_manager.create_token(1, "user@example.com")
+
+    response = client.get("/me", headers={"Authorization": token})
+
+    assert response.status_code == 200
+    assert response.json() == {"user_id": 1}
+
+
+def test_refresh_token_is_rejected_as_access_token(client, token_service):
+    token = token_service.jwt_manager.create_refresh_token(1, "user@example.com")
+
+    response = client.get("/me", headers={"Authorization": token})
+
+    assert response.status_code == 401
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+from app.shared.infrastructure.batch_loader import BatchLoader
+
+
+class RecordingBatchFn:
+    def __init__(self, error: Exception = None):
+        self.calls = []
+        self.error = error
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+        # 짝수 키만 있는 것으로 취급 (없는 키는 None)
+        return {key: f"value-{key}" for key in keys if key % 2 == 0}
+
+
+@pytest.mark.asyncio
+async def test_same_tick_loads_are_batched_and_coalesced():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader("test", batch_fn, max_batch_size=100)
+
+    results = await asyncio.gather(loader.load(2), loader.load(3), loader.load(2), loader.load(4))
+
+    assert results == ["value-2", None, "value-2", "value-4"]
+    assert batch_fn.calls == [[2, 3, 4]]
+    stats = loader.stats()
+    assert stats["loads"] == 4
+    assert stats["coalesced"] == 1
+    assert stats["batches"] == 1
+    assert stats["largest_batch"] == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_is_dispatched_at_max_batch_size():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader("test", batch_fn, max_batch_size=2)
+
+    results = await asyncio.gather(*(loader.load(key) for key in range(5)))
+
+    assert results == ["value-0", None, "value-2", None, "value-4"]
+    assert batch_fn.calls == [[0, 1], [2, 3], [4]]
+    assert loader.stats()["largest_batch"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failure_is_propagated_to_every_waiter():
+    batch_fn = RecordingBatchFn(error=RuntimeError("db down"))
+    loader = BatchLoader("test", batch_fn, max_batch_size=100)
+
+    results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(batch_fn.calls) == 1
+    assert loader.stats()["failures"] == 1
+
+    # 실패한 배치는 남지 않고 다음 조회는 새로 실행된다
+    batch_fn.error = None
+    assert await loader.load(2) == "value-2"
+    assert len(batch_fn.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_cancel_shared_key():
+    batch_fn = RecordingBatchFn()
+    loader = BatchLoader("test", batch_fn, max_batch_size=100)
+
+    first = asyncio.create_task(loader.load(2))
+    second = asyncio.create_task(loader.load(2))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert await second == "value-2"
+    with pytest.raises(asyncio.CancelledError):
+        await first
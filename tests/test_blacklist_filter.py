@@ -0,0 +1,87 @@
+import pytest
+
+from app.auth.infrastructure.blacklist_filter import BLACKLIST_KEY_PREFIX, BlacklistFilter
+from app.auth.infrastructure.repository.redis_token_repository import RedisTokenRepository
+from app.shared.infrastructure.security import JWTManager
+from app.shared.infrastructure.token_codec import token_revocation_id
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def token():
+    return JWTManager().create_token(1, "user@example.com")
+
+
+def test_filter_that_is_not_ready_always_defers_to_redis():
+    token_filter = BlacklistFilter(capacity=100)
+
+    assert token_filter.might_contain("anything")
+    assert token_filter.stats()["local_negatives"] == 0
+
+
+@pytest.mark.asyncio
+async def test_rebuild_loads_blacklist_keys(redis_client):
+    await redis_client.setex(f"{BLACKLIST_KEY_PREFIX}revoked", 60, "1")
+    await redis_client.setex("refresh_user:1", 60, "digest")
+    token_filter = BlacklistFilter(capacity=100)
+
+    assert await token_filter.rebuild(redis_client) == 1
+    token_filter.ready = True
+
+    assert token_filter.might_contain("revoked")
+    assert not token_filter.might_contain("refresh_user:1")
+
+
+@pytest.mark.asyncio
+async def test_ready_filter_skips_redis_for_unknown_tokens(redis_client, token):
+    token_filter = BlacklistFilter(capacity=100)
+    await token_filter.rebuild(redis_client)
+    token_filter.ready = True
+    repository = RedisTokenRepository(redis_client, token_filter=token_filter)
+
+    assert not await repository.is_blacklisted(token)
+    assert "exists" not in redis_client.commands
+    assert token_filter.stats()["local_negatives"] == 1
+
+
+@pytest.mark.asyncio
+async def test_not_ready_filter_falls_back_to_redis(redis_client, token):
+    # 다른 프로세스가 폐기했고 이 프로세스의 필터는 아직 동기화되지 않은 상태
+    await redis_client.setex(f"{BLACKLIST_KEY_PREFIX}{token_revocation_id(token)}", 60, "1")
+    token_filter = BlacklistFilter(capacity=100)
+    repository = RedisTokenRepository(redis_client, token_filter=token_filter)
+
+    assert await repository.is_blacklisted(token)
+    assert "exists" in redis_client.commands
+
+
+@pytest.mark.asyncio
+async def test_blacklisting_adds_to_filter_and_publishes(redis_client, token):
+    token_filter = BlacklistFilter(capacity=100)
+    await token_filter.rebuild(redis_client)
+    token_filter.ready = True
+    repository = RedisTokenRepository(redis_client, token_filter=token_filter)
+
+    assert await repository.blacklist_token(token, user_id=1)
+
+    revocation_id = token_revocation_id(token)
+    assert redis_client.published == [(repository.blacklist_channel, revocation_id)]
+    assert await repository.is_blacklisted(token)
+
+
+@pytest.mark.asyncio
+async def test_false_positive_is_recorded(redis_client, token):
+    token_filter = BlacklistFilter(capacity=100)
+    await token_filter.rebuild(redis_client)
+    token_filter.ready = True
+    # 필터에만 있고 Redis에서는 이미 만료된 항목
+    token_filter.add(token_revocation_id(token))
+    repository = RedisTokenRepository(redis_client, token_filter=token_filter)
+
+    assert not await repository.is_blacklisted(token)
+    assert token_filter.stats()["false_positives"] == 1
@@ -0,0 +1,59 @@
+import math
+
+import pytest
+
+from app.shared.infrastructure.bloom_filter import BloomFilter
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(1000, 0.01), (100000, 0.001), (1, 0.5)])
+def test_sizing_follows_optimal_formula(capacity, error_rate):
+    bloom = BloomFilter(capacity, error_rate)
+
+    expected_size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+    assert bloom.size == expected_size
+    assert bloom.hash_count == max(1, round(expected_size / capacity * math.log(2)))
+    assert len(bloom._bits) * 8 >= bloom.size
+
+
+def test_known_sizes():
+    # n=1000, p=1% -> 약 9.59 비트/항목, 해시 7개
+    bloom = BloomFilter(1000, 0.01)
+
+    assert bloom.size == 9586
+    assert bloom.hash_count == 7
+
+
+@pytest.mark.parametrize("capacity, error_rate", [(0, 0.01), (-1, 0.01), (10, 0), (10, 1), (10, 1.5)])
+def test_invalid_parameters_are_rejected(capacity, error_rate):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity, error_rate)
+
+
+def test_added_items_are_never_missed():
+    bloom = BloomFilter(5000, 0.001)
+    items = [f"jti-{i}" for i in range(5000)]
+    for item in items:
+        bloom.add(item)
+
+    assert all(item in bloom for item in items)
+    assert bloom.count == 5000
+    assert not bloom.is_saturated
+
+
+def test_false_positive_rate_stays_near_target():
+    bloom = BloomFilter(2000, 0.01)
+    for i in range(2000):
+        bloom.add(f"present-{i}")
+
+    false_positives = sum(bloom.might_contain(f"absent-{i}") for i in range(20000))
+
+    # 설계 용량 안에서는 목표 오탐률(1%)의 2배를 넘지 않아야 한다
+    assert false_positives / 20000 < 0.02
+
+
+def test_filter_is_saturated_past_capacity():
+    bloom = BloomFilter(2, 0.01)
+    for item in ("a", "b", "c"):
+        bloom.add(item)
+
+    assert bloom.is_saturated
@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.shared.api.cursor import decode_cursor, encode_cursor
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+
+
+def _raw_cursor(value) -> str:
+    return base64.urlsafe_b64encode(json.dumps(value).encode()).rstrip(b"=").decode()
+
+
+@pytest.mark.parametrize("created_at", [
+    datetime(2026, 1, 2, 3, 4, 5, 678901),
+    datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+])
+def test_round_trip(created_at):
+    cursor = encode_cursor(created_at, 42)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not-base64!",
+    _raw_cursor("just a string"),
+    _raw_cursor(["2026-01-02T03:04:05"]),
+    _raw_cursor(["2026-01-02T03:04:05", "42"]),
+    _raw_cursor(["not a date", 42]),
+    _raw_cursor([None, 42]),
+    base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(APIException) as exc_info:
+        decode_cursor(cursor)
+
+    assert exc_info.value.code == APIResponseCode.COMMON_INVALID_PARAM
@@ -0,0 +1,85 @@
+import time
+
+from app.shared.infrastructure.expiring_store import ExpiringStore
+
+
+def test_get_and_contains_respect_expiry():
+    now = time.time()
+    store = ExpiringStore()
+    store.set("a", "value", expires_at=now + 10)
+
+    assert store.get("a", now=now) == "value"
+    assert store.contains("a", now=now)
+    assert store.get("a", now=now + 10) is None
+    assert not store.contains("a", now=now + 10)
+    assert len(store) == 0
+
+
+def test_contains_is_true_for_none_value():
+    now = time.time()
+    store = ExpiringStore()
+    store.set("a", None, expires_at=now + 10)
+
+    assert store.get("a", now=now) is None
+    assert store.contains("a", now=now)
+
+
+def test_capacity_evicts_soonest_expiring_first():
+    now = time.time()
+    store = ExpiringStore(max_entries=2)
+    store.set("late", 1, expires_at=now + 20)
+    store.set("soon", 2, expires_at=now + 10)
+    store.set("later", 3, expires_at=now + 30)
+
+    assert not store.contains("soon")
+    assert store.contains("late") and store.contains("later")
+    assert store.capacity_evictions == 1
+
+
+def test_evict_expired_ignores_stale_heap_entries():
+    now = time.time()
+    store = ExpiringStore()
+    store.set("a", 1, expires_at=now + 10)
+    # 만료 시각을 늘린 갱신 - 이전 힙 항목으로 지워지면 안 된다
+    store.set("a", 2, expires_at=now + 30)
+    store.set("b", 3, expires_at=now + 20)
+
+    assert store.evict_expired(now=now + 25) == 1
+    assert store.get("a", now=now + 25) == 2
+    assert not store.contains("b", now=now + 25)
+
+
+def test_delete():
+    store = ExpiringStore()
+    store.set("a", None, expires_at=time.time() + 10)
+
+    assert store.delete("a")
+    assert not store.delete("a")
+
+
+def test_store_without_live_eviction_rejects_new_keys_when_full():
+    now = time.time()
+    store = ExpiringStore(max_entries=2, evict_live=False)
+    assert store.set("a", 1, expires_at=now + 10)
+    assert store.set("b", 2, expires_at=now + 20)
+
+    assert not store.set("c", 3, expires_at=now + 30)
+    # 기존 키 갱신은 허용
+    assert store.set("a", 4, expires_at=now + 40)
+
+    assert store.contains("a") and store.contains("b") and not store.contains("c")
+    assert store.stats()["rejected"] == 1
+    assert store.capacity_evictions == 0
+
+
+def test_store_without_live_eviction_reuses_expired_slots():
+    now = time.time()
+    store = ExpiringStore(max_entries=2, evict_live=False)
+    store.set("a", 1, expires_at=now + 10)
+    store.set("b", 2, expires_at=now + 20)
+    # 이미 만료된 항목 (set 시점의 정리 대상)
+    store._entries["a"] = (1, now - 1)
+    store._expiry_heap = [(now - 1, "a"), (now + 20, "b")]
+
+    assert store.set("c", 3, expires_at=now + 30)
+    assert store.contains("b") and store.contains("c")
@@ -0,0 +1,46 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.shared.api.exceptions import APIException
+from app.shared.infrastructure.hash_executor import PasswordHashExecutor
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_keeps_slot_until_worker_finishes():
+    executor = PasswordHashExecutor("thread", max_workers=1, queue_limit=0)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+        return "hash"
+
+    task = asyncio.create_task(executor.run(slow_hash))
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # 워커가 아직 해싱 중이므로 슬롯은 반납되지 않았다
+    assert executor.stats()["in_flight"] == 1
+    with pytest.raises(APIException):
+        await executor.run(lambda: "other")
+
+    release.set()
+    await executor.shutdown()
+    assert executor.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_records_failure():
+    executor = PasswordHashExecutor("thread", max_workers=2, queue_limit=2)
+
+    assert await executor.run(str.upper, "abc") == "ABC"
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(lambda: 1 / 0)
+
+    stats = executor.stats()
+    assert (stats["completed"], stats["failed"], stats["in_flight"]) == (1, 1, 0)
+    await executor.shutdown()
@@ -0,0 +1,21 @@
+import pytest
+
+from app.shared.api import internal_routers
+from app.shared.api.exceptions import APIException
+
+
+def test_rejects_all_requests_when_no_token_is_configured(monkeypatch):
+    monkeypatch.setattr(internal_routers, "INTERNAL_API_TOKEN", None)
+
+    with pytest.raises(APIException):
+        internal_routers.verify_internal_token(None)
+    with pytest.raises(APIException):
+        internal_routers.verify_internal_token("anything")
+
+
+def test_requires_matching_token(monkeypatch):
+    monkeypatch.setattr(internal_routers, "INTERNAL_API_TOKEN", "secret")
+
+    internal_routers.verify_internal_token("secret")
+    with pytest.raises(APIException):
+        internal_routers.verify_internal_token("wrong")
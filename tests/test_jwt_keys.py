@@ -0,0 +1,146 @@
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth.api.routers import auth_router
+from app.auth.core.domain.services.token_service import TokenService
+from app.auth.dependencies import get_token_service
+from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+from app.shared.infrastructure import security
+from app.shared.infrastructure.jwt_keys import JWTKeyRing, generate_private_key
+
+
+def _write_private_key(keys_dir, kid: str, algorithm: str = "EdDSA"):
+    private_key = generate_private_key(algorithm)
+    (keys_dir / f"{kid}.pem").write_bytes(private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ))
+    return private_key
+
+
+def _retire_key(keys_dir, kid: str):
+    """
+    개인키를 공개키로 바꿔 검증 전용으로 남긴다 (키 교체 후 이전 키 보관)
+    """
+    private_path = keys_dir / f"{kid}.pem"
+    private_key = serialization.load_pem_private_key(private_path.read_bytes(), password=None)
+    (keys_dir / f"{kid}.pub.pem").write_bytes(private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    ))
+    private_path.unlink()
+
+
+@pytest.fixture
+def use_key_ring(monkeypatch):
+    def use(key_ring: JWTKeyRing) -> security.JWTManager:
+        monkeypatch.setattr(security, "JWT_ALGORITHM", key_ring.algorithm)
+        monkeypatch.setattr(security, "get_key_ring", lambda: key_ring)
+        return security.JWTManager()
+
+    return use
+
+
+def test_active_kid_defaults_to_last_signable_key(tmp_path):
+    _write_private_key(tmp_path, "2026-01")
+    _write_private_key(tmp_path, "2026-07")
+    _write_private_key(tmp_path, "2027-01")
+    _retire_key(tmp_path, "2027-01")
+
+    key_ring = JWTKeyRing.from_directory(str(tmp_path), "EdDSA")
+
+    assert key_ring.active_kid == "2026-07"
+    assert key_ring.get("2027-01") is not None and not key_ring.get("2027-01").can_sign
+    assert key_ring.get("unknown") is None
+    assert key_ring.get(None) is None
+
+
+def test_key_ring_requires_a_private_key(tmp_path):
+    _write_private_key(tmp_path, "old")
+    _retire_key(tmp_path, "old")
+
+    with pytest.raises(ValueError):
+        JWTKeyRing.from_directory(str(tmp_path), "EdDSA")
+    with pytest.raises(ValueError):
+        JWTKeyRing.from_directory(str(tmp_path / "missing"), "EdDSA")
+
+
+def test_keys_of_other_algorithm_are_ignored(tmp_path):
+    _write_private_key(tmp_path, "ed")
+    _write_private_key(tmp_path, "ec", algorithm="ES256")
+
+    key_ring = JWTKeyRing.from_directory(str(tmp_path), "EdDSA")
+
+    assert key_ring.get("ec") is None
+    assert key_ring.active_kid == "ed"
+
+
+def test_tokens_signed_before_rotation_still_verify(tmp_path, use_key_ring):
+    _write_private_key(tmp_path, "2026-01")
+    old_manager = use_key_ring(JWTKeyRing.from_directory(str(tmp_path), "EdDSA"))
+    old_token = old_manager.create_token(1, "user@example.com")
+
+    # 새 키로 교체하고 이전 키는 공개키만 남긴다
+    _retire_key(tmp_path, "2026-01")
+    _write_private_key(tmp_path, "2026-07")
+    manager = use_key_ring(JWTKeyRing.from_directory(str(tmp_path), "EdDSA", active_kid="2026-07"))
+    new_token = manager.create_token(1, "user@example.com")
+
+    assert jwt.get_unverified_header(manager.parse_token(old_token))["kid"] == "2026-01"
+    assert jwt.get_unverified_header(manager.parse_token(new_token))["kid"] == "2026-07"
+    assert manager.verify_token(old_token)["user_id"] == 1
+    assert manager.verify_token(new_token)["user_id"] == 1
+
+
+def test_token_with_unknown_kid_is_rejected(tmp_path, use_key_ring):
+    _write_private_key(tmp_path, "removed")
+    other_manager = use_key_ring(JWTKeyRing.from_directory(str(tmp_path), "EdDSA"))
+    token = other_manager.create_token(1, "user@example.com")
+
+    (tmp_path / "removed.pem").unlink()
+    _write_private_key(tmp_path, "current")
+    manager = use_key_ring(JWTKeyRing.from_directory(str(tmp_path), "EdDSA"))
+
+    with pytest.raises(APIException) as exc_info:
+        manager.verify_token(token)
+    assert exc_info.value.code == APIResponseCode.AUTH_TOKEN_INVALID
+
+
+def test_jwks_endpoint_publishes_public_keys(tmp_path, use_key_ring):
+    _write_private_key(tmp_path, "2026-01")
+    _retire_key(tmp_path, "2026-01")
+    _write_private_key(tmp_path, "2026-07")
+    manager = use_key_ring(JWTKeyRing.from_directory(str(tmp_path), "EdDSA"))
+
+    token_service = TokenService(MemoryTokenRepository())
+    token_service.jwt_manager = manager
+    app = FastAPI()
+    app.include_router(auth_router, prefix="/api/auth/v1")
+    app.dependency_overrides[get_token_service] = lambda: token_service
+
+    response = TestClient(app).get("/api/auth/v1/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "public, max-age=300"
+    keys = response.json()["keys"]
+    assert sorted(key["kid"] for key in keys) == ["2026-01", "2026-07"]
+    for key in keys:
+        assert key["kty"] == "OKP" and key["crv"] == "Ed25519"
+        assert key["alg"] == "EdDSA" and key["use"] == "sig"
+        assert "x" in key and "d" not in key
+
+    # 공개된 JWK만으로 토큰을 검증할 수 있어야 한다
+    token = manager.parse_token(manager.create_token(1, "user@example.com"))
+    [active_jwk] = [key for key in keys if key["kid"] == "2026-07"]
+    public_key = jwt.PyJWK(active_jwk).key
+    assert jwt.decode(token, public_key, algorithms=["EdDSA"])["user_id"] == 1
+
+
+def test_hs256_has_empty_jwks():
+    assert security.JWTManager().jwks() == {"keys": []}
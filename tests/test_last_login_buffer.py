@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.users.infrastructure.last_login_buffer import LastLoginBuffer
+
+T0 = datetime(2026, 1, 1, 9, 0, 0)
+
+
+class FlakyLastLoginBuffer(LastLoginBuffer):
+    """
+    DB 대신 write 호출을 기록하고, fail_next만큼 실패하는 버퍼
+    """
+
+    def __init__(self, fail_next: int = 0):
+        super().__init__(db_engine=None, enabled=False, flush_seconds=60, batch_size=100, max_pending=1000)
+        self.fail_next = fail_next
+        self.written = []
+
+    async def write(self, rows):
+        rows = dict(rows)
+        if self.fail_next:
+            self.fail_next -= 1
+            raise ConnectionError("db down")
+        self.written.append(rows)
+        return len(rows)
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_latest_value_per_user():
+    buffer = FlakyLastLoginBuffer()
+    buffer.record(1, T0)
+    buffer.record(1, T0 + timedelta(seconds=5))
+    buffer.record(1, T0 + timedelta(seconds=1))
+    buffer.record(2, T0)
+
+    assert await buffer.flush() == 2
+    assert buffer.written == [{1: T0 + timedelta(seconds=5), 2: T0}]
+    assert buffer.pending == 0
+    assert buffer.stats()["coalesced"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_rows_for_retry():
+    buffer = FlakyLastLoginBuffer(fail_next=1)
+    buffer.record(1, T0)
+    buffer.record(2, T0)
+
+    assert await buffer.flush() == 0
+    assert buffer.pending == 2
+    assert buffer.failures == 1
+
+    assert await buffer.flush() == 2
+    assert buffer.written == [{1: T0, 2: T0}]
+    assert buffer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_does_not_overwrite_newer_login():
+    buffer = FlakyLastLoginBuffer(fail_next=1)
+    buffer.record(1, T0 + timedelta(seconds=10))
+    buffer.record(2, T0 + timedelta(seconds=10))
+
+    # 반영 중에 새로 기록된 값 (1번은 더 최신, 2번은 더 오래된 값)
+    original_write = buffer.write
+
+    async def write_while_recording(rows):
+        rows = dict(rows)
+        buffer.record(1, T0 + timedelta(seconds=20))
+        buffer.record(2, T0)
+        return await original_write(rows)
+
+    buffer.write = write_while_recording
+    assert await buffer.flush() == 0
+
+    buffer.write = original_write
+    assert await buffer.flush() == 2
+    assert buffer.written == [{1: T0 + timedelta(seconds=20), 2: T0 + timedelta(seconds=10)}]
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_remaining_rows():
+    buffer = FlakyLastLoginBuffer()
+    buffer.record(1, T0)
+
+    await buffer.stop()
+
+    assert buffer.written == [{1: T0}]
+
+
+@pytest.mark.asyncio
+async def test_stop_during_write_keeps_the_batch():
+    buffer = FlakyLastLoginBuffer()
+    buffer.enabled = True
+    buffer.flush_seconds = 0
+    write_started = asyncio.Event()
+    original_write = buffer.write
+
+    async def blocking_write(rows):
+        rows = dict(rows)
+        write_started.set()
+        await asyncio.Event().wait()
+        return await original_write(rows)
+
+    buffer.write = blocking_write
+    buffer.record(1, T0)
+    await buffer.start()
+    await write_started.wait()
+
+    # 주기 반영이 write 중일 때 종료 -> 취소된 배치가 버려지지 않고 마지막 반영에서 쓰인다
+    buffer.write = original_write
+    await buffer.stop()
+
+    assert buffer.written == [{1: T0}]
+    assert buffer.pending == 0
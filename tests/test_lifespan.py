@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI
+
+from app.auth.infrastructure.repository.redis_token_repository import RedisTokenRepository
+from app.config import container as container_module
+from app.shared.api.exceptions import APIException
+from app.shared.api.responses import APIResponseCode
+from app.shared.core import lifespan as lifespan_module
+from app.shared.core.container import Container
+from app.shared.infrastructure.redis_client import RedisClientManager
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def record(name, error=None, result=None):
+        async def step():
+            calls.append(name)
+            if error is not None:
+                raise error
+            return result
+
+        monkeypatch.setattr(lifespan_module, name, step)
+
+    record("init_database", error=ConnectionError("db down"))
+    record("check_database_health", result=False)
+    record("init_resources")
+    record("cleanup_resources")
+    record("cleanup_database")
+    monkeypatch.setattr(lifespan_module, "wire_container", lambda container: None)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_resources_are_initialized_even_if_database_init_fails(calls):
+    async with lifespan_module.lifespan(FastAPI()):
+        assert calls == ["init_database", "init_resources"]
+
+    assert calls[-2:] == ["cleanup_resources", "cleanup_database"]
+
+
+def test_redis_token_repository_is_unavailable_until_pool_starts(monkeypatch):
+    manager = RedisClientManager("redis://localhost:6379")
+    monkeypatch.setattr(container_module, "TOKEN_STORAGE", "redis")
+    monkeypatch.setattr(container_module, "redis_client_manager", manager)
+    container = Container()
+    container_module.wire_container(container)
+
+    with pytest.raises(APIException) as exc_info:
+        container.resolve(container_module.TokenRepositoryPort)
+    assert exc_info.value.code == APIResponseCode.COMMON_SERVICE_UNAVAILABLE
+    assert exc_info.value.http_status == 503
+
+
+@pytest.mark.asyncio
+async def test_redis_token_repository_is_built_once_pool_starts(monkeypatch):
+    manager = RedisClientManager("redis://localhost:6379")
+    monkeypatch.setattr(container_module, "TOKEN_STORAGE", "redis")
+    monkeypatch.setattr(container_module, "redis_client_manager", manager)
+    container = Container()
+    container_module.wire_container(container)
+
+    # 풀 생성은 연결을 맺지 않으므로 Redis 서버 없이도 가능
+    await manager.start()
+    try:
+        assert isinstance(container.resolve(container_module.TokenRepositoryPort), RedisTokenRepository)
+    finally:
+        await manager.close()
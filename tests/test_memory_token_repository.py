@@ -0,0 +1,76 @@
+import pytest
+
+from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
+from app.shared.infrastructure.security import JWTManager
+
+
+@pytest.fixture
+def repository():
+    return MemoryTokenRepository()
+
+
+@pytest.fixture
+def jwt_manager(repository):
+    return JWTManager(repository)
+
+
+@pytest.mark.asyncio
+async def test_blacklist_round_trip_without_user_id(jwt_manager, repository):
+    token = jwt_manager.create_token(1, "user@example.com")
+    other_token = jwt_manager.create_token(2, "other@example.com")
+
+    assert await jwt_manager.blacklist_token(token)
+
+    assert await repository.is_blacklisted(token)
+    assert await jwt_manager.is_token_blacklisted(token)
+    assert not await repository.is_blacklisted(other_token)
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_digest_round_trip(jwt_manager, repository):
+    refresh_token = jwt_manager.create_refresh_token(1, "user@example.com")
+
+    assert await repository.store_user_refresh_token(1, refresh_token)
+    assert await repository.is_user_refresh_token(1, refresh_token)
+    assert not await repository.is_user_refresh_token(1, jwt_manager.create_refresh_token(1, "user@example.com"))
+
+    assert await repository.revoke_user_refresh_token(1)
+    assert not await repository.is_user_refresh_token(1, refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_blacklist_many_round_trip(jwt_manager, repository):
+    tokens = [jwt_manager.create_token(user_id, f"user{user_id}@example.com") for user_id in (1, 2)]
+    other_token = jwt_manager.create_token(3, "user3@example.com")
+
+    assert await repository.blacklist_many(tokens) == 2
+
+    assert await repository.is_blacklisted_many(tokens + [other_token]) == [True, True, False]
+    assert await repository.is_blacklisted(tokens[0])
+
+
+@pytest.mark.asyncio
+async def test_full_blacklist_keeps_revoked_tokens_and_rejects_new_ones():
+    repository = MemoryTokenRepository(max_entries=2)
+    jwt_manager = JWTManager(repository)
+    tokens = [jwt_manager.create_token(user_id, f"user{user_id}@example.com") for user_id in range(4)]
+
+    assert await repository.blacklist_token(tokens[0])
+    assert await repository.blacklist_many(tokens[1:]) == 1
+    assert not await repository.blacklist_token(tokens[3])
+
+    # 이미 폐기된 토큰은 용량 초과로 다시 유효해지지 않는다
+    assert await repository.is_blacklisted_many(tokens) == [True, True, False, False]
+
+
+@pytest.mark.asyncio
+async def test_full_refresh_store_evicts_soonest_expiring():
+    repository = MemoryTokenRepository(max_entries=2)
+
+    await repository.store_user_refresh_token(1, "token-1", ttl_seconds=10)
+    await repository.store_user_refresh_token(2, "token-2", ttl_seconds=20)
+    await repository.store_user_refresh_token(3, "token-3", ttl_seconds=30)
+
+    assert not await repository.is_user_refresh_token(1, "token-1")
+    assert await repository.is_user_refresh_token(2, "token-2")
+    assert await repository.is_user_refresh_token(3, "token-3")
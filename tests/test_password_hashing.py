@@ -0,0 +1,123 @@
+import pytest
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+
+from app.shared.infrastructure import password_hashing
+from app.shared.infrastructure.password_hashing import (
+    ARGON2_MAX_TIME_COST,
+    ARGON2_MIN_MEMORY_COST,
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    PasswordHashParams,
+    build_password_hash,
+    calibrate,
+)
+
+# 테스트 속도를 위해 비용을 최소로 낮춘 설정
+FAST_BCRYPT = PasswordHashParams(algorithm="bcrypt", bcrypt_rounds=4)
+FAST_ARGON2 = PasswordHashParams(
+    algorithm="argon2id", argon2_time_cost=1, argon2_memory_cost=1024, argon2_parallelism=1
+)
+
+
+@pytest.fixture
+def fixed_timing(monkeypatch):
+    """
+    _measure_seconds가 항상 seconds를 돌려주도록 고정 (호스트 속도와 무관하게 보정 결과 검증)
+    """
+    def set_seconds(seconds: float):
+        monkeypatch.setattr(password_hashing, "_measure_seconds", lambda func, samples: seconds)
+
+    return set_seconds
+
+
+def test_bcrypt_is_primary_and_argon2_still_verifies():
+    context = build_password_hash(FAST_BCRYPT)
+
+    assert isinstance(context.hashers[0], BcryptHasher)
+    assert context.hash("secret").startswith("$2b$04$")
+    assert context.verify("secret", build_password_hash(FAST_ARGON2).hash("secret"))
+
+
+def test_argon2id_is_primary_when_selected():
+    context = build_password_hash(FAST_ARGON2)
+
+    assert isinstance(context.hashers[0], Argon2Hasher)
+    assert context.hash("secret").startswith("$argon2id$")
+
+
+def test_unknown_algorithm_falls_back_to_bcrypt():
+    context = build_password_hash(PasswordHashParams(algorithm="md5", bcrypt_rounds=4))
+
+    assert isinstance(context.hashers[0], BcryptHasher)
+
+
+def test_verify_and_update_rehashes_when_cost_changes():
+    old_hash = build_password_hash(FAST_BCRYPT).hash("secret")
+    context = build_password_hash(PasswordHashParams(algorithm="bcrypt", bcrypt_rounds=5))
+
+    is_valid, updated_hash = context.verify_and_update("secret", old_hash)
+
+    assert is_valid
+    assert updated_hash.startswith("$2b$05$")
+    assert context.verify_and_update("secret", updated_hash) == (True, None)
+
+
+def test_verify_and_update_migrates_bcrypt_to_argon2():
+    old_hash = build_password_hash(FAST_BCRYPT).hash("secret")
+    context = build_password_hash(FAST_ARGON2)
+
+    is_valid, updated_hash = context.verify_and_update("secret", old_hash)
+
+    assert is_valid
+    assert updated_hash.startswith("$argon2id$")
+
+
+def test_verify_and_update_does_not_rehash_wrong_password():
+    old_hash = build_password_hash(FAST_BCRYPT).hash("secret")
+    context = build_password_hash(FAST_ARGON2)
+
+    assert context.verify_and_update("wrong", old_hash) == (False, None)
+
+
+@pytest.mark.parametrize("base_ms, target_ms, expected_rounds", [
+    (50, 250, 12),  # 10: 50ms, 11: 100ms, 12: 200ms, 13: 400ms
+    (50, 200, 12),  # 목표와 같으면 포함
+    (300, 250, BCRYPT_MIN_ROUNDS),  # 최소 라운드도 목표를 넘으면 하한선 유지
+    (0.001, 250, BCRYPT_MAX_ROUNDS),  # 아무리 빨라도 상한선까지만
+])
+def test_calibrate_bcrypt_rounds(fixed_timing, base_ms, target_ms, expected_rounds):
+    fixed_timing(base_ms / 1000)
+
+    calibrated = calibrate(FAST_BCRYPT, target_ms)
+
+    assert calibrated.bcrypt_rounds == expected_rounds
+    assert calibrated.algorithm == "bcrypt"
+
+
+@pytest.mark.parametrize("base_ms, expected_time_cost", [
+    (60, 4),  # 250 / 60 = 4.1
+    (400, 1),  # 목표보다 느려도 최소 1
+    (1, ARGON2_MAX_TIME_COST),
+])
+def test_calibrate_argon2_time_cost(fixed_timing, base_ms, expected_time_cost):
+    fixed_timing(base_ms / 1000)
+
+    calibrated = calibrate(FAST_ARGON2, 250)
+
+    assert calibrated.argon2_time_cost == expected_time_cost
+    # 메모리 비용은 보안 하한선 아래로 내려가지 않는다
+    assert calibrated.argon2_memory_cost == ARGON2_MIN_MEMORY_COST
+    assert calibrated.argon2_parallelism == FAST_ARGON2.argon2_parallelism
+
+
+def test_params_round_trip_through_env():
+    params = PasswordHashParams(algorithm="argon2id", argon2_time_cost=2, argon2_memory_cost=32768)
+
+    assert params.to_env() == {
+        "PASSWORD_HASH_ALGORITHM": "argon2id",
+        "PASSWORD_HASH_BCRYPT_ROUNDS": "12",
+        "PASSWORD_HASH_ARGON2_TIME_COST": "2",
+        "PASSWORD_HASH_ARGON2_MEMORY_COST": "32768",
+        "PASSWORD_HASH_ARGON2_PARALLELISM": "4",
+    }
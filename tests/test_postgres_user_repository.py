@@ -0,0 +1,31 @@
+import pytest
+
+from app.users.infrastructure.repository.postgres_user_repository import PostgresUserRepository
+
+
+class FakeSession:
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append(params)
+
+
+class FakeUnitOfWork:
+    def __init__(self):
+        self.written_keys = []
+
+    def mark_written(self, sticky_key):
+        self.written_keys.append(sticky_key)
+
+
+@pytest.mark.asyncio
+async def test_password_rehash_makes_email_lookup_sticky():
+    unit_of_work = FakeUnitOfWork()
+    repository = PostgresUserRepository(unit_of_work, email_loader=None)
+
+    await repository.update_password_hash(FakeSession(), 7, "user@example.com", "new-hash")
+
+    # find_by_email은 이메일 키로 primary 고정 여부를 판단한다
+    assert "user:email:user@example.com" in unit_of_work.written_keys
+    assert "user:id:7" in unit_of_work.written_keys
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from app.auth.infrastructure.repository.redis_token_repository import (
+    LEGACY_BLACKLIST_KEY_PREFIX,
+    RedisTokenRepository,
+)
+from app.shared.infrastructure.security import JWTManager
+from app.shared.infrastructure.token_codec import strip_bearer, token_digest, unverified_claims
+from tests.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def redis_client():
+    return FakeRedis()
+
+
+@pytest.fixture
+def repository(redis_client):
+    return RedisTokenRepository(redis_client, token_filter=None, cleanup_batch_size=2, batch_size=2)
+
+
+@pytest.fixture
+def jwt_manager():
+    return JWTManager()
+
+
+def _jti(token: str) -> str:
+    return unverified_claims(token)["jti"]
+
+
+@pytest.mark.asyncio
+async def test_blacklist_is_keyed_by_jti_with_token_ttl(repository, redis_client, jwt_manager):
+    token = jwt_manager.create_token(1, "user@example.com")
+
+    assert await repository.blacklist_token(token, user_id=1)
+
+    key = f"{repository.blacklist_key_prefix}{_jti(token)}"
+    assert await redis_client.get(key) == "1"
+    assert 0 < await redis_client.ttl(key) <= unverified_claims(token)["exp"] - unverified_claims(token)["iat"]
+    # 토큰 원문은 어디에도 저장하지 않는다
+    assert not any(strip_bearer(token) in key for key in redis_client._data)
+    assert await repository.is_blacklisted(token)
+    assert not await repository.is_blacklisted(jwt_manager.create_token(1, "user@example.com"))
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_stored_as_digest(repository, redis_client, jwt_manager):
+    refresh_token = jwt_manager.create_refresh_token(1, "user@example.com")
+
+    assert await repository.store_user_refresh_token(1, refresh_token, ttl_seconds=60)
+
+    assert await redis_client.get("refresh_user:1") == token_digest(strip_bearer(refresh_token)).hex()
+    assert await repository.is_user_refresh_token(1, refresh_token)
+    assert await repository.is_user_refresh_token(1, strip_bearer(refresh_token))
+    assert not await repository.is_user_refresh_token(1, jwt_manager.create_refresh_token(1, "user@example.com"))
+    assert not await repository.is_user_refresh_token(2, refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_migrate_legacy_keys(repository, redis_client, jwt_manager):
+    revoked_token = jwt_manager.create_token(5, "user@example.com")
+    refresh_token = jwt_manager.create_refresh_token(6, "user@example.com")
+    legacy_key = f"{LEGACY_BLACKLIST_KEY_PREFIX}{revoked_token}"
+    await redis_client.psetex(legacy_key, 60_000, json.dumps({"user_id": 5}))
+    # 만료 시간이 없는 이전 키는 옮기지 않고 삭제만 한다
+    await redis_client.set(f"{LEGACY_BLACKLIST_KEY_PREFIX}no-ttl", "1")
+    await redis_client.psetex("refresh_user:6", 60_000, refresh_token)
+    await redis_client.psetex("refresh_user:7", 60_000, "0" * 32)
+
+    assert await repository.migrate_legacy_keys(batch_size=1) == 3
+
+    new_key = f"{repository.blacklist_key_prefix}{_jti(revoked_token)}"
+    assert await redis_client.get(new_key) == "5"
+    assert 0 < await redis_client.pttl(new_key) <= 60_000
+    assert redis_client.published == [(repository.blacklist_channel, _jti(revoked_token))]
+    assert await redis_client.exists(legacy_key, f"{LEGACY_BLACKLIST_KEY_PREFIX}no-ttl") == 0
+    assert await repository.is_blacklisted(revoked_token)
+
+    assert await redis_client.get("refresh_user:6") == token_digest(strip_bearer(refresh_token)).hex()
+    assert 0 < await redis_client.pttl("refresh_user:6") <= 60_000
+    assert await repository.is_user_refresh_token(6, refresh_token)
+    assert await redis_client.get("refresh_user:7") == "0" * 32
+
+    # 다시 실행해도 바뀌는 키가 없다
+    assert await repository.migrate_legacy_keys() == 0
+
+
+@pytest.mark.asyncio
+async def test_cleanup_unlinks_only_keys_without_ttl(repository, redis_client):
+    for i in range(5):
+        await redis_client.set(f"{repository.blacklist_key_prefix}stale-{i}", "1")
+        await redis_client.setex(f"{repository.blacklist_key_prefix}live-{i}", 60, "1")
+    await redis_client.set("refresh_user:1", "digest")
+    redis_client.commands.clear()
+
+    assert await repository.cleanup_expired_tokens() == 5
+
+    remaining = sorted(redis_client._data)
+    assert remaining == sorted([f"{repository.blacklist_key_prefix}live-{i}" for i in range(5)] + ["refresh_user:1"])
+    stats = repository.last_cleanup_stats[f"{repository.blacklist_key_prefix}*"]
+    assert (stats.scanned, stats.cleaned, stats.batches, stats.completed) == (10, 5, 5, True)
+    # 배치(SCAN 1회)마다 TTL은 파이프라인 한 번, UNLINK는 한 번으로 처리
+    assert redis_client.commands.count("scan") == 5
+    assert redis_client.commands.count("execute") == 5
+    assert "keys" not in redis_client.commands
+
+
+@pytest.mark.asyncio
+async def test_cleanup_resumes_from_cursor_after_time_budget(redis_client):
+    repository = RedisTokenRepository(redis_client, token_filter=None, cleanup_batch_size=2, cleanup_time_budget=0)
+    for i in range(5):
+        await redis_client.set(f"refresh_user:{i}", "digest")
+
+    # 예산이 0이면 실행마다 한 배치만 처리하고 커서를 저장한다
+    cleaned = [await repository.cleanup_expired_refresh_tokens() for _ in range(3)]
+
+    stats = repository.last_cleanup_stats["refresh_user:*"]
+    assert stats.completed
+    assert sum(cleaned) == 5
+    assert repository._cleanup_cursors["refresh_user:*"] == 0
+    assert not redis_client._data
+
+
+@pytest.mark.asyncio
+async def test_blacklist_many_round_trip(repository, redis_client, jwt_manager):
+    tokens = [jwt_manager.create_token(user_id, "user@example.com") for user_id in range(5)]
+    expired_token = jwt_manager._sign({"user_id": 9, "exp": 1, "jti": "expired"})
+    redis_client.commands.clear()
+
+    assert await repository.blacklist_many(tokens[:3] + [expired_token], user_id=1) == 3
+
+    # batch_size=2 -> 파이프라인 2번 (이미 만료된 토큰은 저장하지 않음)
+    assert redis_client.commands.count("execute") == 2
+    assert [message for _, message in redis_client.published] == [_jti(token) for token in tokens[:3]]
+    assert await redis_client.get(f"{repository.blacklist_key_prefix}expired") is None
+
+    redis_client.commands.clear()
+    assert await repository.is_blacklisted_many(tokens) == [True, True, True, False, False]
+    # 5개 -> MGET 3번, 개별 EXISTS 없음
+    assert redis_client.commands.count("mget") == 3
+    assert "exists" not in redis_client.commands
+
+
+@pytest.mark.asyncio
+async def test_is_blacklisted_many_of_empty_input(repository, redis_client):
+    assert await repository.is_blacklisted_many([]) == []
+    assert "mget" not in redis_client.commands
+
+
+@pytest.mark.asyncio
+async def test_revoke_refresh_tokens_for_users(repository, redis_client, jwt_manager):
+    for user_id in range(3):
+        await repository.store_user_refresh_token(user_id, jwt_manager.create_refresh_token(user_id, None), 60)
+
+    assert await repository.revoke_refresh_tokens_for_users([0, 1, 5]) == 2
+    assert await redis_client.exists("refresh_user:0", "refresh_user:1") == 0
+    assert await redis_client.exists("refresh_user:2") == 1
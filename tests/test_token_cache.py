@@ -0,0 +1,48 @@
+import time
+
+from app.shared.infrastructure.token_cache import VerifiedTokenCache
+
+
+def _payload(**claims):
+    return {"user_id": 1, "roles": ["User"], "exp": int(time.time()) + 60, **claims}
+
+
+def test_callers_cannot_modify_cached_payload():
+    cache = VerifiedTokenCache(max_size=10, enabled=True)
+    payload = _payload()
+    cache.put("token", payload)
+
+    # 저장 후 원본을 수정해도, 조회한 값을 수정해도 다음 조회에는 영향이 없다
+    payload["roles"].append("Admin")
+    first = cache.get("token")
+    first["roles"].append("Admin")
+    first["user_id"] = 2
+
+    assert cache.get("token") == {"user_id": 1, "roles": ["User"], "exp": payload["exp"]}
+
+
+def test_expired_payload_is_not_returned():
+    cache = VerifiedTokenCache(max_size=10, enabled=True)
+    cache.put("token", _payload(exp=int(time.time()) - 1))
+
+    assert cache.get("token") is None
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = VerifiedTokenCache(max_size=2, enabled=True)
+    cache.put("a", _payload())
+    cache.put("b", _payload())
+    cache.get("a")
+    cache.put("c", _payload())
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_invalidate_removes_entry():
+    cache = VerifiedTokenCache(max_size=10, enabled=True)
+    cache.put("token", _payload())
+    cache.invalidate("token")
+
+    assert cache.get("token") is None
@@ -0,0 +1,100 @@
+import time
+from datetime import datetime, timedelta, timezone
+
+import jwt
+import pytest
+
+from app.shared.infrastructure.token_codec import (
+    CompactTokenCodec,
+    expand_claims,
+    strip_bearer,
+    token_digest,
+    token_remaining_seconds,
+    token_revocation_id,
+    unverified_claims,
+)
+
+SECRET = b"test-secret-key-for-compact-codec"
+
+
+@pytest.fixture
+def codec():
+    return CompactTokenCodec(SECRET, "HS256", include_email=True)
+
+
+def test_compact_token_round_trip(codec):
+    token = codec.encode(7, "user@example.com", ["User"], "access", ttl_seconds=60, now=1_700_000_000)
+
+    # 쿠키 크기를 줄이기 위해 "Bearer " 프리픽스 없이 발급된다
+    assert not token.startswith("Bearer ")
+    raw = jwt.decode(token, SECRET, algorithms=["HS256"], options={"verify_exp": False})
+    assert raw["uid"] == 7 and raw["typ"] == "a"
+
+    claims = expand_claims(raw)
+    assert claims["user_id"] == 7
+    assert claims["user_email"] == "user@example.com"
+    assert claims["roles"] == ["User"]
+    assert claims["token_type"] == "access"
+    assert claims["iat"] == 1_700_000_000
+    assert claims["exp"] == 1_700_000_060
+    assert isinstance(claims["jti"], str)
+
+
+def test_empty_claims_are_omitted_and_restored_on_expand():
+    codec = CompactTokenCodec(SECRET, "HS256", include_email=False)
+    token = codec.encode(7, "user@example.com", None, "refresh", ttl_seconds=60)
+
+    raw = jwt.decode(token, SECRET, algorithms=["HS256"])
+    assert "em" not in raw and "rl" not in raw
+
+    claims = expand_claims(raw)
+    assert claims["user_email"] is None
+    assert claims["roles"] == []
+    assert claims["token_type"] == "refresh"
+
+
+def test_standard_payload_is_not_expanded():
+    payload = {"user_id": 1, "token_type": "access"}
+
+    assert expand_claims(payload) is payload
+
+
+def test_only_hmac_algorithms_are_supported():
+    with pytest.raises(ValueError):
+        CompactTokenCodec(SECRET, "RS256")
+
+
+def test_bearer_prefix_does_not_change_identity(codec):
+    token = codec.encode(7, None, None, "access", ttl_seconds=60)
+
+    assert strip_bearer(f"Bearer {token}") == token
+    assert unverified_claims(f"Bearer {token}") == unverified_claims(token)
+    assert token_revocation_id(f"Bearer {token}") == token_revocation_id(token) == unverified_claims(token)["jti"]
+
+
+def test_revocation_id_falls_back_to_digest_without_jti():
+    token = jwt.encode({"user_id": 1}, SECRET, algorithm="HS256")
+
+    assert token_revocation_id(token) == token_digest(token).hex()
+
+
+def test_unverified_claims_of_malformed_token_is_empty():
+    assert unverified_claims("not-a-jwt") == {}
+    assert unverified_claims("a.!!!.c") == {}
+
+
+def test_remaining_seconds_prefers_explicit_expiry(codec):
+    token = codec.encode(7, None, None, "access", ttl_seconds=600)
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    assert 118 <= token_remaining_seconds(token, expires_at) <= 120
+    # timezone 없는 값은 UTC로 간주
+    assert 118 <= token_remaining_seconds(token, expires_at.replace(tzinfo=None)) <= 120
+    assert 598 <= token_remaining_seconds(token) <= 600
+    assert token_remaining_seconds("not-a-jwt", default_seconds=30) == 30
+
+
+def test_expired_token_has_no_remaining_seconds(codec):
+    token = codec.encode(7, None, None, "access", ttl_seconds=60, now=int(time.time()) - 120)
+
+    assert token_remaining_seconds(token) <= 0
@@ -0,0 +1,120 @@
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+
+from app.users.core.domain.user import User
+from app.users.infrastructure import user_cache as user_cache_module
+from app.users.infrastructure.user_cache import UserCache
+from tests.fake_redis import FakeRedis
+
+
+def make_user(email: str) -> User:
+    now = datetime(2026, 1, 1)
+    return User(id=1, email=email, password_hash="hash", name="name", is_active=True, created_at=now, updated_at=now)
+
+
+@pytest.fixture
+def cache():
+    return UserCache(enabled=True, l2_enabled=False)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load(cache):
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return make_user("user@example.com")
+
+    first, second = await asyncio.gather(
+        cache.get_by_email("user@example.com", loader),
+        cache.get_by_email("user@example.com", loader),
+    )
+
+    assert calls == 1
+    assert first == second and first is not second
+    assert cache.coalesced == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_waiters(cache):
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return make_user("user@example.com")
+
+    first = asyncio.create_task(cache.get_by_email("user@example.com", loader))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(cache.get_by_email("user@example.com", loader))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert (await second).email == "user@example.com"
+    # 공유 조회 결과는 캐시에도 저장된다
+    assert (await cache.get_by_email("user@example.com", loader)).email == "user@example.com"
+    assert cache.l1_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_load_failure_reaches_every_waiter_and_is_not_cached(cache):
+    async def failing_loader():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        cache.get_by_email("user@example.com", failing_loader),
+        cache.get_by_email("user@example.com", failing_loader),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["l1_size"] == 0
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(user_cache_module.redis_client_manager, "_client", client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_password_hash_is_not_cached(cache):
+    async def loader():
+        return make_user("user@example.com")
+
+    loaded = await cache.get_by_email("user@example.com", loader)
+    cached = await cache.get_by_email("user@example.com", loader)
+
+    assert loaded.password_hash == "" and cached.password_hash == ""
+    assert cached.id == 1 and cache.l1_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_l2_stores_one_key_without_password_hash(redis_client):
+    cache = UserCache(enabled=True, l1_max_size=0, l2_enabled=True)
+
+    async def loader():
+        return make_user("user@example.com")
+
+    await cache.get_by_email("user@example.com", loader)
+
+    [key] = redis_client._data
+    assert key == "user:cache:v2:email:user@example.com"
+    raw = await redis_client.get(key)
+    assert "hash" not in json.loads(raw)
+    assert redis_client.commands.count("set") == 1
+
+    user = await cache.get_by_email("user@example.com", loader)
+    assert cache.l2_hits == 1
+    assert (user.id, user.email, user.password_hash) == (1, "user@example.com", "")
@@ -0,0 +1,66 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from app.users.api.user_export import PROFILE_COLUMNS, USER_COLUMNS, encode_export
+from app.users.core.application.outputs import UserExportOutput
+
+CREATED_AT = datetime(2026, 1, 2, 3, 4, 5)
+
+
+def _output(user_id: int) -> UserExportOutput:
+    return UserExportOutput(
+        id=user_id,
+        email=f"user{user_id}@example.com",
+        name="홍길동",
+        is_active=True,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+        last_login=None,
+        bio="안녕하세요",
+    )
+
+
+async def _outputs(count: int):
+    for user_id in range(1, count + 1):
+        yield _output(user_id)
+
+
+async def _collect(export_format: str, include_profile: bool, count: int = 2, chunk_bytes: int = 1 << 20) -> str:
+    chunks = [chunk async for chunk in encode_export(_outputs(count), export_format, include_profile, chunk_bytes)]
+    return b"".join(chunks).decode()
+
+
+def test_columns_follow_export_output_fields():
+    assert USER_COLUMNS == ("id", "email", "name", "is_active", "created_at", "updated_at", "last_login")
+    assert PROFILE_COLUMNS == ("bio", "phone", "avatar_url")
+
+
+@pytest.mark.asyncio
+async def test_ndjson_without_profile():
+    lines = (await _collect("ndjson", include_profile=False)).splitlines()
+
+    assert len(lines) == 2
+    row = json.loads(lines[0])
+    assert tuple(row) == USER_COLUMNS
+    assert row["name"] == "홍길동"
+    assert row["created_at"] == CREATED_AT.isoformat()
+
+
+@pytest.mark.asyncio
+async def test_csv_with_profile_writes_header():
+    lines = (await _collect("csv", include_profile=True)).splitlines()
+
+    assert lines[0] == ",".join(USER_COLUMNS + PROFILE_COLUMNS)
+    assert lines[1].startswith("1,user1@example.com,")
+    assert lines[1].endswith(",안녕하세요,,")
+
+
+@pytest.mark.asyncio
+async def test_rows_are_grouped_into_chunks():
+    chunks = [chunk async for chunk in encode_export(_outputs(10), "ndjson", False, chunk_bytes=300)]
+
+    assert len(chunks) > 1
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    assert len(b"".join(chunks).splitlines()) == 10
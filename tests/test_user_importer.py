@@ -0,0 +1,104 @@
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+
+from app.shared.infrastructure.password_hashing import PasswordHashParams, build_password_hash
+from app.users.infrastructure.user_importer import ImportReport, ImportRow, UserImporter, read_records
+
+BCRYPT_HASH = build_password_hash(PasswordHashParams(algorithm="bcrypt", bcrypt_rounds=4)).hash("secret")
+
+
+def test_read_csv_drops_empty_values_and_keeps_line_numbers():
+    lines = [
+        "email,password,name,bio\n",
+        "a@example.com,password1,,\n",
+        "b@example.com,password2,B,hello\n",
+    ]
+
+    assert list(read_records(lines, "csv")) == [
+        (2, {"email": "a@example.com", "password": "password1"}, None),
+        (3, {"email": "b@example.com", "password": "password2", "name": "B", "bio": "hello"}, None),
+    ]
+
+
+def test_read_csv_ignores_extra_cells_without_header():
+    lines = ["email,password\n", "a@example.com,password1,unexpected\n"]
+
+    assert list(read_records(lines, "csv")) == [(2, {"email": "a@example.com", "password": "password1"}, None)]
+
+
+def test_read_ndjson_reports_malformed_lines_and_continues():
+    lines = [
+        '{"email": "a@example.com", "password": "password1", "name": ""}\n',
+        "\n",
+        '{"email": "b@example.com",\n',
+        '["not", "an", "object"]\n',
+        '{"email": "c@example.com", "password_hash": null}\n',
+    ]
+
+    records = list(read_records(lines, "ndjson"))
+
+    assert records[0] == (1, {"email": "a@example.com", "password": "password1"}, None)
+    line_no, record, error = records[1]
+    assert (line_no, record) == (3, None) and error.startswith("JSON 형식 오류")
+    assert records[2] == (4, None, "JSON 객체가 아닙니다")
+    assert records[3] == (5, {"email": "c@example.com"}, None)
+    assert len(records) == 4
+
+
+def test_read_records_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        list(read_records(["{}"], "xml"))
+
+
+def test_import_row_accepts_supported_hash_and_strips_whitespace():
+    row = ImportRow.model_validate({"email": " a@example.com ", "password_hash": BCRYPT_HASH, "unknown": "x"})
+
+    assert row.email == "a@example.com"
+    assert row.password is None and row.password_hash == BCRYPT_HASH
+
+
+@pytest.mark.parametrize("record", [
+    {"email": "a@example.com"},
+    {"email": "a@example.com", "password": "password1", "password_hash": BCRYPT_HASH},
+    {"email": "a@example.com", "password_hash": "plain-text"},
+    {"email": "a@example.com", "password": "short"},
+    {"email": "not-an-email", "password": "password1"},
+    {"email": "a@example.com", "password": "password1", "phone": "0" * 21},
+])
+def test_import_row_rejects_invalid_records(record):
+    with pytest.raises(ValidationError):
+        ImportRow.model_validate(record)
+
+
+@pytest.mark.asyncio
+async def test_prepare_batches_collects_errors_per_row():
+    lines = [
+        "email,password_hash,name\n",
+        f"a@example.com,{BCRYPT_HASH},\n",
+        "not-an-email,x,\n",
+        f"a@example.com,{BCRYPT_HASH},dup\n",
+        "c@example.com,,\n",
+        f"d@example.com,{BCRYPT_HASH},D\n",
+        f"e@example.com,{BCRYPT_HASH},E\n",
+    ]
+    importer = UserImporter(db_engine=None, batch_size=2, hash_concurrency=1)
+    batches = asyncio.Queue()
+    report = ImportReport()
+    errors = []
+
+    await importer._prepare_batches(lines, "csv", batches, report, errors.append)
+
+    loaded = []
+    while (records := batches.get_nowait()) is not None:
+        loaded.append([(line_no, email, name) for line_no, email, _, name, *_ in records])
+
+    # 잘못된 행은 건너뛰고 나머지는 batch_size씩 계속 적재된다
+    assert loaded == [[(2, "a@example.com", "a"), (6, "d@example.com", "D")], [(7, "e@example.com", "E")]]
+    assert report.processed == 6
+    assert [(error.line, error.email) for error in errors] == [
+        (3, "not-an-email"), (4, "a@example.com"), (5, "c@example.com")
+    ]
+    assert errors[1].reason == "파일 내 중복 이메일입니다"
+    assert "password와 password_hash 중 하나만" in errors[2].reason
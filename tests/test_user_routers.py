@@ -0,0 +1,77 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.auth.core.domain.services.token_service import TokenService
+from app.auth.dependencies import get_token_service
+from app.auth.infrastructure.repository.memory_token_repository import MemoryTokenRepository
+from app.shared.api import internal_routers
+from app.shared.api.exception_handler import api_exception_handler
+from app.shared.api.exceptions import APIException
+from app.users.api.routers import user_router
+from app.users.core.application.outputs import UserPageOutput
+from app.users.dependencies import get_read_only_user_service
+
+
+class FakeUserService:
+    async def list_users(self, limit, after=None, is_active=None):
+        return UserPageOutput(users=[], next_key=None, approximate_total=0)
+
+
+@pytest.fixture
+def token_service():
+    return TokenService(MemoryTokenRepository())
+
+
+@pytest.fixture(autouse=True)
+def internal_token(monkeypatch):
+    monkeypatch.setattr(internal_routers, "INTERNAL_API_TOKEN", "internal-secret")
+    return "internal-secret"
+
+
+@pytest.fixture
+def client(token_service):
+    app = FastAPI()
+    app.add_exception_handler(APIException, api_exception_handler)
+    app.include_router(user_router, prefix="/api/users/v1")
+
+    app.dependency_overrides[get_token_service] = lambda: token_service
+    app.dependency_overrides[get_read_only_user_service] = FakeUserService
+    return TestClient(app)
+
+
+def test_list_users_rejects_ordinary_access_token(client, token_service):
+    # 역할 모델이 없으므로 로그인한 사용자라도 전체 목록은 조회할 수 없다
+    token = token_service.jwt_manager.create_token(1, "user@example.com")
+
+    response = client.get("/api/users/v1", headers={"Authorization": token})
+
+    assert response.status_code == 403
+
+
+def test_list_users_accepts_internal_token(client, internal_token):
+    response = client.get("/api/users/v1", headers={"X-Internal-Token": internal_token})
+
+    assert response.status_code == 200
+
+
+def test_list_users_requires_token(client):
+    response = client.get("/api/users/v1")
+
+    assert response.status_code == 403
+
+
+def test_export_rejects_ordinary_access_token(client, token_service):
+    token = token_service.jwt_manager.create_token(1, "user@example.com")
+
+    response = client.get("/api/users/v1/export", headers={"Authorization": token})
+
+    assert response.status_code == 403
+
+
+def test_batch_get_rejects_ordinary_access_token(client, token_service):
+    token = token_service.jwt_manager.create_token(1, "user@example.com")
+
+    response = client.post("/api/users/v1:batchGet", json={"ids": [1, 2]}, headers={"Authorization": token})
+
+    assert response.status_code == 403
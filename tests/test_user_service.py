@@ -0,0 +1,91 @@
+import dataclasses
+
+import pytest
+
+from app.shared.infrastructure import security
+from app.shared.infrastructure.password_hashing import PasswordHashParams, build_password_hash
+from app.users.core.application.user_service import UserService
+from app.users.core.domain.user import User
+
+OLD_PARAMS = PasswordHashParams(algorithm="bcrypt", bcrypt_rounds=4)
+CURRENT_PARAMS = PasswordHashParams(algorithm="bcrypt", bcrypt_rounds=5)
+
+
+class FakeUserRepository:
+    def __init__(self, *users: User):
+        self.users = {user.email: user for user in users}
+        self.updated_hashes = []
+        self.logins = []
+
+    async def find_by_email(self, email):
+        return self.users.get(email)
+
+    async def find_password_hash(self, user_id):
+        return next((user.password_hash for user in self.users.values() if user.id == user_id), None)
+
+    async def update_password_hash(self, transaction_session, user_id, email, password_hash):
+        self.updated_hashes.append((user_id, email, password_hash))
+
+    async def record_login(self, user_id, logged_in_at):
+        self.logins.append((user_id, logged_in_at))
+
+
+@pytest.fixture(autouse=True)
+def current_password_hash(monkeypatch):
+    monkeypatch.setattr(security, "pwd_context", build_password_hash(CURRENT_PARAMS))
+
+
+def _user(is_active: bool = True) -> User:
+    return User(
+        id=1,
+        email="user@example.com",
+        password_hash=build_password_hash(OLD_PARAMS).hash("secret"),
+        name="user",
+        is_active=is_active,
+    )
+
+
+@pytest.mark.asyncio
+async def test_authenticate_rehashes_outdated_hash():
+    user = _user()
+    repository = FakeUserRepository(user)
+
+    output = await UserService(repository).authenticate(None, "user@example.com", "secret")
+
+    assert output.id == 1
+    [(user_id, email, new_hash)] = repository.updated_hashes
+    assert (user_id, email) == (1, "user@example.com")
+    assert new_hash.startswith("$2b$05$")
+    assert user.password_hash == new_hash
+    [(user_id, logged_in_at)] = repository.logins
+    assert user_id == 1 and output.last_login == logged_in_at
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("email, password, is_active", [
+    ("user@example.com", "wrong", True),
+    ("other@example.com", "secret", True),
+    ("user@example.com", "secret", False),
+])
+async def test_authenticate_rejects_without_rehash(email, password, is_active):
+    repository = FakeUserRepository(_user(is_active))
+
+    assert await UserService(repository).authenticate(None, email, password) is None
+    assert repository.updated_hashes == []
+    assert repository.logins == []
+
+
+@pytest.mark.asyncio
+async def test_authenticate_loads_hash_missing_from_cached_user():
+    stored = _user()
+
+    class CachedRepository(FakeUserRepository):
+        async def find_by_email(self, email):
+            user = self.users.get(email)
+            # 캐시 계층은 password_hash 없이 돌려준다
+            return dataclasses.replace(user, password_hash="") if user else None
+
+    repository = CachedRepository(stored)
+
+    assert (await UserService(repository).authenticate(None, "user@example.com", "secret")).id == 1
+    assert await UserService(repository).authenticate(None, "user@example.com", "wrong") is None